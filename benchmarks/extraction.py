@@ -0,0 +1,80 @@
+"""Throughput benchmark for HTML text extraction.
+
+Usage: python -m benchmarks.extraction [--rounds N] [--corpus DIR]
+"""
+import argparse
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+from bs4 import BeautifulSoup
+from src.tools.extraction import extract_text, normalize_whitespace
+
+CORPUS_DIR = Path(__file__).parent.parent / "tests" / "fixtures" / "pages"
+
+def legacy_extract(html: str) -> str:
+    """The original BeautifulSoup/html.parser multi-pass extraction."""
+    soup = BeautifulSoup(html, 'html.parser')
+    for script in soup(["script", "style", "nav", "menu", "footer", "header"]):
+        script.decompose()
+
+    content = ""
+    article = soup.find('article')
+    if article:
+        content = article.get_text()
+    if not content:
+        main = soup.find('main')
+        if main:
+            content = main.get_text()
+    if not content:
+        content_divs = soup.find_all('div', class_=lambda x: x and ('content' in x.lower() or 'article' in x.lower()))
+        if content_divs:
+            content = max(content_divs, key=lambda x: len(x.get_text())).get_text()
+        else:
+            for element in soup.find_all(['div', 'section']):
+                if element.get('class'):
+                    classes = ' '.join(element.get('class')).lower()
+                    if any(x in classes for x in ['nav', 'menu', 'footer', 'header', 'sidebar']):
+                        element.decompose()
+            content = soup.get_text()
+    return normalize_whitespace(content)
+
+ENGINES: Dict[str, Callable[[str], str]] = {
+    "bs4-html.parser": legacy_extract,
+    "lxml-single-pass": extract_text,
+}
+
+def load_corpus(corpus_dir: Path) -> List[str]:
+    return [path.read_text(encoding="utf-8") for path in sorted(corpus_dir.glob("*.html"))]
+
+def run_engine(engine: Callable[[str], str], pages: List[str], rounds: int) -> Dict[str, float]:
+    total_bytes = sum(len(page.encode("utf-8")) for page in pages) * rounds
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for page in pages:
+            engine(page)
+    elapsed = time.perf_counter() - started
+    return {
+        "seconds": elapsed,
+        "pages_per_s": len(pages) * rounds / elapsed,
+        "mb_per_s": total_bytes / elapsed / (1024 * 1024),
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--corpus", type=Path, default=CORPUS_DIR)
+    args = parser.parse_args()
+
+    pages = load_corpus(args.corpus)
+    mismatches = sum(legacy_extract(page) != extract_text(page) for page in pages)
+    print(f"Corpus: {len(pages)} pages, {sum(map(len, pages)) / 1024:.1f} KiB, parity mismatches: {mismatches}")
+
+    baseline = None
+    for name, engine in ENGINES.items():
+        result = run_engine(engine, pages, args.rounds)
+        baseline = baseline or result["seconds"]
+        print(f"{name:<18} {result['pages_per_s']:>9.1f} pages/s {result['mb_per_s']:>8.2f} MB/s "
+              f"{baseline / result['seconds']:>6.2f}x")
+
+if __name__ == "__main__":
+    main()
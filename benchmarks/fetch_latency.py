@@ -0,0 +1,143 @@
+"""End-to-end fetch latency benchmark against the local fixture server.
+
+Usage: python -m benchmarks.fetch_latency [--requests N] [--concurrency C] [--modes http,browser-lean]
+
+Modes: http, browser, browser-lean, browser-cached, browser-cdp. Browser modes need Chrome
+and chromedriver installed locally; no network access is required.
+"""
+import os
+import time
+import asyncio
+import argparse
+import resource
+import statistics
+from typing import Any, Awaitable, Callable, Dict, List, Tuple, Union
+from benchmarks.fixture_server import FixtureServer
+from src.tools.browser import BrowserTool
+from src.tools.http import HttpTool
+from src.tools.page_cache import PageCache
+
+SCENARIOS = {
+    "static": "/pages/blog_article.html",
+    "js": "/js",
+    "slow": "/slow?delay_ms=300",
+    "huge": "/huge?mb=5",
+    "redirect": "/redirect?hops=3",
+}
+
+Fetch = Callable[[str], Awaitable[Any]]
+
+def make_tool(mode: str) -> Union[HttpTool, BrowserTool]:
+    """Build the tool for ``mode`` without request coalescing, so every timed call is a real fetch."""
+    if mode == "http":
+        return HttpTool(single_flight=None)
+    if mode in ("browser", "browser-lean", "browser-cached", "browser-cdp"):
+        return BrowserTool(
+            lean_mode=mode == "browser-lean",
+            page_cache=PageCache(revalidate=False) if mode == "browser-cached" else None,
+            driver_mode="cdp" if mode == "browser-cdp" else "selenium",
+            single_flight=None
+        )
+    raise ValueError(f"Unknown mode: {mode}")
+
+def rss_mb() -> float:
+    """Resident memory of this process and its descendants (chromedriver, Chrome, extraction workers)."""
+    try:
+        return sum(_rss_kb(pid) for pid in _process_tree(os.getpid())) / 1024
+    except OSError:
+        # no /proc: peak RSS of this process alone
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def _process_tree(root: int) -> List[int]:
+    children: Dict[int, List[int]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as stat:
+                ppid = int(stat.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue  # exited while listing
+        children.setdefault(ppid, []).append(int(entry))
+    tree, pending = [], [root]
+    while pending:
+        pid = pending.pop()
+        tree.append(pid)
+        pending.extend(children.get(pid, []))
+    return tree
+
+def _rss_kb(pid: int) -> int:
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+def cpu_seconds() -> float:
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return time.process_time() + children.ru_utime + children.ru_stime
+
+def is_error(result: Any) -> bool:
+    return isinstance(result, dict) and "error" in result
+
+async def timed(fetch: Fetch, url: str) -> Tuple[float, bool]:
+    started = time.perf_counter()
+    result = await fetch(url)
+    return (time.perf_counter() - started) * 1000, is_error(result)
+
+async def run_scenario(mode: str, url: str, requests: int, concurrency: int) -> Dict[str, float]:
+    tool = make_tool(mode)
+    fetch: Fetch = tool.make_request if isinstance(tool, HttpTool) else tool.aget_page_content
+    cpu_before = cpu_seconds()
+    try:
+        cold_ms, cold_error = await timed(fetch, url)
+        slots = asyncio.Semaphore(concurrency)
+
+        async def warm() -> Tuple[float, bool]:
+            async with slots:
+                return await timed(fetch, url)
+
+        started = time.perf_counter()
+        samples = await asyncio.gather(*(warm() for _ in range(max(requests - 1, 0))))
+        elapsed = time.perf_counter() - started
+        rss = rss_mb()
+    finally:
+        await tool.aclose()
+
+    latencies: List[float] = sorted(ms for ms, _ in samples) or [cold_ms]
+    return {
+        "cold_ms": cold_ms,
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+        "req_per_s": len(samples) / elapsed if samples and elapsed else 0.0,
+        "cpu_s": cpu_seconds() - cpu_before,
+        "rss_mb": rss,
+        "errors": cold_error + sum(error for _, error in samples),
+    }
+
+async def run(modes: List[str], scenarios: List[str], requests: int, concurrency: int) -> None:
+    async with FixtureServer() as server:
+        print(f"Fixture server on {server.url('/')}, {requests} requests per scenario, concurrency {concurrency}")
+        print(f"{'mode':<15}{'scenario':<10}{'cold ms':>10}{'p50 ms':>10}{'p95 ms':>10}"
+              f"{'req/s':>9}{'cpu s':>8}{'rss MB':>9}{'errors':>8}")
+        for mode in modes:
+            for scenario in scenarios:
+                stats = await run_scenario(mode, server.url(SCENARIOS[scenario]), requests, concurrency)
+                print(f"{mode:<15}{scenario:<10}{stats['cold_ms']:>10.1f}{stats['p50_ms']:>10.1f}"
+                      f"{stats['p95_ms']:>10.1f}{stats['req_per_s']:>9.1f}{stats['cpu_s']:>8.2f}"
+                      f"{stats['rss_mb']:>9.1f}{stats['errors']:>8d}")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--modes", default="http")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    args = parser.parse_args()
+    asyncio.run(run(args.modes.split(","), args.scenarios.split(","), args.requests, args.concurrency))
+
+if __name__ == "__main__":
+    main()
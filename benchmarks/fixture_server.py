@@ -0,0 +1,134 @@
+"""Local HTTP server with fixture pages for offline benchmarks and tests.
+
+Routes:
+    /pages/{name}           saved pages from tests/fixtures/pages
+    /js                     content injected by JavaScript after load
+    /slow?delay_ms=N        static page served after a delay
+    /huge?mb=N              generated page of roughly N megabytes
+    /redirect?hops=N        redirect chain ending at /pages/blog_article.html
+    /json?items=N           JSON document with N records
+    /site/{n}               generated site of SITE_PAGES linked pages (n links to 2n+1 and 2n+2)
+    /robots.txt             points at /sitemap.xml
+    /sitemap.xml            lists /site/0 and the last site page, which no page links to
+"""
+import asyncio
+from pathlib import Path
+from typing import Optional
+from aiohttp import web
+
+PAGES_DIR = Path(__file__).parent.parent / "tests" / "fixtures" / "pages"
+
+JS_PAGE = """<!DOCTYPE html>
+<html><head><title>Rendered by script</title></head>
+<body><main id="app">Loading...</main>
+<script>
+setTimeout(function () {
+  document.getElementById('app').innerHTML = '<h1>Client side</h1><p>' +
+    'This paragraph was rendered by JavaScript. '.repeat(50) + '</p>';
+}, 200);
+</script>
+</body></html>"""
+
+SITE_PAGES = 32
+
+PARAGRAPH = "<p>" + "Benchmark filler text for a very large fixture page. " * 20 + "</p>\n"
+
+def _int_param(request: web.Request, name: str, default: int) -> int:
+    try:
+        return int(request.query.get(name, default))
+    except ValueError:
+        raise web.HTTPBadRequest(text=f"{name} must be an integer")
+
+def _page_response(name: str) -> web.Response:
+    path = (PAGES_DIR / name).resolve()
+    if path.parent != PAGES_DIR.resolve() or not path.is_file():
+        raise web.HTTPNotFound()
+    return web.Response(text=path.read_text(encoding="utf-8"), content_type="text/html")
+
+async def page(request: web.Request) -> web.Response:
+    return _page_response(request.match_info["name"])
+
+async def js_page(request: web.Request) -> web.Response:
+    return web.Response(text=JS_PAGE, content_type="text/html")
+
+async def slow(request: web.Request) -> web.Response:
+    await asyncio.sleep(_int_param(request, "delay_ms", 500) / 1000)
+    return _page_response("docs_main.html")
+
+async def huge(request: web.Request) -> web.Response:
+    target = _int_param(request, "mb", 5) * 1024 * 1024
+    body = "<html><head><title>Huge page</title></head><body><main>"
+    body += PARAGRAPH * (target // len(PARAGRAPH) + 1)
+    return web.Response(text=body + "</main></body></html>", content_type="text/html")
+
+async def redirect(request: web.Request) -> web.Response:
+    hops = _int_param(request, "hops", 3)
+    if hops <= 0:
+        raise web.HTTPFound("/pages/blog_article.html")
+    raise web.HTTPFound(f"/redirect?hops={hops - 1}")
+
+async def json_items(request: web.Request) -> web.Response:
+    items = [{"id": i, "name": f"item-{i}", "tags": ["a", "b"]} for i in range(_int_param(request, "items", 100))]
+    return web.json_response({"count": len(items), "items": items})
+
+async def site_page(request: web.Request) -> web.Response:
+    number = int(request.match_info["n"])
+    if not 0 <= number < SITE_PAGES:
+        raise web.HTTPNotFound()
+    children = [child for child in (2 * number + 1, 2 * number + 2) if child < SITE_PAGES - 1]
+    links = "".join(f'<li><a href="/site/{child}">Page {child}</a></li>' for child in children)
+    links += f'<li><a href="/site/{number}#top">Top</a></li><li><a href="https://example.org/">Elsewhere</a></li>'
+    links += '<li><a href="/files/manual.pdf">Manual</a></li><li><a href="mailto:docs@example.org">Mail</a></li>'
+    body = f"<html><head><title>Site page {number}</title></head><body><main><h1>Page {number}</h1>"
+    body += f"<p>Documentation for topic {number}. {PARAGRAPH}</p><ul>{links}</ul></main></body></html>"
+    return web.Response(text=body, content_type="text/html")
+
+async def robots(request: web.Request) -> web.Response:
+    return web.Response(text=f"User-agent: *\nSitemap: {request.url.origin()}/sitemap.xml\n")
+
+async def sitemap(request: web.Request) -> web.Response:
+    urls = "".join(f"<url><loc>{request.url.origin()}/site/{n}</loc></url>" for n in (0, SITE_PAGES - 1))
+    xml = f'<?xml version="1.0"?><urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{urls}</urlset>'
+    return web.Response(text=xml, content_type="application/xml")
+
+def create_app() -> web.Application:
+    app = web.Application()
+    app.router.add_get("/pages/{name}", page)
+    app.router.add_get("/js", js_page)
+    app.router.add_get("/slow", slow)
+    app.router.add_get("/huge", huge)
+    app.router.add_get("/redirect", redirect)
+    app.router.add_get("/json", json_items)
+    app.router.add_get(r"/site/{n:\d+}", site_page)
+    app.router.add_get("/robots.txt", robots)
+    app.router.add_get("/sitemap.xml", sitemap)
+    return app
+
+class FixtureServer:
+    """Runs the fixture app on 127.0.0.1 with an ephemeral port."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.host = host
+        self.port = port
+        self._runner: Optional[web.AppRunner] = None
+
+    async def start(self) -> "FixtureServer":
+        self._runner = web.AppRunner(create_app())
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        self.port = self._runner.addresses[0][1]
+        return self
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def url(self, path: str) -> str:
+        return f"http://{self.host}:{self.port}{path}"
+
+    async def __aenter__(self) -> "FixtureServer":
+        return await self.start()
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
@@ -0,0 +1,136 @@
+"""Local server speaking cleartext HTTP/2 (prior knowledge) and HTTP/1.1 on one port.
+
+Every path answers with a small JSON document after ``delay_ms`` (query
+parameter, defaulting to the server's ``delay_ms``). HTTP/2 streams are served
+concurrently on one connection; HTTP/1.1 requests are served one at a time per
+connection, as keep-alive clients expect.
+"""
+import json
+import asyncio
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlsplit
+import h2.config
+import h2.connection
+import h2.events
+
+PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+
+class H2Server:
+    """Runs on 127.0.0.1 with an ephemeral port; counts connections per protocol."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, delay_ms: float = 0):
+        self.host = host
+        self.port = port
+        self.delay_ms = delay_ms
+        self.connections = {"HTTP/2": 0, "HTTP/1.1": 0}
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def start(self) -> "H2Server":
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            for task in list(self._tasks):
+                task.cancel()
+            await self._server.wait_closed()
+            self._server = None
+
+    def url(self, path: str) -> str:
+        return f"http://{self.host}:{self.port}{path}"
+
+    async def __aenter__(self) -> "H2Server":
+        return await self.start()
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    def _body(self, target: str, protocol: str) -> Tuple[float, bytes]:
+        parts = urlsplit(target)
+        query = parse_qs(parts.query)
+        delay = float(query.get("delay_ms", [self.delay_ms])[0]) / 1000
+        return delay, json.dumps({"path": parts.path, "protocol": protocol}).encode()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        self._tasks.add(task)
+        try:
+            try:
+                start = await reader.readexactly(len(PREFACE))
+            except asyncio.IncompleteReadError as e:
+                start = e.partial
+            if start == PREFACE:
+                self.connections["HTTP/2"] += 1
+                await self._serve_h2(start, reader, writer)
+            else:
+                self.connections["HTTP/1.1"] += 1
+                await self._serve_h1(start, reader, writer)
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self._tasks.discard(task)
+            writer.close()
+
+    async def _serve_h2(self, data: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        conn = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False))
+        conn.initiate_connection()
+        streams: List[asyncio.Task] = []
+
+        async def respond(stream_id: int, headers: Dict[str, str]) -> None:
+            delay, body = self._body(headers[":path"], "HTTP/2")
+            await asyncio.sleep(delay)
+            conn.send_headers(stream_id, [
+                (":status", "200"),
+                ("content-type", "application/json"),
+                ("content-length", str(len(body))),
+            ])
+            conn.send_data(stream_id, body, end_stream=True)
+            writer.write(conn.data_to_send())
+
+        try:
+            while data:
+                for event in conn.receive_data(data):
+                    if isinstance(event, h2.events.RequestReceived):
+                        headers = {_text(name): _text(value) for name, value in event.headers}
+                        streams.append(asyncio.create_task(respond(event.stream_id, headers)))
+                    elif isinstance(event, h2.events.ConnectionTerminated):
+                        return
+                writer.write(conn.data_to_send())
+                await writer.drain()
+                data = await reader.read(65535)
+        finally:
+            for stream in streams:
+                stream.cancel()
+
+    async def _serve_h1(self, data: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        buffer = data
+        while True:
+            while b"\r\n\r\n" not in buffer:
+                chunk = await reader.read(65535)
+                if not chunk:
+                    return
+                buffer += chunk
+            head, buffer = buffer.split(b"\r\n\r\n", 1)
+            lines = head.decode("latin-1").split("\r\n")
+            target = lines[0].split(" ")[1]
+            headers = {name.strip().lower(): value.strip() for name, _, value in (line.partition(":") for line in lines[1:])}
+            length = int(headers.get("content-length", 0))
+            while len(buffer) < length:
+                buffer += await reader.read(65535)
+            buffer = buffer[length:]
+
+            delay, body = self._body(target, "HTTP/1.1")
+            await asyncio.sleep(delay)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                + f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+            )
+            await writer.drain()
+            if headers.get("connection", "").lower() == "close":
+                return
+
+def _text(value) -> str:
+    return value.decode() if isinstance(value, bytes) else value
@@ -0,0 +1,74 @@
+"""Latency of concurrent requests to one host over each HttpTool transport.
+
+Usage: python -m benchmarks.http2_latency [--requests 100] [--delay-ms 50] [--modes aiohttp,httpx-h1,httpx-h2]
+
+Modes: aiohttp (HTTP/1.1, pooled session), httpx-h1 (httpx over HTTP/1.1) and
+httpx-h2 (httpx over one multiplexed HTTP/2 connection). All requests are sent
+at once to a local server that answers each after ``--delay-ms``; HTTP/1.1
+requests queue for one of ``--connections`` sockets while HTTP/2 streams share
+a single connection. Needs the ``h2`` package; no network access is required.
+"""
+import time
+import asyncio
+import argparse
+import statistics
+from typing import Any, Dict, List
+from benchmarks.h2_server import H2Server
+from src.tools.http import HttpTool
+from src.tools.http_session import HttpSessionPool
+from src.tools.http_spec import RequestSpec
+from src.tools.http_transport import AiohttpTransport, HttpTransport, HttpxTransport
+
+def make_transport(mode: str, connections: int) -> HttpTransport:
+    if mode == "aiohttp":
+        return AiohttpTransport(HttpSessionPool(limit_per_host=connections))
+    if mode == "httpx-h1":
+        return HttpxTransport(http2=False, max_connections=connections, max_keepalive_connections=connections)
+    if mode == "httpx-h2":
+        return HttpxTransport(http1=False, max_connections=connections, max_keepalive_connections=connections)
+    raise ValueError(f"Unknown mode: {mode}")
+
+async def run_mode(server: H2Server, mode: str, requests: int, connections: int) -> Dict[str, Any]:
+    tool = HttpTool(transport=make_transport(mode, connections), single_flight=None, max_parallel=requests)
+    opened = dict(server.connections)
+    try:
+        await tool.fetch(server.url("/warmup?delay_ms=0"))
+        specs = [RequestSpec(url=server.url(f"/item/{i}")) for i in range(requests)]
+        started = time.perf_counter()
+        results = await tool.request_many(specs)
+        elapsed = time.perf_counter() - started
+    finally:
+        await tool.aclose()
+
+    latencies: List[float] = sorted(result["meta"]["elapsed_ms"] for result in results if "error" not in result)
+    return {
+        "p50_ms": statistics.median(latencies) if latencies else 0.0,
+        "p95_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] if latencies else 0.0,
+        "max_ms": latencies[-1] if latencies else 0.0,
+        "total_ms": elapsed * 1000,
+        "req_per_s": requests / elapsed if elapsed else 0.0,
+        "connections": sum(server.connections.values()) - sum(opened.values()),
+        "errors": sum("error" in result for result in results),
+    }
+
+async def run(modes: List[str], requests: int, delay_ms: float, connections: int) -> None:
+    async with H2Server(delay_ms=delay_ms) as server:
+        print(f"Server on {server.url('/')}, {requests} concurrent requests, {delay_ms:g} ms server delay, "
+              f"{connections} connections per host")
+        print(f"{'mode':<10}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}{'total ms':>10}{'req/s':>9}{'conns':>7}{'errors':>8}")
+        for mode in modes:
+            stats = await run_mode(server, mode, requests, connections)
+            print(f"{mode:<10}{stats['p50_ms']:>10.1f}{stats['p95_ms']:>10.1f}{stats['max_ms']:>10.1f}"
+                  f"{stats['total_ms']:>10.1f}{stats['req_per_s']:>9.1f}{stats['connections']:>7d}{stats['errors']:>8d}")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--delay-ms", type=float, default=50)
+    parser.add_argument("--connections", type=int, default=10)
+    parser.add_argument("--modes", default="aiohttp,httpx-h1,httpx-h2")
+    args = parser.parse_args()
+    asyncio.run(run(args.modes.split(","), args.requests, args.delay_ms, args.connections))
+
+if __name__ == "__main__":
+    main()
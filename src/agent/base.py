@@ -1,4 +1,4 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator
 from pydantic import BaseModel, Field, ConfigDict
 from langchain_openai import ChatOpenAI
 from langchain.agents import create_openai_functions_agent
@@ -7,6 +7,14 @@ from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from src.tools.browser import BrowserTool
 from src.tools.search import SearchTool
 from src.tools.http import HttpTool
+from src.tools.crawl import CrawlTool
+from src.tools.page_cache import PageCache
+from src.tools.http_cache import HttpCache
+from src.tools.search_cache import SearchCache
+from src.tools.search_backends import MemoryIndexBackend
+from src.tools.http_session import HttpSessionPool
+from src.tools.host_scheduler import HostScheduler
+from src.tools.prefetch import Prefetcher
 from src.memory.vector_memory import VectorMemory
 from src.callbacks.tool_output import ToolOutputCallbackHandler
 from src.callbacks.openai_logger import OpenAICallbackHandler
@@ -24,6 +32,10 @@ class Agent(BaseModel):
     agent_executor: Optional[AgentExecutor] = None
     tools: List[Any] = Field(default_factory=list)
     callbacks: List[Any] = Field(default_factory=list)
+    http_pool: HttpSessionPool = Field(default_factory=HttpSessionPool)
+    scheduler: HostScheduler = Field(default_factory=HostScheduler)
+    prefetch_top_n: int = Field(default=0, description="Search results loaded in the background after each search, 0 disables")
+    prefetcher: Optional[Prefetcher] = None
     
     def __init__(self, openai_api_key: str, **kwargs):
         super().__init__(openai_api_key=openai_api_key, **kwargs)
@@ -44,10 +56,34 @@ class Agent(BaseModel):
                 callbacks=self.callbacks
             )
             
+            http_tool = HttpTool(
+                name="http",
+                callbacks=self.callbacks,
+                session_pool=self.http_pool,
+                http_cache=HttpCache(),
+                scheduler=self.scheduler
+            )
+            browser_tool = BrowserTool(
+                name="browser",
+                callbacks=self.callbacks,
+                page_cache=PageCache(session_pool=self.http_pool, scheduler=self.scheduler),
+                scheduler=self.scheduler
+            )
+            if self.prefetch_top_n > 0:
+                self.prefetcher = Prefetcher(browser_tool.aget_page_content, top_n=self.prefetch_top_n)
+                browser_tool.prefetcher = self.prefetcher
             self.tools = [
-                SearchTool(name="search", callbacks=self.callbacks),
-                BrowserTool(name="browser", callbacks=self.callbacks),
-                HttpTool(name="http", callbacks=self.callbacks)
+                SearchTool(
+                    name="search",
+                    callbacks=self.callbacks,
+                    scheduler=self.scheduler,
+                    search_cache=SearchCache(),
+                    prefetcher=self.prefetcher,
+                    supplements=[MemoryIndexBackend(self.memory)]
+                ),
+                browser_tool,
+                http_tool,
+                CrawlTool(name="crawl", callbacks=self.callbacks, http_tool=http_tool, memory=self.memory)
             ]
             
             prompt = ChatPromptTemplate.from_messages([
@@ -101,6 +137,11 @@ class Agent(BaseModel):
             logger.error(f"Error performing search: {str(e)}")
             return {"error": str(e)}
 
+    async def search_stream(self, queries: List[str]) -> AsyncIterator[Dict[str, Any]]:
+        search_tool = next(tool for tool in self.tools if isinstance(tool, SearchTool))
+        async for result in search_tool.search_stream(queries):
+            yield result
+
     async def get_page_content(self, url: str) -> Dict[str, Any]:
         try:
             browser_tool = next(tool for tool in self.tools if isinstance(tool, BrowserTool))
@@ -110,6 +151,11 @@ class Agent(BaseModel):
             logger.error(f"Error getting page content: {str(e)}")
             return {"error": str(e)}
 
+    async def browse_many(self, urls: List[str]) -> AsyncIterator[Dict[str, Any]]:
+        browser_tool = next(tool for tool in self.tools if isinstance(tool, BrowserTool))
+        async for result in browser_tool.browse_many(urls, run_manager=self.callbacks[0]):
+            yield result
+
     async def make_http_request(self, url: str) -> Dict[str, Any]:
         try:
             http_tool = next(tool for tool in self.tools if isinstance(tool, HttpTool))
@@ -117,4 +163,36 @@ class Agent(BaseModel):
             return result
         except Exception as e:
             logger.error(f"Error making HTTP request: {str(e)}")
-            return {"error": str(e)} 
\ No newline at end of file
+            return {"error": str(e)}
+
+    async def crawl(self, request: str) -> Dict[str, Any]:
+        try:
+            crawl_tool = next(tool for tool in self.tools if isinstance(tool, CrawlTool))
+            return await crawl_tool._arun(request, run_manager=self.callbacks[0])
+        except Exception as e:
+            logger.error(f"Error crawling: {str(e)}")
+            return {"error": str(e)}
+
+    async def aclose(self) -> None:
+        if self.prefetcher is not None:
+            await self.prefetcher.close()
+        for tool in self.tools:
+            if hasattr(tool, "aclose"):
+                await tool.aclose()
+        await self.http_pool.close()
+
+    async def __aenter__(self) -> "Agent":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = {
+            tool.name: tool.get_stats()
+            for tool in self.tools
+            if hasattr(tool, "get_stats")
+        }
+        stats["scheduler"] = self.scheduler.get_stats()
+        stats["prefetch"] = self.prefetcher.get_stats() if self.prefetcher else None
+        return stats
@@ -3,5 +3,7 @@ from src.cli.handlers.search import SearchHandler
 from src.cli.handlers.http import HttpHandler
 from src.cli.handlers.browser import BrowserHandler
 from src.cli.handlers.memory import MemoryHandler
+from src.cli.handlers.stats import StatsHandler
+from src.cli.handlers.crawl import CrawlHandler
 
-__all__ = ['SearchHandler', 'HttpHandler', 'BrowserHandler', 'MemoryHandler'] 
\ No newline at end of file
+__all__ = ['SearchHandler', 'HttpHandler', 'BrowserHandler', 'MemoryHandler', 'StatsHandler', 'CrawlHandler'] 
\ No newline at end of file
@@ -1,6 +1,6 @@
 """Base handler for CLI commands."""
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, AsyncIterator
 
 class BaseHandler(ABC):
     """Base class for all command handlers."""
@@ -22,4 +22,16 @@ class BaseHandler(ABC):
     @abstractmethod
     def get_help(self) -> str:
         """Get help text for this handler's commands."""
-        pass 
\ No newline at end of file
+        pass 
+
+    async def stream(self, command: str) -> AsyncIterator[str]:
+        """Yield printable output as it becomes available; by default the whole result at once."""
+        yield self.format(await self.handle(command))
+
+    def format(self, result: Any) -> str:
+        """Render a result from ``handle`` with the handler's formatter, if it has one."""
+        if hasattr(self, 'format_result'):
+            return self.format_result(result)
+        if hasattr(self, 'format_results'):
+            return self.format_results(result)
+        return str(result)
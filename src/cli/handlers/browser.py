@@ -1,5 +1,5 @@
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List, Union, AsyncIterator
 from .base import BaseHandler
 
 logger = logging.getLogger(__name__)
@@ -9,26 +9,51 @@ class BrowserHandler(BaseHandler):
         command = command.lower()
         return command.startswith("browser ") or command.startswith("browser:")
 
-    async def handle(self, command: str) -> Dict[str, Any]:
-        if ":" in command:
-            url = command.split(":", 1)[1].strip()
-        else:
-            url = command[len("browser "):].strip()
-            
+    def _url(self, command: str) -> str:
+        if command.lower().startswith("browser:"):
+            return command.split(":", 1)[1].strip()
+        return command[len("browser "):].strip()
+
+    async def handle(self, command: str) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        url = self._url(command)
         if not url:
             logger.warning("Empty URL provided")
             return {"error": "URL is required"}
             
+        urls = url.split()
+        if len(urls) > 1:
+            logger.info(f"Browsing {len(urls)} URLs concurrently")
+            return [result async for result in self.agent.browse_many(urls)]
+            
         logger.info(f"Making browser request to URL: {url}")
         result = await self.agent.get_page_content(url)
         logger.info("Got response from agent")
         return result
         
-    def format_result(self, result: Dict[str, Any]) -> str:
+    async def stream(self, command: str) -> AsyncIterator[str]:
+        """Print each page of a multi-URL command as soon as it has been rendered."""
+        urls = self._url(command).split()
+        if len(urls) < 2:
+            yield self.format(await self.handle(command))
+            return
+        logger.info(f"Streaming {len(urls)} URLs")
+        async for page in self.agent.browse_many(urls):
+            yield self._format_page(page)
+
+    def format_result(self, result: Union[Dict[str, Any], List[Dict[str, Any]]]) -> str:
+        if isinstance(result, list):
+            if not result:
+                return "No content retrieved"
+            return "\n".join(self._format_page(page) for page in result)
+        return self._format_page(result)
+        
+    def _format_page(self, result: Dict[str, Any]) -> str:
         if not result:
             return "No content retrieved"
             
         if "error" in result:
+            if "url" in result:
+                return f"\nError from {result['url']}: {result['error']}"
             return f"\nError: {result['error']}"
             
         if "content" not in result:
@@ -47,4 +72,4 @@ class BrowserHandler(BaseHandler):
         return formatted
         
     def get_help(self) -> str:
-        return "- browser <url>: Browse a webpage and extract its content" 
\ No newline at end of file
+        return "- browser <url> [<url> ...]: Browse one or more webpages concurrently and extract their content" 
\ No newline at end of file
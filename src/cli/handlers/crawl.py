@@ -0,0 +1,52 @@
+import json
+import logging
+from typing import Dict, Any
+from .base import BaseHandler
+
+logger = logging.getLogger(__name__)
+
+class CrawlHandler(BaseHandler):
+    def can_handle(self, command: str) -> bool:
+        command = command.lower()
+        return command.startswith("crawl ") or command.startswith("crawl:")
+
+    async def handle(self, command: str) -> Dict[str, Any]:
+        if command.lower().startswith("crawl:"):
+            args = command.split(":", 1)[1].split()
+        else:
+            args = command[len("crawl "):].split()
+
+        if not args:
+            logger.warning("Empty URL provided")
+            return {"error": "URL is required"}
+
+        request: Dict[str, Any] = {"url": args[0]}
+        if len(args) > 1:
+            if not args[1].isdigit():
+                return {"error": f"max_pages must be a number, got {args[1]}"}
+            request["max_pages"] = int(args[1])
+
+        logger.info(f"Crawling {request['url']}")
+        return await self.agent.crawl(json.dumps(request))
+
+    def format_result(self, result: Dict[str, Any]) -> str:
+        if "error" in result:
+            return f"\nError: {result['error']}"
+
+        output = []
+        for page in result.get("pages", []):
+            if "error" in page:
+                output.append(f"  [{page['depth']}] {page['url']} - error: {page['error']}")
+            else:
+                output.append(f"  [{page['depth']}] {page['url']} - {page.get('title') or 'No title'} ({page['text_chars']} chars)")
+
+        stats = result.get("stats", {})
+        output.append("-" * 50)
+        output.append(
+            f"Crawled {stats.get('pages', 0)} pages ({stats.get('errors', 0)} errors) in {stats.get('elapsed_s', 0)}s, "
+            f"{stats.get('pages_per_s', 0)} pages/s; {stats.get('sitemap_urls', 0)} URLs from sitemaps"
+        )
+        return f"\nCrawl of {stats.get('seed', 'unknown URL')}\n" + "\n".join(output)
+
+    def get_help(self) -> str:
+        return "- crawl <url> [max_pages]: Crawl a site from a URL and store its pages in memory"
@@ -1,6 +1,6 @@
 import json
 import logging
-from typing import Dict, Any, Union
+from typing import Dict, Any, List, Union
 from src.cli.handlers.base import BaseHandler
 
 logger = logging.getLogger(__name__)
@@ -10,8 +10,8 @@ class HttpHandler(BaseHandler):
         command = command.lower()
         return command.startswith("http ") or command.startswith("http:")
     
-    async def handle(self, command: str) -> Dict[str, Any]:
-        if ":" in command:
+    async def handle(self, command: str) -> Union[Dict[str, Any], List[Any], str]:
+        if command.lower().startswith("http:"):
             url = command.split(":", 1)[1].strip()
         else:
             url = command[len("http "):].strip()
@@ -20,6 +20,10 @@ class HttpHandler(BaseHandler):
             logger.warning("Empty URL provided")
             return self.get_help()
             
+        if url.startswith(("{", "[")):
+            logger.info("Sending structured HTTP request")
+            return await self.agent.make_http_request(url)
+            
         if not url.startswith(('http://', 'https://')):
             url = 'https://' + url.lstrip('/')
             
@@ -28,7 +32,10 @@ class HttpHandler(BaseHandler):
         logger.info("Got response from agent")
         return result
         
-    def format_result(self, result: Union[Dict[str, Any], str]) -> str:
+    def format_result(self, result: Union[Dict[str, Any], List[Any], str]) -> str:
+        if isinstance(result, list):
+            return "\n".join(self.format_result(item) for item in result)
+            
         if isinstance(result, str):
             try:
                 parsed = json.loads(result)
@@ -37,11 +44,14 @@ class HttpHandler(BaseHandler):
                 return "\nText Response\n" + "-" * 50 + "\n" + result
                 
         if isinstance(result, dict) and 'error' in result:
+            if 'url' in result:
+                return f"\nError from {result['url']}: {result['error']}"
             return f"\nError: {result['error']}"
         
         if isinstance(result, dict) and 'status_code' in result:
             output = [
-                f"\nStatus Code: {result['status_code']}",
+                f"\n{result['method']} {result['url']}" if 'method' in result else "",
+                f"Status Code: {result['status_code']}",
                 f"Content Type: {result['content_type']}",
                 "-" * 50
             ]
@@ -49,6 +59,12 @@ class HttpHandler(BaseHandler):
             data = result['data']
             if isinstance(data, dict) and 'content_type' in data:
                 output.append(data['content'])
+            elif isinstance(data, dict) and 'total_rows' in data:
+                rows = f"{data['rows']} of {data['total_rows']} rows, " if data['rows'] is not None else ""
+                output.append(f"Projection {data['select'] or '$'}: {rows}{data['result_chars']} of {data['json_chars']} characters")
+                output.append(json.dumps(data['result'], indent=2))
+            elif isinstance(data, str):
+                output.append(data)
             else:
                 output.append(json.dumps(data, indent=2))
         else:
@@ -61,4 +77,8 @@ class HttpHandler(BaseHandler):
         return "\n".join(output)
         
     def get_help(self) -> str:
-        return "- http <url>: Make an HTTP request to a URL" 
\ No newline at end of file
+        return (
+            "- http <url>: Make an HTTP request to a URL\n"
+            '- http {"url": ..., "method": "POST", "json": {...}}: Send a request spec, or a JSON list of specs as a batch\n'
+            '- http {"url": ..., "select": "items[*].{id, name}", "limit": 10}: Return only part of a JSON response'
+        ) 
\ No newline at end of file
@@ -1,5 +1,6 @@
+import json
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, AsyncIterator, Optional
 from .base import BaseHandler
 
 logger = logging.getLogger(__name__)
@@ -9,33 +10,53 @@ class SearchHandler(BaseHandler):
         command = command.lower()
         return command.startswith("search ") or command.startswith("search:")
 
+    def _query(self, command: str) -> str:
+        if ":" in command and command.lower().startswith("search:"):
+            return command.split(":", 1)[1].strip()
+        return command[len("search "):].strip()
+
     async def handle(self, command: str) -> List[Dict[str, Any]]:
-        if ":" in command:
-            query = command.split(":", 1)[1].strip()
-        else:
-            query = command[len("search "):].strip()
-            
+        query = self._query(command)
         if not query:
             return self.get_help()
-            
+
         return await self.agent.search(query)
-        
+
+    async def stream(self, command: str) -> AsyncIterator[str]:
+        """Print each result of a JSON list of queries as soon as its query finishes."""
+        queries = self._query_list(self._query(command))
+        if queries is None:
+            yield self.format(await self.handle(command))
+            return
+        count = 0
+        async for result in self.agent.search_stream(queries):
+            count += 1
+            yield self._format_result(result)
+        if not count:
+            yield "No results found"
+
+    def _query_list(self, query: str) -> Optional[List[str]]:
+        if not query.startswith("["):
+            return None
+        try:
+            queries = json.loads(query)
+        except json.JSONDecodeError:
+            return None
+        return [str(item) for item in queries] if isinstance(queries, list) else None
+
     def format_results(self, results: List[Dict[str, Any]]) -> str:
         if not results:
             return "No results found"
-            
+
         if isinstance(results, list) and len(results) > 0 and "error" in results[0]:
             return f"Error: {results[0]['error']}"
-            
-        output = []
-        for result in results:
-            title = result.get("title", "No title")
-            link = result.get("link", "No link")
-            output.append(f"Title: {title}")
-            output.append(f"Link: {link}")
-            output.append("")
-            
-        return "\n".join(output)
-        
+
+        return "\n".join(self._format_result(result) for result in results)
+
+    def _format_result(self, result: Dict[str, Any]) -> str:
+        title = result.get("title", "No title")
+        link = result.get("link") or result.get("href", "No link")
+        return f"Title: {title}\nLink: {link}\n"
+
     def get_help(self) -> str:
-        return "- search <query>: Search the web for information" 
\ No newline at end of file
+        return "- search <query>: Search the web for information (a JSON list of queries streams results as each finishes)"
@@ -0,0 +1,16 @@
+import json
+from typing import Dict, Any
+from src.cli.handlers.base import BaseHandler
+
+class StatsHandler(BaseHandler):
+    def can_handle(self, command: str) -> bool:
+        return command.strip().lower() == "stats"
+
+    async def handle(self, command: str) -> Dict[str, Any]:
+        return self.agent.get_stats()
+
+    def format_result(self, result: Dict[str, Any]) -> str:
+        return "\nTool statistics\n" + "-" * 50 + "\n" + json.dumps(result, indent=2, default=str)
+
+    def get_help(self) -> str:
+        return "- stats: Show cache, extraction pool and fetch statistics"
@@ -1,11 +1,12 @@
 import os
 import sys
+import time
 import asyncio
-from typing import Dict
+from typing import Any, AsyncIterator, Dict, Optional
 from dotenv import load_dotenv
 from src.agent.base import Agent
 from src.cli.handlers.base import BaseHandler
-from src.cli.handlers import SearchHandler, HttpHandler, BrowserHandler, MemoryHandler
+from src.cli.handlers import SearchHandler, HttpHandler, BrowserHandler, MemoryHandler, StatsHandler, CrawlHandler
 from src.config.logging_config import get_logger
 
 load_dotenv()
@@ -18,8 +19,11 @@ class CLI:
             "memory": MemoryHandler(self.agent),
             "search": SearchHandler(self.agent),
             "http": HttpHandler(self.agent),
-            "browser": BrowserHandler(self.agent)
+            "browser": BrowserHandler(self.agent),
+            "crawl": CrawlHandler(self.agent),
+            "stats": StatsHandler(self.agent)
         }
+        self.last_timing: Optional[Dict[str, Any]] = None
         
     def get_help(self) -> str:
         help_text = "Available commands:\n"
@@ -35,37 +39,67 @@ class CLI:
         elif command == "exit":
             sys.exit(0)
         
-        for prefix, handler in self.handlers.items():
-            if handler.can_handle(command):
-                result = await handler.handle(command)
-                if hasattr(handler, 'format_result'):
-                    return handler.format_result(result)
-                elif hasattr(handler, 'format_results'):
-                    return handler.format_results(result)
-                return str(result)
+        handler = self._handler_for(command)
+        if handler is not None:
+            return handler.format(await handler.handle(command))
                 
         return await self.agent.process_message(command)
 
+    async def stream_command(self, command: str) -> AsyncIterator[str]:
+        """Yield output as the handler produces it, recording in ``last_timing`` the
+        latency of the first chunk separately from the total."""
+        started = time.perf_counter()
+        first: Optional[float] = None
+        chunks = 0
+        try:
+            handler = None if command in ("help", "exit") else self._handler_for(command)
+            outputs = handler.stream(command) if handler is not None else self._single(command)
+            async for chunk in outputs:
+                if first is None:
+                    first = time.perf_counter() - started
+                chunks += 1
+                yield chunk
+        finally:
+            self.last_timing = {
+                "first_result_ms": round(first * 1000, 1) if first is not None else None,
+                "total_ms": round((time.perf_counter() - started) * 1000, 1),
+                "chunks": chunks
+            }
+
+    async def _single(self, command: str) -> AsyncIterator[str]:
+        yield await self.process_command(command)
+
+    def _handler_for(self, command: str) -> Optional[BaseHandler]:
+        return next((handler for handler in self.handlers.values() if handler.can_handle(command)), None)
+
 async def main():
     cli = CLI()
     logger.info("AI Agent CLI")
     logger.info('Type "help" for available commands or "exit" to quit\n')
     
-    while True:
-        try:
-            command = input("\nYou: ").strip()
-            if not command:
-                continue
+    try:
+        while True:
+            try:
+                command = input("\nYou: ").strip()
+                if not command:
+                    continue
                 
-            result = await cli.process_command(command)
-            logger.info(f"\nAgent: {result}")
+                prefix = "\nAgent: "
+                async for chunk in cli.stream_command(command):
+                    logger.info(f"{prefix}{chunk}")
+                    prefix = ""
+                timing = cli.last_timing
+                if timing["chunks"] > 1:
+                    logger.info(f"({timing['chunks']} results, first after {timing['first_result_ms']} ms, all after {timing['total_ms']} ms)")
             
-        except KeyboardInterrupt:
-            logger.info("\nExiting...")
-            break
-        except Exception as e:
-            logger.error(f"Error: {str(e)}")
-            logger.info(f"\nError: {str(e)}")
+            except KeyboardInterrupt:
+                logger.info("\nExiting...")
+                break
+            except Exception as e:
+                logger.error(f"Error: {str(e)}")
+                logger.info(f"\nError: {str(e)}")
+    finally:
+        await cli.agent.aclose()
 
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file
@@ -9,11 +9,24 @@ SYSTEM_PROMPT = """You are a helpful AI assistant that can use tools to accompli
 2. search: A web search tool that can find relevant information online.
    Usage: Use this tool when you need to search for information without a specific URL.
    Example: Searching for "latest Python version" or "Python tutorials".
+   To search several phrasings or sub-topics at once, send a JSON list of queries such as
+   ["asyncio timeout", "asyncio wait_for cancel"]; results are merged and deduplicated by URL.
 
 3. http: A tool for making HTTP requests to APIs and web services.
    Usage: Use this tool when you need to interact with REST APIs or web services.
+   Input is a URL for a simple GET, or a JSON request spec such as
+   {"url": "...", "method": "POST", "headers": {...}, "query": {...}, "json": {...}, "timeout": 10}.
+   Add "select" to keep only the JSON fields you need, e.g. "items[*].{id, name, owner: owner.login}",
+   and "limit" to cap the number of rows; the result carries total_rows so you know what was left out.
+   Send a JSON list of specs to make several independent requests in one call.
    Example: Fetching data from a JSON API endpoint.
 
+4. crawl: A site crawler that follows same-site links and the sitemap from a seed URL.
+   Usage: Use this tool when you need many pages of one site, such as a documentation section.
+   Input is a URL or {"url": "...", "max_pages": 20, "max_depth": 2}. Page text is stored in
+   tool history; the result lists the crawled pages and their titles.
+   Example: Crawling docs.python.org/3/library/asyncio.html to answer questions about asyncio.
+
 When using tools:
 - Always extract the most relevant information and present it clearly to the user
 - Use the most appropriate tool for the task
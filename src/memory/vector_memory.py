@@ -1,4 +1,4 @@
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
@@ -61,7 +61,18 @@ class VectorMemory(BaseMemory):
         tool_outputs = self._search(query, k=3, filter_type="tool")
         return [self._parse_tool_output(doc) for doc in tool_outputs]
 
+    def search_tool_outputs(self, query: str, k: int = 5, min_score: float = 0.0) -> List[Dict[str, Any]]:
+        """Tool outputs most similar to ``query`` with their cosine ``score``, best first."""
+        return [
+            {**self._parse_tool_output(doc), "score": score}
+            for doc, score in self._scored_search(query, k, filter_type="tool")
+            if score >= min_score
+        ]
+
     def _search(self, query: str, k: int = 5, filter_type: Optional[str] = None) -> List[str]:
+        return [doc for doc, _ in self._scored_search(query, k, filter_type)]
+
+    def _scored_search(self, query: str, k: int = 5, filter_type: Optional[str] = None) -> List[Tuple[str, float]]:
         if not self._documents:
             return []
             
@@ -74,7 +85,7 @@ class VectorMemory(BaseMemory):
         for idx in indices:
             if filter_type and self._metadatas[idx]["type"] != filter_type:
                 continue
-            results.append(self._documents[idx])
+            results.append((self._documents[idx], float(similarities[idx])))
             if len(results) == k:
                 break
         return results
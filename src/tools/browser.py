@@ -1,14 +1,29 @@
+import time
+import asyncio
 import logging
-from typing import Optional, Dict, Any, List
-from pydantic import Field
+from typing import Optional, Dict, Any, List, AsyncIterator, Literal
+from pydantic import Field, PrivateAttr
 from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
-from bs4 import BeautifulSoup
 from langchain.tools import BaseTool
 from langchain_core.callbacks import CallbackManagerForToolRun, BaseCallbackHandler
+from src.tools.cancellation import finish_on_cancel
+from src.tools.cdp import CdpError
+from src.tools.cdp_page_load import SharedBrowser, render_page_cdp
+from src.tools.extraction import Extraction, extract_document, extract_text
+from src.tools.extraction_pool import ExtractionPool
+from src.tools.host_scheduler import HostScheduler
+from src.tools.page_cache import PageCache
+from src.tools.prefetch import Prefetcher
+from src.tools.single_flight import SingleFlight
+from src.tools.urls import normalize_url
+from src.tools.wait_strategies import WaitStrategy, create_wait_strategy
+from src.tools.page_load import (
+    AD_TRACKER_URL_PATTERNS,
+    DEFAULT_BLOCKED_RESOURCE_TYPES,
+    blocked_url_patterns,
+    page_result,
+    render_page,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -19,97 +34,217 @@ class BrowserTool(BaseTool):
     test_mode: bool = Field(default=False, description="Whether to run in test mode")
     logger: logging.Logger = Field(default_factory=lambda: logging.getLogger(__name__))
     callbacks: Optional[List[BaseCallbackHandler]] = Field(default=None, description="Callbacks for the tool")
+    lean_mode: bool = Field(default=False, description="Block heavy resources and stop waiting at DOMContentLoaded")
+    blocked_resource_types: List[str] = Field(
+        default_factory=lambda: list(DEFAULT_BLOCKED_RESOURCE_TYPES),
+        description="Resource types blocked in lean mode (image, media, font, stylesheet)"
+    )
+    blocked_url_patterns: List[str] = Field(
+        default_factory=lambda: list(AD_TRACKER_URL_PATTERNS),
+        description="URL wildcard patterns blocked in lean mode, ads and trackers by default"
+    )
+    extraction_pool: Optional[ExtractionPool] = Field(
+        default_factory=ExtractionPool,
+        description="Process pool used for extracting large pages off the event loop"
+    )
+    page_cache: Optional[PageCache] = Field(default=None, description="Cache of extracted pages keyed by normalized URL")
+    wait_strategy: Optional[str] = Field(
+        default=None,
+        description="Readiness strategy: load, domcontentloaded, network_idle, text_stability or selector"
+    )
+    wait_options: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Options for wait_strategy, e.g. quiet_ms or selector; ignored by the default strategy"
+    )
+    wait_timeout: float = Field(default=10.0, description="Seconds to wait before extracting a partial result")
+    max_html_chars: Optional[int] = Field(default=2_000_000, description="HTML characters pulled from the browser per page")
+    max_text_chars: Optional[int] = Field(default=20_000, description="Text characters extracted per page")
+    single_flight: Optional[SingleFlight] = Field(default_factory=SingleFlight, description="Coalesces concurrent loads of the same URL")
+    max_concurrency: int = Field(default=4, description="Maximum number of pages rendered at once across all calls")
+    scheduler: Optional[HostScheduler] = Field(default=None, description="Per-host rate limits and back-off shared with other tools")
+    prefetcher: Optional[Prefetcher] = Field(default=None, description="Speculative loads of search results that browse calls claim")
+    driver_mode: Literal["selenium", "cdp"] = Field(
+        default="selenium",
+        description="selenium (chromedriver per page) or cdp (DevTools websocket, one tab per page in a shared Chrome)"
+    )
+    cdp_endpoint: Optional[str] = Field(default=None, description="DevTools websocket URL of a running Chrome; launched locally when empty")
+    _render_slots: Optional[asyncio.Semaphore] = PrivateAttr(default=None)
+    _cdp_browser: SharedBrowser = PrivateAttr()
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        if self.wait_strategy:
+            self._wait()
+        self._cdp_browser = SharedBrowser(self.cdp_endpoint)
         self.logger = logging.getLogger(__name__)
         self.logger.info("Initializing BrowserTool")
 
     def set_mock_driver(self, mock_driver):
         self.driver = mock_driver
 
+    def _normalize_url(self, url: str) -> str:
+        if not url.startswith(('http://', 'https://')):
+            url = 'https://' + url.lstrip('/')
+        return url
+
     def get_page_content(self, url: str) -> Dict[str, Any]:
         if not url:
             self.logger.error("URL is empty")
             return {"error": "URL cannot be empty"}
 
-        if not url.startswith(('http://', 'https://')):
-            url = 'https://' + url.lstrip('/')
+        url = self._normalize_url(url)
+        if self.test_mode:
+            return {"url": url, "content": self.driver.page_source if self.driver else ""}
 
-        if not self.test_mode:
-            try:
-                chrome_options = Options()
-                chrome_options.add_argument("--headless=new")  
-                chrome_options.add_argument("--no-sandbox")
-                chrome_options.add_argument("--disable-dev-shm-usage")
-                chrome_options.add_argument("--disable-gpu")
-                chrome_options.add_argument("--remote-debugging-port=9222")
-                chrome_options.add_argument("--window-size=1920,1080")
-                chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-                
-                self.driver = webdriver.Chrome(options=chrome_options)
-                
-                self.driver.get(url)
-                
-                try:
-                    WebDriverWait(self.driver, 10).until(
-                        lambda d: d.execute_script("return document.readyState") == "complete"
-                    )
-                except TimeoutException:
-                    self.logger.warning("Page load timeout")
-                    return {"error": "Page load timeout"}
-                
-                content = self._parse_html_content(self.driver.page_source)
-                
-                return {"url": url, "content": content}
-                
-            except WebDriverException as e:
-                self.logger.error(f"Browser error: {str(e)}")
-                return {"error": f"Browser error: {str(e)}"}
-                
-            finally:
-                if self.driver:
-                    try:
-                        self.driver.quit()
-                    except Exception as e:
-                        self.logger.error(f"Error closing browser: {str(e)}")
-        else:
+        page = self._render_page(url)
+        if "error" in page:
+            return page
+        extract_started = time.perf_counter()
+        extraction = extract_document(page.pop("html"), self.max_text_chars)
+        return self._page_result(page, extraction, extract_started)
+
+    async def aget_page_content(self, url: str) -> Dict[str, Any]:
+        if not url:
+            self.logger.error("URL is empty")
+            return {"error": "URL cannot be empty"}
+
+        url = self._normalize_url(url)
+        if self.test_mode:
             return {"url": url, "content": self.driver.page_source if self.driver else ""}
+        if self.single_flight is None:
+            return await self._load_page(url)
+        return dict(await self.single_flight.run(normalize_url(url), lambda: self._load_page(url)))
+
+    async def _load_page(self, url: str) -> Dict[str, Any]:
+        if self.page_cache is not None:
+            cached = await self.page_cache.get(url)
+            if cached is not None:
+                self.logger.info(f"Serving {url} from page cache ({cached['cache']})")
+                return cached
+
+        if self.scheduler is not None:
+            async with self.scheduler.slot(url) as slot:
+                page = await self._render_in_slot(url)
+                slot.report(page.get("status"), page.get("headers"))
+        else:
+            page = await self._render_in_slot(url)
+        if "error" in page:
+            return page
+        extract_started = time.perf_counter()
+        html = page.pop("html")
+        headers = page.get("headers") or {}
+        extraction = await self._extract(html)
+        result = self._page_result(page, extraction, extract_started)
+
+        if self.page_cache is not None and extraction.text and not result.get("partial"):
+            await self.page_cache.put(url, result, html_bytes=len(html), headers=headers)
+        return result
+
+    async def browse_many(
+        self,
+        urls: List[str],
+        run_manager: Optional[CallbackManagerForToolRun] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Render several URLs concurrently, yielding each result as soon as it completes."""
+        unique_urls = list(dict.fromkeys(url.strip() for url in urls if url and url.strip()))
+        tasks = [asyncio.create_task(self._browse_one(url, run_manager)) for url in unique_urls]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _browse_one(self, url: str, run_manager: Optional[CallbackManagerForToolRun]) -> Dict[str, Any]:
+        try:
+            result = await self._load_claimed(url)
+        except Exception as e:
+            self.logger.error(f"Error browsing {url}: {str(e)}")
+            result = {"error": str(e)}
+        result.setdefault("url", url)
+        await self._report(result, url, run_manager)
+        return result
+
+    async def _load_claimed(self, url: str) -> Dict[str, Any]:
+        """Load a page, claiming its prefetch first; a ready prefetch is a hit only if the page cache serves it."""
+        if self.prefetcher is None or not url:
+            return await self.aget_page_content(url)
+        claimed = self.prefetcher.claim(self._normalize_url(url))
+        if claimed:
+            self.logger.info(f"Prefetch {claimed} for {url}")
+        result = await self.aget_page_content(url)
+        if claimed == "ready":
+            self.prefetcher.settle(result.get("cache") is not None)
+        return result
+
+    async def _render_in_slot(self, url: str) -> Dict[str, Any]:
+        async with self._slots():
+            return await self._render_page_async(url)
+
+    def _slots(self) -> asyncio.Semaphore:
+        if self._render_slots is None:
+            self._render_slots = asyncio.Semaphore(self.max_concurrency)
+        return self._render_slots
+
+    def _wait(self) -> WaitStrategy:
+        if self.wait_strategy:
+            return create_wait_strategy(self.wait_strategy, **self.wait_options)
+        return create_wait_strategy("domcontentloaded" if self.lean_mode else "load")
+
+    def _render_page(self, url: str) -> Dict[str, Any]:
+        patterns = blocked_url_patterns(self.blocked_resource_types, self.blocked_url_patterns) if self.lean_mode else []
+        return render_page(
+            url,
+            lean=self.lean_mode,
+            blocked_patterns=patterns,
+            wait=self._wait(),
+            timeout=self.wait_timeout,
+            max_html_chars=self.max_html_chars
+        )
+
+    async def _render_page_async(self, url: str) -> Dict[str, Any]:
+        if self.driver_mode != "cdp":
+            return await finish_on_cancel(asyncio.to_thread(self._render_page, url))
+        try:
+            browser = await self._cdp_browser.get()
+        except CdpError as e:
+            self.logger.error(f"Browser error: {str(e)}")
+            return {"error": f"Browser error: {str(e)}"}
+        return await render_page_cdp(
+            browser,
+            url,
+            lean=self.lean_mode,
+            resource_types=self.blocked_resource_types if self.lean_mode else [],
+            url_patterns=self.blocked_url_patterns if self.lean_mode else [],
+            wait=self._wait(),
+            timeout=self.wait_timeout,
+            max_html_chars=self.max_html_chars
+        )
+
+    async def aclose(self) -> None:
+        await self._cdp_browser.close()
+        if self.extraction_pool is not None:
+            self.extraction_pool.shutdown()
+
+    def _page_result(self, page: Dict[str, Any], extraction: Extraction, extract_started: float) -> Dict[str, Any]:
+        result = page_result(page, extraction, extract_started, self.max_html_chars)
+        self.logger.info(f"Browsed {result['url']} in {result['timing']['mode']} mode: {result['timing']}")
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "extraction_pool": self.extraction_pool.get_stats() if self.extraction_pool else None,
+            "page_cache": self.page_cache.get_stats() if self.page_cache else None,
+            "single_flight": self.single_flight.get_stats() if self.single_flight else None
+        }
 
     def _parse_html_content(self, html: str) -> str:
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        for script in soup(["script", "style", "nav", "menu", "footer", "header"]):
-            script.decompose()
-            
-        content = ""
-        
-        article = soup.find('article')
-        if article:
-            content = article.get_text()
-        
-        if not content:
-            main = soup.find('main')
-            if main:
-                content = main.get_text()
-        
-        if not content:
-            content_divs = soup.find_all('div', class_=lambda x: x and ('content' in x.lower() or 'article' in x.lower()))
-            if content_divs:
-                content = max(content_divs, key=lambda x: len(x.get_text())).get_text()
-            else:
-                for element in soup.find_all(['div', 'section']):
-                    if element.get('class'):
-                        classes = ' '.join(element.get('class')).lower()
-                        if any(x in classes for x in ['nav', 'menu', 'footer', 'header', 'sidebar']):
-                            element.decompose()
-                content = soup.get_text()
-
-        lines = (line.strip() for line in content.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        content = ' '.join(chunk for chunk in chunks if chunk)
-        
-        return content
+        return extract_text(html)
+
+    async def _extract(self, html: str) -> Extraction:
+        if self.extraction_pool is None:
+            return extract_document(html, self.max_text_chars)
+        return await self.extraction_pool.extract(html, self.max_text_chars)
 
     async def _arun(
         self,
@@ -118,21 +253,30 @@ class BrowserTool(BaseTool):
         **kwargs: Any
     ) -> Dict[str, Any]:
         try:
-            result = self.get_page_content(url)
-            if run_manager:
-                try:
-                    output = result.get("content", "") if "content" in result else str(result.get("error", ""))
-                    await run_manager.on_tool_end(
-                        output=output,
-                        tool_input=url,
-                        tool_name=self.name
-                    )
-                except Exception as e:
-                    self.logger.error(f"Error in callback: {str(e)}")
+            result = await self._load_claimed(url)
+            await self._report(result, url, run_manager)
             return result
         except Exception as e:
             self.logger.error(f"Error in _arun: {str(e)}")
             return {"error": str(e)}
 
+    async def _report(
+        self,
+        result: Dict[str, Any],
+        url: str,
+        run_manager: Optional[CallbackManagerForToolRun]
+    ) -> None:
+        if not run_manager:
+            return
+        try:
+            output = result.get("content", "") if "content" in result else str(result.get("error", ""))
+            await run_manager.on_tool_end(
+                output=output,
+                tool_input=url,
+                tool_name=self.name
+            )
+        except Exception as e:
+            self.logger.error(f"Error in callback: {str(e)}")
+
     def _run(self, url: str) -> Dict[str, Any]:
         raise NotImplementedError("Use _arun instead") 
\ No newline at end of file
@@ -0,0 +1,59 @@
+"""Two-tier key/value store: in-memory LRU with an optional on-disk JSON tier."""
+import json
+import hashlib
+import logging
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+class CacheStore:
+    def __init__(self, max_entries: int = 256, disk_path: Optional[Union[str, Path]] = None):
+        self.max_entries = max_entries
+        self.disk_path = Path(disk_path) if disk_path else None
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        if self.disk_path:
+            self.disk_path.mkdir(parents=True, exist_ok=True)
+
+    def _file_for(self, key: str) -> Path:
+        return self.disk_path / (hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+            return entry
+        if self.disk_path is None:
+            return None
+        try:
+            entry = json.loads(self._file_for(key).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Unreadable cache entry for {key}: {str(e)}")
+            return None
+        self._remember(key, entry)
+        return entry
+
+    def set(self, key: str, entry: Dict[str, Any]) -> None:
+        self._remember(key, entry)
+        if self.disk_path is not None:
+            try:
+                self._file_for(key).write_text(json.dumps(entry), encoding="utf-8")
+            except (OSError, TypeError) as e:
+                logger.warning(f"Could not persist cache entry for {key}: {str(e)}")
+
+    def delete(self, key: str) -> None:
+        self._memory.pop(key, None)
+        if self.disk_path is not None:
+            self._file_for(key).unlink(missing_ok=True)
+
+    def _remember(self, key: str, entry: Dict[str, Any]) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._memory)
@@ -0,0 +1,26 @@
+"""Cancellation that waits for work a task cannot interrupt."""
+import asyncio
+from typing import Awaitable, TypeVar
+
+T = TypeVar("T")
+
+async def finish_on_cancel(awaitable: Awaitable[T]) -> T:
+    """Await ``awaitable``; if the caller is cancelled, wait for it to finish before re-raising.
+
+    ``asyncio.to_thread`` and ``run_in_executor`` cannot stop their thread, so a
+    cancelled caller would leave the work running while releasing any semaphore
+    or scheduler slot held around the call. Waiting here keeps the slot held
+    until the thread is done.
+    """
+    future = asyncio.ensure_future(awaitable)
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        while not future.done():
+            try:
+                await asyncio.wait({future})
+            except asyncio.CancelledError:
+                continue
+        if not future.cancelled():
+            future.exception()
+        raise
@@ -0,0 +1,241 @@
+"""Minimal async Chrome DevTools Protocol client: one websocket, many tabs."""
+import os
+import json
+import shutil
+import asyncio
+import logging
+import tempfile
+import aiohttp
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+CHROME_CANDIDATES = [
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "chrome",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+]
+
+CHROME_ARGS = [
+    "--headless=new",
+    "--remote-debugging-port=0",
+    "--no-sandbox",
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--no-first-run",
+    "--no-default-browser-check",
+]
+
+class CdpError(Exception):
+    """Raised when Chrome cannot be reached or a protocol command fails."""
+
+def find_chrome() -> Optional[str]:
+    for candidate in [os.getenv("CHROME_PATH")] + CHROME_CANDIDATES:
+        if not candidate:
+            continue
+        path = shutil.which(candidate) or (candidate if Path(candidate).is_file() else None)
+        if path:
+            return path
+    return None
+
+class CdpTab:
+    """A page target attached to the browser connection through a flattened session."""
+
+    def __init__(self, browser: "CdpBrowser", target_id: str, session_id: str):
+        self.browser = browser
+        self.target_id = target_id
+        self.session_id = session_id
+        self._handlers: Dict[str, List[Callable[[Dict[str, Any]], None]]] = {}
+        self._waiters: Dict[str, List[asyncio.Future]] = {}
+        self._background: Set[asyncio.Task] = set()
+
+    async def send(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return await self.browser.send(method, params, session_id=self.session_id)
+
+    def send_nowait(self, method: str, params: Optional[Dict[str, Any]] = None) -> None:
+        """Send a command from an event handler without waiting for its response."""
+        task = asyncio.create_task(self.send(method, params))
+        self._background.add(task)
+        task.add_done_callback(self._command_done)
+
+    def _command_done(self, task: asyncio.Task) -> None:
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"CDP command failed: {task.exception()}")
+
+    def on(self, event: str, handler: Callable[[Dict[str, Any]], None]) -> None:
+        self._handlers.setdefault(event, []).append(handler)
+
+    def wait_for(self, event: str) -> asyncio.Future:
+        """Return a future resolved with the params of the next ``event``."""
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(event, []).append(future)
+        return future
+
+    def dispatch(self, method: str, params: Dict[str, Any]) -> None:
+        for handler in self._handlers.get(method, []):
+            try:
+                handler(params)
+            except Exception as e:
+                logger.error(f"Error handling {method}: {str(e)}")
+        for future in self._waiters.pop(method, []):
+            if not future.done():
+                future.set_result(params)
+
+    async def evaluate(self, expression: str) -> Any:
+        response = await self.send("Runtime.evaluate", {"expression": expression, "returnByValue": True})
+        if "exceptionDetails" in response:
+            raise CdpError(f"Script failed: {response['exceptionDetails'].get('text', 'unknown error')}")
+        return response.get("result", {}).get("value")
+
+    async def close(self) -> None:
+        self.browser._tabs.pop(self.session_id, None)
+        for futures in self._waiters.values():
+            for future in futures:
+                future.cancel()
+        for task in list(self._background):
+            task.cancel()
+        try:
+            await self.browser.send("Target.closeTarget", {"targetId": self.target_id})
+        except CdpError as e:
+            logger.warning(f"Error closing tab: {str(e)}")
+
+    async def __aenter__(self) -> "CdpTab":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+class CdpBrowser:
+    """A Chrome instance driven over its DevTools websocket."""
+
+    def __init__(
+        self,
+        http: aiohttp.ClientSession,
+        ws: aiohttp.ClientWebSocketResponse,
+        process: Optional[asyncio.subprocess.Process] = None,
+        user_data_dir: Optional[str] = None
+    ):
+        self._http = http
+        self._ws = ws
+        self._process = process
+        self._user_data_dir = user_data_dir
+        self._next_id = 0
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._tabs: Dict[str, CdpTab] = {}
+        self._reader = asyncio.create_task(self._read_loop())
+
+    @classmethod
+    async def connect(cls, ws_url: str, **kwargs: Any) -> "CdpBrowser":
+        http = aiohttp.ClientSession()
+        try:
+            ws = await http.ws_connect(ws_url, max_msg_size=0)
+        except aiohttp.ClientError as e:
+            await http.close()
+            raise CdpError(f"Cannot connect to {ws_url}: {str(e)}")
+        return cls(http, ws, **kwargs)
+
+    @classmethod
+    async def launch(cls, executable: Optional[str] = None, startup_timeout: float = 10.0) -> "CdpBrowser":
+        executable = executable or find_chrome()
+        if not executable:
+            raise CdpError("Chrome executable not found, set CHROME_PATH")
+        user_data_dir = tempfile.mkdtemp(prefix="cdp-chrome-")
+        process = await asyncio.create_subprocess_exec(
+            executable, *CHROME_ARGS, f"--user-data-dir={user_data_dir}", "about:blank",
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        try:
+            ws_url = await _devtools_url(Path(user_data_dir), process, startup_timeout)
+            return await cls.connect(ws_url, process=process, user_data_dir=user_data_dir)
+        except BaseException:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            shutil.rmtree(user_data_dir, ignore_errors=True)
+            raise
+
+    @property
+    def closed(self) -> bool:
+        return self._ws.closed
+
+    async def send(self, method: str, params: Optional[Dict[str, Any]] = None, session_id: Optional[str] = None) -> Dict[str, Any]:
+        if self.closed:
+            raise CdpError("Browser connection is closed")
+        self._next_id += 1
+        message_id = self._next_id
+        message: Dict[str, Any] = {"id": message_id, "method": method, "params": params or {}}
+        if session_id:
+            message["sessionId"] = session_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[message_id] = future
+        try:
+            await self._ws.send_str(json.dumps(message))
+            return await future
+        finally:
+            self._pending.pop(message_id, None)
+
+    async def new_tab(self) -> CdpTab:
+        target = await self.send("Target.createTarget", {"url": "about:blank"})
+        attached = await self.send("Target.attachToTarget", {"targetId": target["targetId"], "flatten": True})
+        tab = CdpTab(self, target["targetId"], attached["sessionId"])
+        self._tabs[tab.session_id] = tab
+        return tab
+
+    async def _read_loop(self) -> None:
+        try:
+            async for message in self._ws:
+                if message.type != aiohttp.WSMsgType.TEXT:
+                    continue
+                data = json.loads(message.data)
+                if "id" in data:
+                    future = self._pending.get(data["id"])
+                    if future is None or future.done():
+                        continue
+                    if "error" in data:
+                        future.set_exception(CdpError(data["error"].get("message", "CDP error")))
+                    else:
+                        future.set_result(data.get("result", {}))
+                elif data.get("sessionId") in self._tabs:
+                    self._tabs[data["sessionId"]].dispatch(data["method"], data.get("params", {}))
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(CdpError("Browser connection closed"))
+
+    async def close(self) -> None:
+        if self._process is not None and not self.closed:
+            try:
+                await asyncio.wait_for(self.send("Browser.close"), 2.0)
+            except (CdpError, asyncio.TimeoutError):
+                pass
+        await self._ws.close()
+        await self._http.close()
+        await asyncio.gather(self._reader, return_exceptions=True)
+        if self._process is not None and self._process.returncode is None:
+            self._process.terminate()
+            try:
+                await asyncio.wait_for(self._process.wait(), 5.0)
+            except asyncio.TimeoutError:
+                self._process.kill()
+                await self._process.wait()
+        if self._user_data_dir:
+            shutil.rmtree(self._user_data_dir, ignore_errors=True)
+
+async def _devtools_url(user_data_dir: Path, process: asyncio.subprocess.Process, timeout: float) -> str:
+    port_file = user_data_dir / "DevToolsActivePort"
+    deadline = asyncio.get_running_loop().time() + timeout
+    while asyncio.get_running_loop().time() < deadline:
+        if process.returncode is not None:
+            raise CdpError(f"Chrome exited with code {process.returncode}")
+        if port_file.exists():
+            lines = port_file.read_text().split()
+            if len(lines) >= 2:
+                return f"ws://127.0.0.1:{lines[0]}{lines[1]}"
+        await asyncio.sleep(0.05)
+    raise CdpError("Chrome did not open a DevTools port in time")
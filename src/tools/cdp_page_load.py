@@ -0,0 +1,174 @@
+"""Page loading over the Chrome DevTools Protocol for the browser tool."""
+import time
+import asyncio
+import logging
+import aiohttp
+from typing import Any, Dict, Iterable, List, Optional
+from src.tools.cdp import CdpBrowser, CdpError, CdpTab
+from src.tools.page_load import CAPPED_SOURCE_SCRIPT, TRANSFER_STATS_SCRIPT, document_response
+from src.tools.wait_strategies import WaitStrategy, create_wait_strategy
+
+logger = logging.getLogger(__name__)
+
+CDP_RESOURCE_TYPES = {"image": "Image", "media": "Media", "font": "Font", "stylesheet": "Stylesheet"}
+
+LOAD_EVENTS = {"load": "Page.loadEventFired", "domcontentloaded": "Page.domContentEventFired"}
+
+def fetch_patterns(resource_types: Iterable[str], url_patterns: Iterable[str]) -> List[Dict[str, str]]:
+    """Build ``Fetch.enable`` patterns; only matching requests are paused and failed."""
+    patterns = [{"resourceType": CDP_RESOURCE_TYPES[t]} for t in resource_types if t in CDP_RESOURCE_TYPES]
+    patterns.extend({"urlPattern": pattern} for pattern in dict.fromkeys(url_patterns))
+    return patterns
+
+async def enable_interception(tab: CdpTab, patterns: List[Dict[str, str]]) -> Dict[str, int]:
+    counter = {"blocked": 0}
+    if not patterns:
+        return counter
+
+    def block(params: Dict[str, Any]) -> None:
+        counter["blocked"] += 1
+        tab.send_nowait("Fetch.failRequest", {"requestId": params["requestId"], "errorReason": "BlockedByClient"})
+
+    tab.on("Fetch.requestPaused", block)
+    await tab.send("Fetch.enable", {"patterns": patterns})
+    return counter
+
+async def wait_for_ready(
+    tab: CdpTab,
+    strategy: WaitStrategy,
+    loaded: asyncio.Future,
+    timeout: float,
+    poll: float = 0.1
+) -> Dict[str, Any]:
+    """Wait on the page lifecycle event for load strategies, otherwise poll the strategy probe."""
+    started = time.perf_counter()
+    timed_out = False
+    try:
+        await asyncio.wait_for(_until_ready(tab, strategy, loaded, poll), timeout)
+    except asyncio.TimeoutError:
+        timed_out = True
+    return {
+        "strategy": strategy.name,
+        "waited_ms": round((time.perf_counter() - started) * 1000, 1),
+        "timed_out": timed_out
+    }
+
+async def _until_ready(tab: CdpTab, strategy: WaitStrategy, loaded: asyncio.Future, poll: float) -> None:
+    if strategy.name in LOAD_EVENTS:
+        await loaded
+        return
+    while True:
+        try:
+            if strategy.is_ready(await tab.evaluate(strategy.script)):
+                return
+        except CdpError:
+            pass  # execution context replaced by a navigation
+        await asyncio.sleep(poll)
+
+async def track_document_response(tab: CdpTab) -> Dict[str, Any]:
+    """Record the first document response the tab receives, i.e. the main frame's."""
+    document: Dict[str, Any] = {}
+
+    def received(params: Dict[str, Any]) -> None:
+        if not document and params.get("type") == "Document":
+            document.update(params.get("response") or {})
+
+    tab.on("Network.responseReceived", received)
+    await tab.send("Network.enable")
+    return document
+
+async def collect_transfer_stats(tab: CdpTab) -> Dict[str, Any]:
+    try:
+        stats = await tab.evaluate(f"(function() {{{TRANSFER_STATS_SCRIPT}}})()") or {}
+        return {
+            "bytes_transferred": int(stats.get("bytes", 0)),
+            "resource_count": int(stats.get("resources", 0)),
+        }
+    except CdpError:
+        return {"bytes_transferred": None, "resource_count": None}
+
+async def read_page_source(tab: CdpTab, max_chars: Optional[int] = None) -> Dict[str, Any]:
+    limit = int(max_chars) if max_chars else "Infinity"
+    return await tab.evaluate(f"(function() {{{CAPPED_SOURCE_SCRIPT}}})({limit})")
+
+class SharedBrowser:
+    """Lazily launches, or connects to, one Chrome whose tabs are shared by all page loads."""
+
+    def __init__(self, endpoint: Optional[str] = None):
+        self.endpoint = endpoint
+        self._browser: Optional[CdpBrowser] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def get(self) -> CdpBrowser:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._browser is None or self._browser.closed:
+                if self.endpoint:
+                    self._browser = await CdpBrowser.connect(self.endpoint)
+                else:
+                    self._browser = await CdpBrowser.launch()
+            return self._browser
+
+    async def close(self) -> None:
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+
+async def render_page_cdp(
+    browser: CdpBrowser,
+    url: str,
+    lean: bool = False,
+    resource_types: Iterable[str] = (),
+    url_patterns: Iterable[str] = (),
+    wait: Optional[WaitStrategy] = None,
+    timeout: float = 10.0,
+    max_html_chars: Optional[int] = None
+) -> Dict[str, Any]:
+    """Load a URL in a new tab of a shared Chrome and return the same shape as ``render_page``.
+    Navigation and readiness share one ``timeout``."""
+    started = time.perf_counter()
+    wait = wait or create_wait_strategy("domcontentloaded" if lean else "load")
+    try:
+        async with await browser.new_tab() as tab:
+            await tab.send("Page.enable")
+            blocked = await enable_interception(tab, fetch_patterns(resource_types, url_patterns))
+            document = await track_document_response(tab)
+            loaded = tab.wait_for(LOAD_EVENTS.get(wait.name, LOAD_EVENTS["domcontentloaded"]))
+
+            deadline = time.perf_counter() + timeout
+            try:
+                navigation = await asyncio.wait_for(tab.send("Page.navigate", {"url": url}), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Navigation to {url} timed out, using partial content")
+                navigation = {}
+            if navigation.get("errorText"):
+                raise CdpError(f"{navigation['errorText']} loading {url}")
+
+            wait_info = await wait_for_ready(tab, wait, loaded, max(0.0, deadline - time.perf_counter()))
+            if wait_info["timed_out"]:
+                logger.warning(f"{url} not ready after {wait_info['waited_ms']}ms ({wait.name}), extracting partial content")
+
+            snapshot = await read_page_source(tab, max_html_chars)
+            status, headers = document_response(document)
+            timing = {
+                "mode": "lean" if lean else "full",
+                "driver": "cdp",
+                "load_ms": round((time.perf_counter() - started) * 1000, 1),
+                "blocked_requests": blocked["blocked"],
+                **await collect_transfer_stats(tab)
+            }
+            return {
+                "url": url,
+                "status": status,
+                "headers": headers,
+                "html": snapshot["html"],
+                "html_chars": snapshot["length"],
+                "timing": timing,
+                "wait": wait_info,
+                "partial": wait_info["timed_out"]
+            }
+
+    except (CdpError, aiohttp.ClientError, OSError) as e:
+        logger.error(f"Browser error: {str(e)}")
+        return {"error": f"Browser error: {str(e)}"}
@@ -0,0 +1,108 @@
+import json
+import logging
+from typing import Optional, Dict, Any, List
+from pydantic import Field, PrivateAttr
+from langchain.tools import BaseTool
+from langchain_core.callbacks import CallbackManagerForToolRun, BaseCallbackHandler
+from src.memory.vector_memory import VectorMemory
+from src.tools.crawler import SiteCrawler
+from src.tools.http import HttpTool
+
+logger = logging.getLogger(__name__)
+
+def _limit(options: Dict[str, Any], name: str, minimum: int) -> Optional[int]:
+    """Read an optional whole-number option, accepting numeric strings; raises ``ValueError`` when invalid."""
+    value = options.get(name)
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        raise ValueError(f"{name} must be a whole number, got {value!r}")
+    try:
+        number = float(value)
+    except ValueError:
+        raise ValueError(f"{name} must be a whole number, got {value!r}") from None
+    if not number.is_integer() or number < minimum:
+        raise ValueError(f"{name} must be a whole number of at least {minimum}, got {value!r}")
+    return int(number)
+
+class CrawlTool(BaseTool):
+    name: str = Field(default="crawl", description="The name of the tool")
+    description: str = Field(
+        default=(
+            "Crawl a website from a seed URL, following same-site links and the sitemap, and store every page "
+            'in memory. Input is a URL or {"url", "max_pages", "max_depth"}. Returns page titles and crawl statistics'
+        ),
+        description="The description of the tool"
+    )
+    logger: logging.Logger = Field(default_factory=lambda: logging.getLogger(__name__))
+    callbacks: Optional[List[BaseCallbackHandler]] = Field(default=None, description="Callbacks for the tool")
+    http_tool: HttpTool = Field(default_factory=HttpTool, description="HTTP tool pages are fetched through")
+    memory: Optional[VectorMemory] = Field(default=None, description="Memory that crawled pages are written to")
+    max_pages: int = Field(default=30, description="Pages fetched per crawl unless the input asks for fewer")
+    max_depth: int = Field(default=2, description="Links followed away from the seed")
+    concurrency: int = Field(default=8, description="Pages fetched at once")
+    use_sitemap: bool = Field(default=True, description="Seed the crawl with URLs from robots.txt or /sitemap.xml")
+    _last_crawl: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.logger = logging.getLogger(__name__)
+
+    def crawler(self, max_pages: Optional[int] = None, max_depth: Optional[int] = None) -> SiteCrawler:
+        return SiteCrawler(
+            self.http_tool,
+            memory=self.memory,
+            max_pages=self.max_pages if max_pages is None else min(max_pages, self.max_pages),
+            max_depth=self.max_depth if max_depth is None else min(max_depth, self.max_depth),
+            concurrency=self.concurrency,
+            use_sitemap=self.use_sitemap
+        )
+
+    async def crawl(self, text: str) -> Dict[str, Any]:
+        """Crawl from a URL or a JSON object with ``url`` and optional ``max_pages``/``max_depth``."""
+        text = text.strip()
+        options: Dict[str, Any] = {"url": text}
+        if text.startswith("{"):
+            try:
+                options = json.loads(text)
+            except json.JSONDecodeError as e:
+                return {"error": f"Invalid crawl request: {str(e)}"}
+        if not isinstance(options, dict) or not options.get("url"):
+            return {"error": "URL cannot be empty"}
+        try:
+            max_pages = _limit(options, "max_pages", minimum=1)
+            max_depth = _limit(options, "max_depth", minimum=0)
+        except ValueError as e:
+            return {"error": f"Invalid crawl request: {str(e)}"}
+        self.logger.info(f"Crawling {options['url']}")
+        result = await self.crawler(max_pages, max_depth).run(str(options["url"]))
+        self._last_crawl = result["stats"]
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"last_crawl": self._last_crawl}
+
+    async def _arun(
+        self,
+        url: str,
+        run_manager: Optional[CallbackManagerForToolRun] = None,
+        **kwargs: Any
+    ) -> Dict[str, Any]:
+        try:
+            result = await self.crawl(url)
+            if run_manager:
+                try:
+                    await run_manager.on_tool_end(
+                        output=json.dumps(result.get("stats", result), default=str),
+                        tool_input=url,
+                        tool_name=self.name
+                    )
+                except Exception as e:
+                    self.logger.error(f"Error in callback: {str(e)}")
+            return result
+        except Exception as e:
+            self.logger.error(f"Error in _arun: {str(e)}")
+            raise
+
+    def _run(self, url: str) -> Dict[str, Any]:
+        raise NotImplementedError("Use _arun instead")
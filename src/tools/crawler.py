@@ -0,0 +1,197 @@
+"""Bounded-concurrency, same-site crawler that fetches through the HTTP tool."""
+import time
+import asyncio
+import logging
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+from lxml import etree
+from src.memory.vector_memory import VectorMemory
+from src.tools.extraction import summarize_html
+from src.tools.http import HttpTool
+from src.tools.http_spec import RequestSpec
+from src.tools.urls import host_of, normalize_url
+
+logger = logging.getLogger(__name__)
+
+SKIPPED_EXTENSIONS = (
+    ".pdf", ".zip", ".gz", ".tar", ".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp", ".ico",
+    ".css", ".js", ".mp3", ".mp4", ".woff", ".woff2", ".xml", ".json",
+)
+MAX_SITEMAPS = 10
+
+def parse_sitemap(xml: str) -> Tuple[List[str], List[str]]:
+    """Page URLs and nested sitemap URLs listed in a sitemap or sitemap index."""
+    try:
+        root = etree.fromstring(xml.encode("utf-8"), parser=etree.XMLParser(recover=True, resolve_entities=False))
+    except etree.XMLSyntaxError:
+        return [], []
+    if root is None:
+        return [], []
+    locations = [(element.text or "").strip() for element in root.iter("{*}loc")]
+    if etree.QName(root).localname == "sitemapindex":
+        return [], [url for url in locations if url]
+    return [url for url in locations if url], []
+
+def sitemaps_from_robots(robots: str) -> List[str]:
+    return [
+        line.split(":", 1)[1].strip()
+        for line in robots.splitlines()
+        if line.lower().startswith("sitemap:") and line.split(":", 1)[1].strip()
+    ]
+
+class SiteCrawler:
+    """Crawls one site breadth-first from a seed URL, yielding pages as they arrive.
+
+    Only URLs on the seed's host (and its subdomains with ``include_subdomains``)
+    are followed, each once after normalization, up to ``max_depth`` links from
+    the seed and ``max_pages`` fetches. Sitemap URLs, found through robots.txt
+    or /sitemap.xml, join the frontier at depth 1. Pages are fetched through the
+    HTTP tool, so its session pool, cache, retries and host scheduler apply.
+    When ``memory`` is set each page is stored as a ``crawl`` tool memory.
+    """
+
+    def __init__(
+        self,
+        http_tool: HttpTool,
+        memory: Optional[VectorMemory] = None,
+        max_pages: int = 30,
+        max_depth: int = 2,
+        concurrency: int = 8,
+        use_sitemap: bool = True,
+        include_subdomains: bool = False,
+        max_text_chars: int = 4_000,
+        max_links: int = 500
+    ):
+        self.http_tool = http_tool
+        self.memory = memory
+        self.max_pages = max_pages
+        self.max_depth = max_depth
+        self.concurrency = concurrency
+        self.use_sitemap = use_sitemap
+        self.include_subdomains = include_subdomains
+        self.max_text_chars = max_text_chars
+        self.max_links = max_links
+        self.stats: Dict[str, Any] = {}
+
+    def in_scope(self, url: str, site: str) -> bool:
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or parts.path.lower().endswith(SKIPPED_EXTENSIONS):
+            return False
+        host = host_of(url)
+        return host == site or (self.include_subdomains and host.endswith("." + site))
+
+    async def crawl(self, seed: str) -> AsyncIterator[Dict[str, Any]]:
+        seed = normalize_url(seed)
+        site = host_of(seed)
+        visited: Set[str] = {seed}
+        frontier: Deque[Tuple[str, int]] = deque([(seed, 0)])
+        tasks: Dict[asyncio.Task, Tuple[str, int]] = {}
+        started = time.perf_counter()
+        self.stats = {"seed": seed, "pages": 0, "errors": 0, "duplicates": 0, "out_of_scope": 0, "sitemap_urls": 0, "fetched": 0}
+
+        def enqueue(urls: List[str], depth: int) -> None:
+            for url in urls:
+                try:
+                    key = normalize_url(url)
+                    in_scope = self.in_scope(key, site)
+                except ValueError:
+                    in_scope = False
+                if not in_scope:
+                    self.stats["out_of_scope"] += 1
+                elif key in visited:
+                    self.stats["duplicates"] += 1
+                else:
+                    visited.add(key)
+                    frontier.append((key, depth))
+
+        if self.use_sitemap and self.max_depth >= 1:
+            sitemap_urls = await self.discover_sitemap(seed)
+            self.stats["sitemap_urls"] = len(sitemap_urls)
+            enqueue(sitemap_urls, 1)
+
+        try:
+            while frontier or tasks:
+                while frontier and len(tasks) < self.concurrency and self.stats["fetched"] < self.max_pages:
+                    url, depth = frontier.popleft()
+                    self.stats["fetched"] += 1
+                    tasks[asyncio.create_task(self._fetch_page(url))] = (url, depth)
+                if not tasks:
+                    break
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    url, depth = tasks.pop(task)
+                    page = task.result()
+                    page["depth"] = depth
+                    if "error" in page:
+                        self.stats["errors"] += 1
+                    else:
+                        self.stats["pages"] += 1
+                        if depth < self.max_depth:
+                            enqueue(page.pop("links"), depth + 1)
+                        self._remember(page)
+                    page.pop("links", None)
+                    yield page
+        finally:
+            for task in tasks:
+                task.cancel()
+            elapsed = time.perf_counter() - started
+            self.stats["elapsed_s"] = round(elapsed, 2)
+            self.stats["pages_per_s"] = round(self.stats["pages"] / elapsed, 2) if elapsed else 0.0
+            logger.info(f"Crawl of {seed} finished: {self.stats}")
+
+    async def run(self, seed: str) -> Dict[str, Any]:
+        """Crawl to completion and return page titles and sizes with crawl statistics."""
+        pages = [
+            {key: page[key] for key in ("url", "depth", "title", "text_chars", "error") if key in page}
+            async for page in self.crawl(seed)
+        ]
+        return {"pages": pages, "stats": self.stats}
+
+    async def discover_sitemap(self, seed: str) -> List[str]:
+        origin = f"{urlsplit(seed).scheme}://{urlsplit(seed).netloc}"
+        robots = await self._fetch_text(f"{origin}/robots.txt")
+        pending = sitemaps_from_robots(robots or "") or [f"{origin}/sitemap.xml"]
+        urls: List[str] = []
+        seen: Set[str] = set()
+        while pending and len(seen) < MAX_SITEMAPS and len(urls) < self.max_pages:
+            sitemap = pending.pop(0)
+            if sitemap in seen:
+                continue
+            seen.add(sitemap)
+            pages, nested = parse_sitemap(await self._fetch_text(sitemap) or "")
+            urls.extend(pages)
+            pending.extend(nested)
+        if urls:
+            logger.info(f"Found {len(urls)} URLs in {len(seen)} sitemaps for {origin}")
+        return urls
+
+    async def _fetch_text(self, url: str) -> Optional[str]:
+        result = await self.http_tool.request(RequestSpec(url=url, raw=True))
+        if "error" in result or result["status_code"] != 200 or not isinstance(result["data"], str):
+            return None
+        return result["data"]
+
+    async def _fetch_page(self, url: str) -> Dict[str, Any]:
+        result = await self.http_tool.request(RequestSpec(url=url, raw=True))
+        if "error" in result:
+            return {"url": url, "error": result["error"]}
+        if result["status_code"] >= 400:
+            return {"url": url, "error": f"HTTP {result['status_code']}"}
+        if not isinstance(result["data"], str) or "html" not in result["content_type"]:
+            return {"url": url, "error": f"Not an HTML page ({result['content_type'] or 'no content type'})"}
+
+        summary = summarize_html(result["data"], self.max_text_chars, self.max_links, base_url=result.get("final_url") or url)
+        return {
+            "url": url,
+            "title": summary.title,
+            "text": summary.extraction.text,
+            "text_chars": summary.extraction.text_chars,
+            "links": [link["href"] for link in summary.links],
+            "bytes_read": result["meta"]["bytes_read"]
+        }
+
+    def _remember(self, page: Dict[str, Any]) -> None:
+        if self.memory is None or not page.get("text"):
+            return
+        self.memory.add_tool_memory("crawl", page["url"], f"{page['title']}\n{page['text']}")
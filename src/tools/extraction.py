@@ -0,0 +1,183 @@
+"""Single-pass HTML to text extraction used by the browser and HTTP tools."""
+import re
+import threading
+from itertools import accumulate
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import urljoin
+from lxml import etree
+
+DROPPED_TAGS = frozenset(["script", "style", "nav", "menu", "footer", "header"])
+CONTENT_CLASS = re.compile(r"content|article")
+NOISE_CLASS = re.compile(r"nav|menu|footer|header|sidebar")
+NOISE_CONTAINERS = frozenset(["div", "section"])
+XML_DECLARATION = re.compile(r"^\s*<\?xml[^>]*\?>")
+SKIPPED_LINK_PREFIXES = ("#", "javascript:", "mailto:", "tel:", "data:")
+
+_local = threading.local()
+
+class Extraction(NamedTuple):
+    text: str
+    truncated: bool
+    text_chars: int
+
+class PageSummary(NamedTuple):
+    title: str
+    links: List[Dict[str, str]]
+    extraction: Extraction
+
+def _parser() -> etree.HTMLParser:
+    parser = getattr(_local, "parser", None)
+    if parser is None:
+        parser = etree.HTMLParser(remove_comments=True, remove_pis=True, no_network=True)
+        _local.parser = parser
+    return parser
+
+def _parse(html: str) -> Optional[etree._Element]:
+    if not html:
+        return None
+    try:
+        return etree.fromstring(html, _parser())
+    except ValueError:
+        # lxml refuses str input carrying an XML encoding declaration
+        return etree.fromstring(XML_DECLARATION.sub("", html, count=1), _parser())
+
+def normalize_whitespace(text: str) -> str:
+    lines = (line.strip() for line in text.splitlines())
+    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+    return ' '.join(chunk for chunk in chunks if chunk)
+
+def extract_text(html: str, max_chars: Optional[int] = None) -> str:
+    return extract_document(html, max_chars).text
+
+def extract_document(html: str, max_chars: Optional[int] = None) -> Extraction:
+    """Extract the main readable text of a page.
+
+    Picks the first <article>, then the first <main>, then the largest div whose
+    class mentions content/article, and finally the whole document minus
+    navigation-like containers, in a single traversal of an lxml tree.
+    """
+    root = _parse(html)
+    if root is None:
+        return Extraction("", False, 0)
+    return _extract_root(root, max_chars)
+
+def summarize_html(
+    html: str,
+    max_chars: Optional[int] = None,
+    max_links: int = 50,
+    base_url: Optional[str] = None
+) -> PageSummary:
+    """Extract title, main text and unique links from one parse of the page.
+    Links are resolved against the page's ``<base href>``, itself relative to ``base_url``."""
+    root = _parse(html)
+    if root is None:
+        return PageSummary("", [], Extraction("", False, 0))
+
+    base = root.find(".//base[@href]")
+    if base is not None:
+        try:
+            base_url = urljoin(base_url or "", base.get("href").strip()) or base_url
+        except ValueError:
+            pass
+
+    links: Dict[str, str] = {}
+    for anchor in root.iter("a"):
+        if len(links) >= max_links:
+            break
+        href = (anchor.get("href") or "").strip()
+        if not href or href.lower().startswith(SKIPPED_LINK_PREFIXES):
+            continue
+        try:
+            href = urljoin(base_url, href) if base_url else href
+        except ValueError:
+            continue
+        links.setdefault(href, normalize_whitespace("".join(anchor.itertext())))
+
+    title = normalize_whitespace(root.findtext(".//title") or "")
+    return PageSummary(
+        title,
+        [{"text": text, "href": href} for href, text in links.items()],
+        _extract_root(root, max_chars)
+    )
+
+def _extract_root(root: etree._Element, max_chars: Optional[int]) -> Extraction:
+    texts: List[str] = []
+    noise: List[bool] = []
+    article = main = None
+    candidates: List[List[int]] = []
+    stack: List[Optional[Tuple[List[List[int]], bool]]] = []
+    noise_depth = 0
+
+    walker = etree.iterwalk(root, events=("start", "end"))
+    for event, element in walker:
+        tag = element.tag
+        if event == "start":
+            if tag in DROPPED_TAGS:
+                walker.skip_subtree()
+                stack.append(None)
+                continue
+            spans: List[List[int]] = []
+            is_noise = False
+            if tag == "article" and article is None:
+                article = [len(texts), len(texts)]
+                spans.append(article)
+            elif tag == "main" and main is None:
+                main = [len(texts), len(texts)]
+                spans.append(main)
+            elif tag in NOISE_CONTAINERS:
+                classes = (element.get("class") or "").lower()
+                if tag == "div" and CONTENT_CLASS.search(classes):
+                    candidates.append([len(texts), len(texts)])
+                    spans.append(candidates[-1])
+                is_noise = bool(NOISE_CLASS.search(classes))
+                noise_depth += is_noise
+            stack.append((spans, is_noise))
+            if element.text:
+                texts.append(element.text)
+                noise.append(noise_depth > 0)
+        else:
+            entry = stack.pop()
+            if entry is not None:
+                for span in entry[0]:
+                    span[1] = len(texts)
+                noise_depth -= entry[1]
+            if element.tail and stack:
+                texts.append(element.tail)
+                noise.append(noise_depth > 0)
+
+    if article and article[1] > article[0]:
+        selected = texts[article[0]:article[1]]
+    elif main and main[1] > main[0]:
+        selected = texts[main[0]:main[1]]
+    elif candidates:
+        offsets = list(accumulate((len(t) for t in texts), initial=0))
+        best = max(candidates, key=lambda span: offsets[span[1]] - offsets[span[0]])
+        selected = texts[best[0]:best[1]]
+    else:
+        selected = [t for t, is_noise in zip(texts, noise) if not is_noise]
+
+    return _emit(selected, max_chars)
+
+def _emit(fragments: List[str], max_chars: Optional[int]) -> Extraction:
+    """Normalize selected text, stopping once ``max_chars`` is exceeded.
+
+    Whitespace normalization only shrinks text and a normalized prefix is a
+    prefix of the normalized whole, so only as many fragments as needed to
+    fill the budget are joined.
+    """
+    text_chars = sum(len(fragment) for fragment in fragments)
+    if max_chars is None or text_chars <= max_chars:
+        return Extraction(normalize_whitespace("".join(fragments)), False, text_chars)
+
+    taken = raw_chars = 0
+    needed = max_chars + 1
+    while True:
+        while taken < len(fragments) and raw_chars < needed:
+            raw_chars += len(fragments[taken])
+            taken += 1
+        text = normalize_whitespace("".join(fragments[:taken]))
+        if len(text) > max_chars:
+            return Extraction(text[:max_chars].rstrip(), True, text_chars)
+        if taken == len(fragments):
+            return Extraction(text, False, text_chars)
+        needed *= 2
@@ -0,0 +1,74 @@
+"""Process pool that moves CPU-heavy HTML extraction off the event loop."""
+import os
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Optional
+from src.tools.extraction import Extraction, extract_document
+
+logger = logging.getLogger(__name__)
+
+class ExtractionPool:
+    """Routes extraction by page size: small pages inline, large pages to worker processes.
+
+    When every worker is busy (``max_pending`` reached) or the pool breaks, large
+    pages fall back to a thread so the event loop keeps running.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        inline_threshold: int = 128 * 1024,
+        max_pending: Optional[int] = None
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.inline_threshold = inline_threshold
+        self.max_pending = max_pending or self.max_workers * 2
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending = 0
+        self._stats = {"inline": 0, "process": 0, "thread_fallback": 0, "pool_errors": 0}
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    async def extract(self, html: str, max_chars: Optional[int] = None) -> Extraction:
+        if len(html) < self.inline_threshold:
+            self._stats["inline"] += 1
+            return extract_document(html, max_chars)
+
+        if self._pending >= self.max_pending:
+            logger.info("Extraction pool saturated, extracting in a thread")
+            return await self._extract_in_thread(html, max_chars)
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            extraction = await loop.run_in_executor(self._get_executor(), extract_document, html, max_chars)
+            self._stats["process"] += 1
+            return extraction
+        except BrokenProcessPool as e:
+            logger.error(f"Extraction pool broken, recreating: {str(e)}")
+            self._stats["pool_errors"] += 1
+            self.shutdown()
+            return await self._extract_in_thread(html, max_chars)
+        finally:
+            self._pending -= 1
+
+    async def _extract_in_thread(self, html: str, max_chars: Optional[int]) -> Extraction:
+        self._stats["thread_fallback"] += 1
+        return await asyncio.to_thread(extract_document, html, max_chars)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {**self._stats, "pending": self._pending, "max_workers": self.max_workers}
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
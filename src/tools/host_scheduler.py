@@ -0,0 +1,207 @@
+"""Per-host politeness for outbound fetches: token buckets, in-flight caps, AIMD back-off and fair queuing."""
+import time
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Optional, TypeVar
+from src.tools.http_retry import retry_after_seconds
+from src.tools.urls import host_of
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+THROTTLE_STATUSES = {429, 503}
+
+class _Host:
+    def __init__(self, rate: float, burst: int, now: float):
+        self.rate = rate
+        self.tokens = float(burst)
+        self.updated = now
+        self.paused_until = 0.0
+        self.in_flight = 0
+        self.waiters: Deque[asyncio.Future] = deque()
+        self.granted = 0
+        self.throttled = 0
+
+    def refill(self, now: float, burst: int) -> None:
+        self.tokens = min(float(burst), self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def ready_at(self, now: float) -> float:
+        token_at = now if self.tokens >= 1 else now + (1 - self.tokens) / self.rate
+        return max(token_at, self.paused_until)
+
+class Slot:
+    """Permission to send one request to ``host``; ``report`` feeds its status back."""
+
+    def __init__(self, scheduler: "HostScheduler", host: str, queue_wait: float):
+        self.host = host
+        self.queue_wait = queue_wait
+        self._scheduler = scheduler
+
+    def report(self, status: Optional[int], headers: Optional[Dict[str, str]] = None) -> None:
+        self._scheduler.feedback(self.host, status, headers)
+
+class HostScheduler:
+    """Admits outbound requests per host, shared by the HTTP, browser and search tools.
+
+    Each host has a token bucket (``rate`` requests per second, ``burst`` at
+    once) and at most ``max_in_flight`` requests outstanding; ``max_total``
+    caps requests across all hosts. Waiting hosts are served round-robin, so a
+    long queue for one host does not hold up the others. A 429 or 503 halves the
+    host's rate and pauses it for ``Retry-After`` (capped at ``max_pause``);
+    each success adds ``increase`` back until the configured rate is reached.
+    """
+
+    def __init__(
+        self,
+        rate: float = 5.0,
+        burst: int = 10,
+        max_in_flight: int = 6,
+        max_total: int = 64,
+        min_rate: float = 0.1,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+        max_pause: float = 60.0,
+        wait_window: int = 500
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.max_in_flight = max_in_flight
+        self.max_total = max_total
+        self.min_rate = min_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.max_pause = max_pause
+        self._hosts: Dict[str, _Host] = {}
+        self._order: Deque[str] = deque()
+        self._in_flight = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._waits: Deque[float] = deque(maxlen=wait_window)
+        self._stats = {"granted": 0, "queued": 0, "throttled": 0}
+
+    async def run(self, url: str, call: Callable[[], Awaitable[T]]) -> T:
+        """Await ``call`` inside a slot for the URL's host, reporting its ``status`` if it has one."""
+        async with self.slot(url) as slot:
+            result = await call()
+            slot.report(getattr(result, "status", None), getattr(result, "headers", None))
+            return result
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[Slot]:
+        host = host_of(url)
+        waited = await self._acquire(host)
+        try:
+            yield Slot(self, host, waited)
+        finally:
+            self._release(host)
+
+    async def _acquire(self, host: str) -> float:
+        state = self._state(host)
+        started = time.monotonic()
+        future = asyncio.get_running_loop().create_future()
+        state.waiters.append(future)
+        if host not in self._order:
+            self._order.append(host)
+        self._dispatch()
+        if not future.done():
+            self._stats["queued"] += 1
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self._release(host)
+            self._dispatch()
+            raise
+        waited = time.monotonic() - started
+        self._waits.append(waited)
+        return waited
+
+    def _release(self, host: str) -> None:
+        self._hosts[host].in_flight -= 1
+        self._in_flight -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        now = time.monotonic()
+        next_at: Optional[float] = None
+        granted = True
+        while granted and self._order and self._in_flight < self.max_total:
+            granted = False
+            for host in list(self._order):
+                state = self._hosts[host]
+                while state.waiters and state.waiters[0].done():
+                    state.waiters.popleft()
+                if not state.waiters:
+                    self._order.remove(host)
+                    continue
+                if state.in_flight >= self.max_in_flight or self._in_flight >= self.max_total:
+                    continue
+                state.refill(now, self.burst)
+                ready_at = state.ready_at(now)
+                if ready_at > now:
+                    next_at = ready_at if next_at is None else min(next_at, ready_at)
+                    continue
+                state.tokens -= 1
+                state.in_flight += 1
+                state.granted += 1
+                self._in_flight += 1
+                self._stats["granted"] += 1
+                state.waiters.popleft().set_result(None)
+                self._order.remove(host)
+                self._order.append(host)
+                granted = True
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if next_at is not None:
+            self._timer = asyncio.get_running_loop().call_later(next_at - now, self._dispatch)
+
+    def feedback(self, host: str, status: Optional[int], headers: Optional[Dict[str, str]] = None) -> None:
+        """Slow a host down multiplicatively on 429/503 and speed it up additively on success."""
+        if status is None:
+            return
+        state = self._state(host)
+        if status in THROTTLE_STATUSES:
+            state.rate = max(self.min_rate, state.rate * self.decrease)
+            delay = retry_after_seconds(headers or {})
+            pause = min(self.max_pause, delay if delay is not None else 1 / state.rate)
+            state.paused_until = max(state.paused_until, time.monotonic() + pause)
+            state.tokens = min(state.tokens, 0.0)
+            state.throttled += 1
+            self._stats["throttled"] += 1
+            logger.warning(f"{host} answered {status}: pausing {pause:.1f}s, rate now {state.rate:.2f}/s")
+        elif status < 400:
+            state.rate = min(self.rate, state.rate + self.increase)
+
+    def _state(self, host: str) -> _Host:
+        if host not in self._hosts:
+            self._hosts[host] = _Host(self.rate, self.burst, time.monotonic())
+        return self._hosts[host]
+
+    def get_stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        waits = sorted(self._waits)
+        return {
+            **self._stats,
+            "in_flight": self._in_flight,
+            "queue_wait_ms": {
+                "mean": round(sum(waits) / len(waits) * 1000, 1) if waits else 0.0,
+                "p95": round(waits[min(len(waits) - 1, int(len(waits) * 0.95))] * 1000, 1) if waits else 0.0,
+                "max": round(waits[-1] * 1000, 1) if waits else 0.0
+            },
+            "hosts": {
+                host: {
+                    "rate": round(state.rate, 2),
+                    "in_flight": state.in_flight,
+                    "queued": sum(not waiter.done() for waiter in state.waiters),
+                    "granted": state.granted,
+                    "throttled": state.throttled,
+                    "paused_s": round(max(0.0, state.paused_until - now), 1)
+                }
+                for host, state in self._hosts.items()
+            }
+        }
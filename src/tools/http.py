@@ -1,52 +1,191 @@
+import json
+import time
+import asyncio
 import logging
 import aiohttp
 from typing import Optional, Dict, Any, Union, List
 from pydantic import Field
 from langchain.tools import BaseTool
 from langchain_core.callbacks import CallbackManagerForToolRun, BaseCallbackHandler
+from src.tools.host_scheduler import HostScheduler
+from src.tools.http_cache import HttpCache
+from src.tools.http_retry import RetryPolicy
+from src.tools.http_session import HttpSessionPool
+from src.tools.http_spec import RequestSpec, parse_request_input, parse_request_item
+from src.tools.http_content import parse_body
+from src.tools.http_stream import HttpResponse
+from src.tools.http_transport import AiohttpTransport, HttpTransport
+from src.tools.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
 class HttpTool(BaseTool):
     name: str = Field(default="http", description="The name of the tool")
-    description: str = Field(default="Make an HTTP request to a URL", description="The description of the tool")
+    description: str = Field(
+        default=(
+            "Make HTTP requests. Input is a URL for a simple GET, or a JSON request spec "
+            '{"url", "method", "headers", "query", "json", "form", "timeout"}, '
+            'add "select" (e.g. "items[*].{id, name}") and "limit" to return only part of a JSON response, '
+            "or send a JSON list of specs concurrently"
+        ),
+        description="The description of the tool"
+    )
     logger: logging.Logger = Field(default_factory=lambda: logging.getLogger(__name__))
     callbacks: Optional[List[BaseCallbackHandler]] = Field(default=None, description="Callbacks for the tool")
+    session_pool: HttpSessionPool = Field(default_factory=HttpSessionPool, description="Long-lived session reused across requests")
+    transport: Optional[HttpTransport] = Field(default=None, description="Client backend, aiohttp over session_pool when None")
+    http_cache: Optional[HttpCache] = Field(default=None, description="RFC 9111 response cache, disabled when None")
+    retry_policy: Optional[RetryPolicy] = Field(default_factory=RetryPolicy, description="Timeouts, retries and hedging, disabled when None")
+    single_flight: Optional[SingleFlight] = Field(default_factory=SingleFlight, description="Coalesces identical concurrent requests")
+    scheduler: Optional[HostScheduler] = Field(default=None, description="Per-host rate limits and back-off shared with other tools")
+    max_body_bytes: int = Field(default=1_000_000, description="Bytes of a response body read before truncating")
+    chunk_size: int = Field(default=64 * 1024, description="Bytes read from the socket per chunk")
+    reduce_html: bool = Field(default=True, description="Return title, main text and links instead of raw HTML for text/html responses")
+    max_text_chars: Optional[int] = Field(default=20_000, description="Text characters kept when reducing HTML")
+    max_links: int = Field(default=50, description="Links kept when reducing HTML")
+    max_parallel: int = Field(default=8, description="Requests of a batch in flight at once")
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.logger = logging.getLogger(__name__)
-        self.logger.info("Initializing HttpTool")
+        if self.transport is None:
+            self.transport = AiohttpTransport(self.session_pool)
+        self.logger.info(f"Initializing HttpTool with {self.transport.name} transport")
 
     async def make_request(self, url: str) -> Union[Dict[str, Any], str]:
-        if not url:
+        result = await self.fetch(url)
+        return result if "error" in result else result["data"]
+
+    async def fetch(self, url: str) -> Dict[str, Any]:
+        """GET a URL and return the parsed body with its status, content type and read metadata."""
+        if not url or not url.strip():
             self.logger.error("URL is empty")
             return {"error": "URL cannot be empty"}
+        return await self.request(RequestSpec(url=url))
+
+    async def request(self, spec: RequestSpec) -> Dict[str, Any]:
+        """Send one request; identical concurrent GET/HEAD requests share a single upstream call."""
+        if self.single_flight is None or spec.has_body or spec.method not in ("GET", "HEAD"):
+            return await self._send(spec)
+        key = (spec.method, spec.full_url(), tuple(sorted(spec.headers.items())), spec.raw, spec.select, spec.limit)
+        result = await self.single_flight.run(key, lambda: self._send(spec))
+        return {**result, "meta": dict(result["meta"])} if "meta" in result else dict(result)
+
+    async def request_many(self, specs: List[RequestSpec]) -> List[Dict[str, Any]]:
+        """Send specs concurrently, at most ``max_parallel`` at a time, with results in input order."""
+        slots = asyncio.Semaphore(self.max_parallel)
+
+        async def send(spec: RequestSpec) -> Dict[str, Any]:
+            async with slots:
+                return await self.request(spec)
+
+        self.logger.info(f"Sending batch of {len(specs)} requests, {self.max_parallel} at a time")
+        return list(await asyncio.gather(*(send(spec) for spec in specs)))
+
+    async def run_input(self, text: str) -> Union[Dict[str, Any], List[Any], str]:
+        """Handle tool input: a plain URL, a JSON request spec or a JSON list of specs."""
+        if not text.strip().startswith(("{", "[")):
+            return await self.make_request(text)
+        try:
+            value = json.loads(text)
+            spec = None if isinstance(value, list) else parse_request_input(value)
+        except ValueError as e:
+            self.logger.error(f"Invalid request spec: {str(e)}")
+            return {"error": f"Invalid request spec: {str(e)}"}
+        if spec is None:
+            return await self._request_batch(value)
+        return await self.request(spec)
 
-        self.logger.info(f"Making HTTP request to {url}")
+    async def _request_batch(self, items: List[Any]) -> List[Dict[str, Any]]:
+        """Validate batch items one by one; an invalid item gets an error in its slot and the rest are sent."""
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        specs: Dict[int, RequestSpec] = {}
+        for index, item in enumerate(items):
+            try:
+                specs[index] = parse_request_item(item)
+            except ValueError as e:
+                self.logger.error(f"Invalid request spec at index {index}: {str(e)}")
+                results[index] = {"error": f"Invalid request spec: {str(e)}"}
+        for index, result in zip(specs, await self.request_many(list(specs.values()))):
+            results[index] = result
+        return results
+
+    async def _send(self, spec: RequestSpec) -> Dict[str, Any]:
+        url = spec.full_url()
+        self.logger.info(f"Making HTTP {spec.method} request to {url}")
+        started = time.perf_counter()
         try:
-            async with aiohttp.ClientSession() as session:
-                self.logger.info("Created aiohttp session")
-                async with session.get(url) as response:
-                    self.logger.info(f"Got response with status {response.status}")
-                    content_type = response.headers.get('Content-Type', '')
-                    self.logger.info(f"Content-Type: {content_type}")
-                    
-                    if 'application/json' in content_type:
-                        result = await response.json()
-                        self.logger.info("Successfully parsed JSON response")
-                        return result
-                    else:
-                        result = await response.text()
-                        self.logger.info("Successfully got text response")
-                        return result
+            cache_status = None
+            if self.http_cache is None or spec.method != "GET" or spec.has_body:
+                response = await self._fetch(spec, spec.headers)
+            else:
+                response, cache_status = await self.http_cache.fetch(url, lambda headers: self._fetch(spec, headers), spec.headers)
+                self.logger.info(f"HTTP cache {cache_status} for {url}")
+
+            content_type = next((value for name, value in response.headers.items() if name.lower() == 'content-type'), '')
+            self.logger.info(f"Content-Type: {content_type}")
+            meta = {
+                "bytes_read": response.bytes_read,
+                "truncated": response.truncated,
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+                "cache": cache_status
+            }
+            self.logger.info(f"Read {url}: {meta}")
+            return {
+                "url": url,
+                "final_url": response.url or url,
+                "method": spec.method,
+                "status_code": response.status,
+                "content_type": content_type,
+                "data": parse_body(
+                    response, content_type, url,
+                    reduce_html=self.reduce_html and not spec.raw,
+                    max_text_chars=self.max_text_chars,
+                    max_links=self.max_links,
+                    select=spec.select,
+                    limit=spec.limit
+                ),
+                "meta": meta
+            }
                         
         except aiohttp.ClientError as e:
             self.logger.error(f"HTTP request error: {str(e)}")
-            return {"error": str(e)}
+            return {"error": str(e), "url": url}
         except Exception as e:
             self.logger.error(f"Unexpected error in make_request: {str(e)}")
-            return {"error": str(e)}
+            return {"error": str(e), "url": url}
+
+    async def _fetch(self, spec: RequestSpec, headers: Dict[str, str]) -> HttpResponse:
+        call = lambda: self._fetch_once(spec, headers)
+        admit = (lambda attempt: self.scheduler.run(spec.url, attempt)) if self.scheduler else None
+        if self.retry_policy is not None:
+            return await self.retry_policy.run(spec.method, call, admit, timeout=spec.timeout)
+        return await (admit(call) if admit else call())
+
+    async def _fetch_once(self, spec: RequestSpec, headers: Dict[str, str]) -> HttpResponse:
+        return await self.transport.request(
+            spec.method,
+            spec.full_url(),
+            headers,
+            self.max_body_bytes,
+            self.chunk_size,
+            json_body=spec.json_body,
+            form=spec.form,
+            timeout=spec.timeout
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "session": self.session_pool.get_stats(),
+            "transport": self.transport.get_stats(),
+            "http_cache": self.http_cache.get_stats() if self.http_cache else None,
+            "retries": self.retry_policy.get_stats() if self.retry_policy else None,
+            "single_flight": self.single_flight.get_stats() if self.single_flight else None
+        }
+
+    async def aclose(self) -> None:
+        await self.transport.close()
+        await self.session_pool.close()
 
     async def _arun(
         self,
@@ -55,11 +194,11 @@ class HttpTool(BaseTool):
         **kwargs: Any
     ) -> Union[Dict[str, Any], str]:
         try:
-            result = await self.make_request(url)
+            result = await self.run_input(url)
             
             if run_manager:
                 try:
-                    output = str(result) if isinstance(result, str) else str(result.get("error", result))
+                    output = str(result.get("error", result)) if isinstance(result, dict) else str(result)
                     await run_manager.on_tool_end(
                         output=output,
                         tool_input=url,
@@ -0,0 +1,209 @@
+"""Private HTTP response cache following RFC 9111 freshness, validation and Vary rules."""
+import time
+import logging
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
+from urllib.parse import urldefrag
+import aiohttp
+from src.tools.cache_store import CacheStore
+from src.tools.http_stream import HttpResponse
+
+logger = logging.getLogger(__name__)
+
+HEURISTICALLY_CACHEABLE = {200, 203, 204, 300, 301, 308, 404, 405, 410, 414, 501}
+HEURISTIC_FRACTION = 0.1
+HEURISTIC_MAX_SECONDS = 24 * 3600
+MAX_VARIANTS = 8
+BODY_HEADERS = {"content-length", "content-type", "content-encoding", "transfer-encoding"}
+
+Fetcher = Callable[[Dict[str, str]], Awaitable[HttpResponse]]
+
+class OfflineCacheMiss(Exception):
+    """Raised in offline mode when a URL has no stored response."""
+
+def parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    directives: Dict[str, Optional[str]] = {}
+    for part in (value or "").split(","):
+        name, _, argument = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') if argument else None
+    return directives
+
+def parse_http_date(value: Optional[str]) -> Optional[float]:
+    try:
+        return parsedate_to_datetime(value).timestamp() if value else None
+    except (TypeError, ValueError):
+        return None
+
+def _seconds(value: Optional[str]) -> Optional[float]:
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+class HttpCache:
+    """Memory LRU with an optional disk tier for GET responses.
+
+    ``default_ttl`` gives a freshness lifetime to responses that carry no
+    explicit one (no ``max-age`` or ``Expires``). In ``offline`` mode stored
+    responses are served regardless of age and the network is never used.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        disk_path: Optional[Union[str, Path]] = None,
+        default_ttl: Optional[float] = None,
+        offline: bool = False
+    ):
+        self.default_ttl = default_ttl
+        self.offline = offline
+        self._store = CacheStore(max_entries=max_entries, disk_path=disk_path)
+        self._stats = {"hits": 0, "misses": 0, "revalidated": 0, "stale": 0, "stored": 0}
+
+    async def fetch(
+        self,
+        url: str,
+        fetcher: Fetcher,
+        request_headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[HttpResponse, str]:
+        """Return a response and how it was served: hit, stale, revalidated or miss."""
+        request_headers = _lower(request_headers or {})
+        key = urldefrag(url).url
+        entry = self._lookup(key, request_headers)
+
+        if entry is not None and (self.offline or self.is_fresh(entry)):
+            status = "hit" if self.is_fresh(entry) else "stale"
+            return self._served(entry, status)
+        if self.offline:
+            raise OfflineCacheMiss(f"{url} is not cached and offline mode is enabled")
+
+        try:
+            response = await fetcher({**request_headers, **(self.validators(entry) if entry else {})})
+        except aiohttp.ClientError:
+            if entry is None or not self.may_serve_stale(entry):
+                raise
+            logger.warning(f"Serving stale {url} after a network error")
+            return self._served(entry, "stale")
+
+        if response.status == 304 and entry is not None:
+            refreshed = self._merge_headers(entry, response.headers)
+            self._save(key, refreshed)
+            return self._served(refreshed, "revalidated")
+
+        self._stats["misses"] += 1
+        if not response.truncated:
+            self.store(key, request_headers, response.status, response.headers, response.body, response.url)
+        return response, "miss"
+
+    def is_fresh(self, entry: Dict[str, Any], now: Optional[float] = None) -> bool:
+        if "no-cache" in parse_cache_control(entry["headers"].get("cache-control")):
+            return False
+        return self.freshness_lifetime(entry) > self.current_age(entry, now)
+
+    def may_serve_stale(self, entry: Dict[str, Any]) -> bool:
+        """Whether a stale entry may stand in for an unreachable origin (RFC 9111 section 4.2.4)."""
+        directives = parse_cache_control(entry["headers"].get("cache-control"))
+        return "must-revalidate" not in directives and "no-cache" not in directives
+
+    def freshness_lifetime(self, entry: Dict[str, Any]) -> float:
+        headers = entry["headers"]
+        directives = parse_cache_control(headers.get("cache-control"))
+        max_age = _seconds(directives.get("max-age")) if "max-age" in directives else None
+        if max_age is not None:
+            return max_age
+        date = parse_http_date(headers.get("date")) or entry["stored_at"]
+        if "expires" in headers:
+            expires = parse_http_date(headers["expires"])
+            return max(0.0, expires - date) if expires is not None else 0.0
+        if self.default_ttl is not None:
+            return self.default_ttl
+        last_modified = parse_http_date(headers.get("last-modified"))
+        if last_modified is not None and entry["status"] in HEURISTICALLY_CACHEABLE:
+            return min(HEURISTIC_MAX_SECONDS, max(0.0, date - last_modified) * HEURISTIC_FRACTION)
+        return 0.0
+
+    def current_age(self, entry: Dict[str, Any], now: Optional[float] = None) -> float:
+        now = time.time() if now is None else now
+        headers = entry["headers"]
+        date = parse_http_date(headers.get("date"))
+        apparent_age = max(0.0, entry["stored_at"] - date) if date is not None else 0.0
+        initial_age = max(apparent_age, _seconds(headers.get("age")) or 0.0)
+        return initial_age + max(0.0, now - entry["stored_at"])
+
+    def validators(self, entry: Dict[str, Any]) -> Dict[str, str]:
+        conditional = {}
+        if entry["headers"].get("etag"):
+            conditional["If-None-Match"] = entry["headers"]["etag"]
+        if entry["headers"].get("last-modified"):
+            conditional["If-Modified-Since"] = entry["headers"]["last-modified"]
+        return conditional
+
+    def store(
+        self,
+        key: str,
+        request_headers: Dict[str, str],
+        status: int,
+        headers: Dict[str, str],
+        body: str,
+        url: Optional[str] = None
+    ) -> bool:
+        headers = _lower(headers)
+        directives = parse_cache_control(headers.get("cache-control"))
+        vary = [name.strip().lower() for name in headers.get("vary", "").split(",") if name.strip()]
+        explicit = "max-age" in directives or "expires" in headers
+        if "no-store" in directives or "*" in vary:
+            return False
+        if status not in HEURISTICALLY_CACHEABLE and not explicit:
+            return False
+
+        entry = {
+            "status": status,
+            "headers": headers,
+            "body": body,
+            "url": url,
+            "stored_at": time.time(),
+            "vary": {name: request_headers.get(name, "") for name in vary},
+        }
+        if self.freshness_lifetime(entry) <= 0 and not self.validators(entry):
+            return False
+        self._save(key, entry)
+        self._stats["stored"] += 1
+        return True
+
+    def _lookup(self, key: str, request_headers: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        for entry in (self._store.get(key) or {}).get("variants", []):
+            if all(request_headers.get(name, "") == value for name, value in entry["vary"].items()):
+                return entry
+        return None
+
+    def _save(self, key: str, entry: Dict[str, Any]) -> None:
+        variants = [
+            variant for variant in (self._store.get(key) or {}).get("variants", [])
+            if variant["vary"] != entry["vary"]
+        ]
+        self._store.set(key, {"variants": [entry] + variants[:MAX_VARIANTS - 1]})
+
+    def _merge_headers(self, entry: Dict[str, Any], headers: Dict[str, str]) -> Dict[str, Any]:
+        updated = {name: value for name, value in _lower(headers).items() if name not in BODY_HEADERS}
+        return {**entry, "headers": {**entry["headers"], **updated}, "stored_at": time.time()}
+
+    def _served(self, entry: Dict[str, Any], status: str) -> Tuple[HttpResponse, str]:
+        self._stats["hits" if status == "hit" else status] += 1
+        body = entry["body"]
+        return HttpResponse(
+            entry["status"], entry["headers"], body, len(body.encode("utf-8")), url=entry.get("url")
+        ), status
+
+    def get_stats(self) -> Dict[str, Any]:
+        served = self._stats["hits"] + self._stats["revalidated"] + self._stats["stale"]
+        lookups = served + self._stats["misses"]
+        return {
+            **self._stats,
+            "entries": len(self._store),
+            "hit_rate": round(served / lookups, 3) if lookups else 0.0
+        }
+
+def _lower(headers: Dict[str, str]) -> Dict[str, str]:
+    return {name.lower(): value for name, value in headers.items()}
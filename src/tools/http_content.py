@@ -0,0 +1,58 @@
+"""Content-type aware processing of HTTP response bodies."""
+import json
+import logging
+from typing import Any, Dict, List, Optional, Union
+from src.tools.extraction import summarize_html
+from src.tools.http_stream import HttpResponse, media_type
+from src.tools.json_projection import project_json
+
+logger = logging.getLogger(__name__)
+
+HTML_TYPES = {"text/html", "application/xhtml+xml"}
+
+def parse_body(
+    response: HttpResponse,
+    content_type: str,
+    url: str,
+    reduce_html: bool = True,
+    max_text_chars: Optional[int] = None,
+    max_links: int = 50,
+    select: Optional[str] = None,
+    limit: Optional[int] = None
+) -> Union[Dict[str, Any], List[Any], str]:
+    """Reduce HTML to text and links, decode and optionally project JSON, and return other bodies as text."""
+    if reduce_html and media_type(content_type) in HTML_TYPES:
+        return reduce_html_body(response, url, max_text_chars, max_links)
+    if response.truncated:
+        logger.warning(f"Response body truncated at {response.bytes_read} bytes")
+        return response.body + f"\n[Response truncated at {response.bytes_read} bytes]"
+    if 'application/json' in content_type:
+        result = json.loads(response.body)
+        logger.info("Successfully parsed JSON response")
+        if select is None and limit is None:
+            return result
+        projection = project_json(result, select, limit, source_chars=len(response.body))
+        logger.info(f"Projected JSON with {select!r}: {projection['result_chars']} of {len(response.body)} characters")
+        return projection
+    logger.info("Successfully got text response")
+    return response.body
+
+def reduce_html_body(
+    response: HttpResponse,
+    url: str,
+    max_text_chars: Optional[int] = None,
+    max_links: int = 50
+) -> Dict[str, Any]:
+    summary = summarize_html(response.body, max_text_chars, max_links, base_url=response.url or url)
+    text = summary.extraction.text
+    ratio = round(len(response.body) / len(text), 1) if text else None
+    logger.info(f"Reduced {len(response.body)} characters of HTML to {len(text)} of text ({ratio}x)")
+    return {
+        "title": summary.title,
+        "text": text,
+        "links": summary.links,
+        "truncated": response.truncated or summary.extraction.truncated,
+        "html_chars": len(response.body),
+        "text_chars": summary.extraction.text_chars,
+        "reduction_ratio": ratio
+    }
@@ -0,0 +1,195 @@
+"""Retries with jittered backoff and hedged duplicates for idempotent HTTP requests."""
+import time
+import asyncio
+import logging
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, Optional
+import aiohttp
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    retry_if_exception,
+    retry_if_result,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+from src.tools.http_stream import HttpResponse
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"}
+RETRY_STATUSES = {408, 425, 429, 500, 502, 503, 504}
+
+# connection drops, truncated bodies and timeouts may succeed on another try;
+# a malformed URL or an untrusted certificate never will
+TRANSIENT_ERRORS = (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError)
+PERMANENT_ERRORS = (aiohttp.InvalidURL, aiohttp.ClientConnectorCertificateError, ValueError)
+
+Call = Callable[[], Awaitable[HttpResponse]]
+Admit = Callable[[Call], Awaitable[HttpResponse]]
+
+def is_transient_error(error: BaseException) -> bool:
+    return isinstance(error, TRANSIENT_ERRORS) and not isinstance(error, PERMANENT_ERRORS)
+
+def retry_after_seconds(headers: Dict[str, str], now: Optional[float] = None) -> Optional[float]:
+    value = next((v for k, v in headers.items() if k.lower() == "retry-after"), None)
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - (time.time() if now is None else now))
+    except (TypeError, ValueError):
+        return None
+
+class RetryPolicy:
+    """Per-attempt timeouts, retries and optional hedging around one HTTP call.
+
+    Only idempotent methods are retried or hedged. Transient statuses and
+    connection, payload and timeout errors are retried with full-jitter exponential backoff, or after
+    the server's ``Retry-After`` when it is no longer than ``max_retry_after``.
+    With ``hedge=True`` a duplicate request is sent once the first has been
+    outstanding for the observed p95 latency, and whichever finishes first wins.
+    ``admit`` wraps every attempt, hedges included, e.g. in a host scheduler
+    slot; time spent waiting there counts towards neither the attempt timeout
+    nor the latency samples. A ``timeout`` passed to ``run`` replaces
+    ``attempt_timeout`` for that request.
+    """
+
+    def __init__(
+        self,
+        attempts: int = 3,
+        attempt_timeout: float = 15.0,
+        backoff_base: float = 0.25,
+        backoff_max: float = 8.0,
+        max_retry_after: float = 30.0,
+        retry_statuses: Iterable[int] = RETRY_STATUSES,
+        hedge: bool = False,
+        hedge_min_samples: int = 20,
+        latency_window: int = 200
+    ):
+        self.attempts = attempts
+        self.attempt_timeout = attempt_timeout
+        self.max_retry_after = max_retry_after
+        self.retry_statuses = set(retry_statuses)
+        self.hedge = hedge
+        self.hedge_min_samples = hedge_min_samples
+        self._backoff = wait_random_exponential(multiplier=backoff_base, max=backoff_max)
+        self._latencies: Deque[float] = deque(maxlen=latency_window)
+        self._stats = {"requests": 0, "attempts": 0, "retries": 0, "timeouts": 0, "gave_up": 0, "hedged": 0, "hedge_wins": 0}
+
+    async def run(
+        self,
+        method: str,
+        call: Call,
+        admit: Optional[Admit] = None,
+        timeout: Optional[float] = None
+    ) -> HttpResponse:
+        self._stats["requests"] += 1
+        timeout = timeout or self.attempt_timeout
+        if method.upper() not in IDEMPOTENT_METHODS:
+            return await self._attempt(call, admit, timeout)
+
+        retrying = AsyncRetrying(
+            stop=self._stop,
+            wait=self._wait,
+            retry=retry_if_exception(is_transient_error) | retry_if_result(self._retryable),
+            before_sleep=self._before_sleep,
+            retry_error_callback=self._give_up,
+        )
+        return await retrying(self._hedged, call, admit, timeout)
+
+    def _retryable(self, response: HttpResponse) -> bool:
+        return response.status in self.retry_statuses
+
+    def _stop(self, state: RetryCallState) -> bool:
+        if stop_after_attempt(self.attempts)(state):
+            return True
+        if state.outcome.failed:
+            return False
+        delay = retry_after_seconds(state.outcome.result().headers)
+        return delay is not None and delay > self.max_retry_after
+
+    def _wait(self, state: RetryCallState) -> float:
+        if not state.outcome.failed:
+            delay = retry_after_seconds(state.outcome.result().headers)
+            if delay is not None:
+                return delay
+        return self._backoff(state)
+
+    def _before_sleep(self, state: RetryCallState) -> None:
+        self._stats["retries"] += 1
+        outcome = state.outcome
+        reason = outcome.exception() if outcome.failed else f"status {outcome.result().status}"
+        logger.warning(f"Retrying request after {reason} (attempt {state.attempt_number}/{self.attempts})")
+
+    def _give_up(self, state: RetryCallState) -> HttpResponse:
+        self._stats["gave_up"] += 1
+        return state.outcome.result()
+
+    async def _attempt(self, call: Call, admit: Optional[Admit], timeout: float) -> HttpResponse:
+        if admit is not None:
+            return await admit(lambda: self._timed(call, timeout))
+        return await self._timed(call, timeout)
+
+    async def _timed(self, call: Call, timeout: float) -> HttpResponse:
+        self._stats["attempts"] += 1
+        started = time.perf_counter()
+        try:
+            response = await asyncio.wait_for(call(), timeout)
+        except asyncio.TimeoutError:
+            self._stats["timeouts"] += 1
+            raise aiohttp.ServerTimeoutError(f"Request timed out after {timeout}s")
+        self._latencies.append(time.perf_counter() - started)
+        return response
+
+    def _p95(self) -> Optional[float]:
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+    def hedge_delay(self) -> Optional[float]:
+        if not self.hedge or len(self._latencies) < self.hedge_min_samples:
+            return None
+        return self._p95()
+
+    async def _hedged(self, call: Call, admit: Optional[Admit], timeout: float) -> HttpResponse:
+        delay = self.hedge_delay()
+        if delay is None:
+            return await self._attempt(call, admit, timeout)
+
+        primary = asyncio.create_task(self._attempt(call, admit, timeout))
+        pending = {primary}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if done:
+                return primary.result()
+
+            self._stats["hedged"] += 1
+            hedge = asyncio.create_task(self._attempt(call, admit, timeout))
+            pending.add(hedge)
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self._stats["hedge_wins"] += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def get_stats(self) -> Dict[str, Any]:
+        p95, delay = self._p95(), self.hedge_delay()
+        return {
+            **self._stats,
+            "p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+            "hedge_delay_ms": round(delay * 1000, 1) if delay is not None else None
+        }
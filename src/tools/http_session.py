@@ -0,0 +1,107 @@
+"""Long-lived aiohttp session shared by the HTTP tools."""
+import asyncio
+import logging
+import aiohttp
+from types import SimpleNamespace
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+class HttpSessionPool:
+    """Lazily created ``ClientSession`` with a keep-alive connector and reuse statistics.
+
+    The session is bound to the event loop that first uses it; if a different
+    loop asks for it later the old session is closed and a fresh one created.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        ttl_dns_cache: int = 300,
+        keepalive_timeout: float = 30.0,
+        total_timeout: float = 30.0,
+        connect_timeout: float = 10.0
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.ttl_dns_cache = ttl_dns_cache
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = aiohttp.ClientTimeout(total=total_timeout, connect=connect_timeout)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stats = {
+            "requests": 0,
+            "connections_opened": 0,
+            "connections_reused": 0,
+            "dns_cache_hits": 0,
+            "dns_cache_misses": 0,
+        }
+
+    async def session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            if self._session is not None and not self._session.closed:
+                await self._close_stale(self._session, self._loop)
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.ttl_dns_cache,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self.timeout,
+                trace_configs=[self._trace_config()]
+            )
+            self._loop = loop
+            logger.info("Opened pooled HTTP session")
+        return self._session
+
+    async def _close_stale(self, session: aiohttp.ClientSession, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        """Close a session left behind by another event loop, on that loop if it is still running."""
+        if loop is not None and loop.is_running() and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+            return
+        try:
+            await session.close()
+        except RuntimeError as e:
+            logger.warning(f"Detaching HTTP session from a closed event loop: {str(e)}")
+            session.detach()
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+        counters = [
+            (trace_config.on_request_start, "requests"),
+            (trace_config.on_connection_create_end, "connections_opened"),
+            (trace_config.on_connection_reuseconn, "connections_reused"),
+            (trace_config.on_dns_cache_hit, "dns_cache_hits"),
+            (trace_config.on_dns_cache_miss, "dns_cache_misses"),
+        ]
+        for signal, counter in counters:
+            signal.append(self._counter(counter))
+        return trace_config
+
+    def _counter(self, name: str):
+        async def count(session: aiohttp.ClientSession, context: SimpleNamespace, params: Any) -> None:
+            self._stats[name] += 1
+        return count
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> "HttpSessionPool":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        connections = self._stats["connections_opened"] + self._stats["connections_reused"]
+        return {
+            **self._stats,
+            "reuse_rate": round(self._stats["connections_reused"] / connections, 3) if connections else 0.0,
+            "open": self._session is not None and not self._session.closed
+        }
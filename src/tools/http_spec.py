@@ -0,0 +1,93 @@
+"""Structured HTTP request specs accepted by the HTTP tool."""
+import json
+from typing import Any, Dict, List, Optional, Union
+from yarl import URL
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from src.tools.json_projection import compile_projection
+
+METHODS = {"GET", "HEAD", "OPTIONS", "POST", "PUT", "PATCH", "DELETE"}
+
+class RequestSpec(BaseModel):
+    """One HTTP request: method, URL, headers, query, JSON or form body and timeout.
+
+    ``raw`` returns HTML bodies as they are instead of reducing them to text.
+    ``select`` and ``limit`` project JSON bodies (see ``json_projection``).
+    """
+
+    model_config = ConfigDict(populate_by_name=True, extra="forbid")
+
+    url: str
+    method: str = "GET"
+    headers: Dict[str, str] = Field(default_factory=dict)
+    query: Dict[str, Union[str, int, float, bool]] = Field(default_factory=dict)
+    json_body: Optional[Any] = Field(default=None, alias="json")
+    form: Optional[Dict[str, str]] = None
+    timeout: Optional[float] = Field(default=None, gt=0)
+    raw: bool = False
+    select: Optional[str] = None
+    limit: Optional[int] = Field(default=None, gt=0)
+
+    @field_validator("url")
+    @classmethod
+    def _add_scheme(cls, url: str) -> str:
+        url = url.strip()
+        if not url:
+            raise ValueError("URL cannot be empty")
+        if not url.lower().startswith(("http://", "https://")):
+            url = "https://" + url.lstrip("/")
+        return url
+
+    @field_validator("method")
+    @classmethod
+    def _known_method(cls, method: str) -> str:
+        method = method.upper()
+        if method not in METHODS:
+            raise ValueError(f"Unsupported method {method}, expected one of {sorted(METHODS)}")
+        return method
+
+    @field_validator("select")
+    @classmethod
+    def _valid_projection(cls, select: Optional[str]) -> Optional[str]:
+        if select is not None:
+            compile_projection(select)
+        return select
+
+    @model_validator(mode="after")
+    def _single_body(self) -> "RequestSpec":
+        if self.json_body is not None and self.form is not None:
+            raise ValueError("Use either json or form, not both")
+        return self
+
+    @property
+    def has_body(self) -> bool:
+        return self.json_body is not None or self.form is not None
+
+    def full_url(self) -> str:
+        """The URL with ``query`` merged into its query string."""
+        if not self.query:
+            return self.url
+        params = {name: str(value).lower() if isinstance(value, bool) else str(value) for name, value in self.query.items()}
+        return str(URL(self.url).update_query(params))
+
+def parse_request_input(value: Union[str, Dict[str, Any], List[Any]]) -> Union[RequestSpec, List[RequestSpec]]:
+    """Turn tool input into specs: a plain URL, a JSON object or a JSON list of objects/URLs.
+
+    Raises ``ValueError`` (including pydantic's ``ValidationError``) for malformed input.
+    """
+    if isinstance(value, str):
+        text = value.strip()
+        value = json.loads(text) if text.startswith(("{", "[")) else text
+    if isinstance(value, list):
+        return [parse_request_item(item) for item in value]
+    return _spec(value)
+
+def parse_request_item(value: Union[str, Dict[str, Any], RequestSpec]) -> RequestSpec:
+    """Turn one batch item, a URL or a request object, into a spec; raises ``ValueError`` otherwise."""
+    return value if isinstance(value, RequestSpec) else _spec(value)
+
+def _spec(value: Union[str, Dict[str, Any]]) -> RequestSpec:
+    if isinstance(value, str):
+        return RequestSpec(url=value)
+    if isinstance(value, dict):
+        return RequestSpec.model_validate(value)
+    raise ValueError(f"Expected a URL or a request object, got {type(value).__name__}")
@@ -0,0 +1,90 @@
+"""Bounded, streamed reading of HTTP response bodies."""
+import codecs
+import aiohttp
+from typing import AsyncIterator, Dict, NamedTuple, Optional
+
+BINARY_TYPE_PREFIXES = ("image/", "audio/", "video/", "font/")
+BINARY_TYPES = {
+    "application/octet-stream",
+    "application/pdf",
+    "application/zip",
+    "application/gzip",
+    "application/x-tar",
+    "application/x-7z-compressed",
+    "application/vnd.ms-excel",
+    "application/msword",
+    "application/wasm",
+}
+
+class HttpResponse(NamedTuple):
+    status: int
+    headers: Dict[str, str]
+    body: str
+    bytes_read: int = 0
+    truncated: bool = False
+    url: Optional[str] = None
+
+class BinaryContentError(Exception):
+    """Raised instead of downloading a body whose content type is not text."""
+
+def media_type(content_type: Optional[str]) -> str:
+    return (content_type or "").split(";", 1)[0].strip().lower()
+
+def is_binary(content_type: Optional[str]) -> bool:
+    kind = media_type(content_type)
+    return kind in BINARY_TYPES or kind.startswith(BINARY_TYPE_PREFIXES)
+
+def _decoder(charset: Optional[str]) -> codecs.IncrementalDecoder:
+    try:
+        return codecs.getincrementaldecoder(charset or "utf-8")(errors="replace")
+    except LookupError:
+        return codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+async def read_body(
+    status: int,
+    headers: Dict[str, str],
+    charset: Optional[str],
+    chunks: AsyncIterator[bytes],
+    max_bytes: int,
+    url: Optional[str] = None
+) -> HttpResponse:
+    """Read at most ``max_bytes`` from ``chunks``, decoding them as they arrive.
+    ``url`` is the final URL after redirects.
+
+    Binary content types are rejected before any of the body is read. When the
+    cap is hit the rest of the body is left unread and the connection is dropped.
+    """
+    content_type = next((value for name, value in headers.items() if name.lower() == "content-type"), None)
+    if is_binary(content_type):
+        size = next((value for name, value in headers.items() if name.lower() == "content-length"), "unknown")
+        raise BinaryContentError(f"Not downloading binary content ({media_type(content_type)}, {size} bytes)")
+
+    decoder = _decoder(charset)
+    parts = []
+    bytes_read = 0
+    truncated = False
+    async for chunk in chunks:
+        if bytes_read + len(chunk) > max_bytes:
+            chunk = chunk[:max_bytes - bytes_read]
+            truncated = True
+        bytes_read += len(chunk)
+        parts.append(decoder.decode(chunk))
+        if truncated:
+            break
+    parts.append(decoder.decode(b"", final=not truncated))
+    return HttpResponse(status, headers, "".join(parts), bytes_read, truncated, url)
+
+async def read_response(
+    response: aiohttp.ClientResponse,
+    max_bytes: int,
+    chunk_size: int = 64 * 1024
+) -> HttpResponse:
+    """Bounded read of an aiohttp response body; see ``read_body``."""
+    return await read_body(
+        response.status,
+        dict(response.headers),
+        response.charset,
+        response.content.iter_chunked(chunk_size),
+        max_bytes,
+        url=str(response.url)
+    )
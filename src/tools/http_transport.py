@@ -0,0 +1,173 @@
+"""Interchangeable client backends for the HTTP tool: aiohttp (HTTP/1.1) and httpx (HTTP/2)."""
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import Any, Dict, Optional
+import aiohttp
+import httpx
+from src.tools.http_session import HttpSessionPool
+from src.tools.http_stream import HttpResponse, read_body, read_response
+
+logger = logging.getLogger(__name__)
+
+class HttpTransport(ABC):
+    """Sends one request and returns its bounded, decoded body.
+
+    Connection failures are raised as ``aiohttp.ClientError`` whatever the
+    backend, so retries, the response cache and the tool's error results behave
+    the same for every transport.
+    """
+
+    name: str = ""
+
+    @abstractmethod
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        max_bytes: int,
+        chunk_size: int,
+        json_body: Optional[Any] = None,
+        form: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None
+    ) -> HttpResponse:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {}
+
+class AiohttpTransport(HttpTransport):
+    """HTTP/1.1 over the pooled aiohttp session."""
+
+    name = "aiohttp"
+
+    def __init__(self, session_pool: HttpSessionPool):
+        self.session_pool = session_pool
+
+    async def request(self, method, url, headers, max_bytes, chunk_size, json_body=None, form=None, timeout=None) -> HttpResponse:
+        session = await self.session_pool.session()
+        options: Dict[str, Any] = {"headers": headers}
+        if json_body is not None:
+            options["json"] = json_body
+        if form is not None:
+            options["data"] = form
+        if timeout:
+            options["timeout"] = aiohttp.ClientTimeout(total=timeout)
+        async with session.request(method, url, **options) as response:
+            logger.info(f"Got response with status {response.status}")
+            return await read_response(response, max_bytes, chunk_size)
+
+    async def close(self) -> None:
+        await self.session_pool.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"name": self.name, **self.session_pool.get_stats()}
+
+class HttpxTransport(HttpTransport):
+    """httpx client that multiplexes concurrent requests to a host over one HTTP/2 connection.
+
+    HTTP/2 is negotiated through TLS ALPN, so plain ``http://`` URLs fall back to
+    HTTP/1.1 unless ``http1=False`` (HTTP/2 with prior knowledge). Needs the
+    ``h2`` package (``httpx[http2]``). Like ``HttpSessionPool`` the client is
+    bound to the event loop that first uses it.
+    """
+
+    name = "httpx"
+
+    def __init__(
+        self,
+        http2: bool = True,
+        http1: bool = True,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        total_timeout: float = 30.0,
+        connect_timeout: float = 10.0
+    ):
+        self.http2 = http2
+        self.http1 = http1
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.timeout = httpx.Timeout(total_timeout, connect=connect_timeout)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._versions: Counter = Counter()
+        self._stats = {"requests": 0, "errors": 0}
+
+    async def client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            if self._client is not None and not self._client.is_closed:
+                await self._close_stale(self._client, self._loop)
+            self._client = httpx.AsyncClient(
+                http1=self.http1,
+                http2=self.http2,
+                limits=self.limits,
+                timeout=self.timeout,
+                follow_redirects=True
+            )
+            self._loop = loop
+            logger.info(f"Opened httpx client (http2={self.http2}, http1={self.http1})")
+        return self._client
+
+    async def _close_stale(self, client: httpx.AsyncClient, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        """Close a client left behind by another event loop, on that loop if it is still running."""
+        if loop is not None and loop.is_running() and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            return
+        try:
+            await client.aclose()
+        except RuntimeError as e:
+            logger.warning(f"Dropping httpx client bound to a closed event loop: {str(e)}")
+
+    async def request(self, method, url, headers, max_bytes, chunk_size, json_body=None, form=None, timeout=None) -> HttpResponse:
+        options: Dict[str, Any] = {"headers": headers}
+        if json_body is not None:
+            options["json"] = json_body
+        if form is not None:
+            options["data"] = form
+        if timeout:
+            options["timeout"] = httpx.Timeout(timeout)
+        self._stats["requests"] += 1
+        try:
+            async with (await self.client()).stream(method, url, **options) as response:
+                self._versions[response.http_version] += 1
+                logger.info(f"Got {response.http_version} response with status {response.status_code}")
+                return await read_body(
+                    response.status_code,
+                    dict(response.headers),
+                    response.charset_encoding,
+                    response.aiter_bytes(chunk_size),
+                    max_bytes,
+                    url=str(response.url)
+                )
+        except httpx.TimeoutException as e:
+            self._stats["errors"] += 1
+            raise aiohttp.ServerTimeoutError(f"Request to {url} timed out: {e}") from e
+        except httpx.UnsupportedProtocol as e:
+            self._stats["errors"] += 1
+            raise aiohttp.InvalidURL(url) from e
+        except httpx.TransportError as e:
+            self._stats["errors"] += 1
+            raise aiohttp.ClientConnectionError(f"Request to {url} failed: {e}") from e
+
+    async def close(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            **self._stats,
+            "http_versions": dict(self._versions),
+            "open": self._client is not None and not self._client.is_closed
+        }
@@ -0,0 +1,183 @@
+"""Small JSONPath/JMESPath-like projections that trim JSON documents to the fields a caller needs.
+
+Expressions are a path of steps, optionally starting with ``$``::
+
+    items                      a field
+    items[0], items[-1]        an index
+    items[0:10], items[*]      a slice or every element; later steps apply to each
+    items[*].owner.login       nested fields of every element
+    ["odd key"], data.*        quoted field names, every value of an object
+    items[*].{id, name, who: owner.login}
+                               a field set, keyed by the last field name or an alias
+
+A field or field set applied to a list applies to each element, so
+``items.name`` and ``items[*].name`` are the same. Missing values are
+``None`` and are dropped from lists built by projecting.
+"""
+import json
+import re
+from functools import lru_cache
+from typing import Any, Optional, Tuple
+
+NAME = re.compile(r"[A-Za-z_][\w\-]*")
+INDEX = re.compile(r"\s*(-?\d*)\s*(?::\s*(-?\d*)\s*)?(?::\s*(-?\d*)\s*)?\]")
+
+Step = Tuple[str, Any]
+
+class ProjectionError(ValueError):
+    """Raised for an expression that cannot be parsed."""
+
+class _Parser:
+    def __init__(self, text: str):
+        self.text = text
+        self.pos = 0
+
+    def peek(self) -> str:
+        while self.pos < len(self.text) and self.text[self.pos].isspace():
+            self.pos += 1
+        return self.text[self.pos] if self.pos < len(self.text) else ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            self.fail(f"expected '{char}'")
+        self.pos += 1
+
+    def fail(self, message: str) -> None:
+        raise ProjectionError(f"Invalid projection {self.text!r} at position {self.pos}: {message}")
+
+    def path(self) -> Tuple[Step, ...]:
+        steps = []
+        if self.peek() == "$":
+            self.pos += 1
+        while True:
+            char = self.peek()
+            if char == ".":
+                self.pos += 1
+                after = self.peek()
+                if after == "*":
+                    self.pos += 1
+                    steps.append(("wildcard", None))
+                elif after == "{":
+                    steps.append(self.field_set())
+                else:
+                    steps.append(("field", self.name()))
+            elif char == "[":
+                steps.append(self.bracket())
+            elif char == "{":
+                steps.append(self.field_set())
+            elif not steps and char == "*":
+                self.pos += 1
+                steps.append(("wildcard", None))
+            elif not steps and NAME.match(self.text, self.pos):
+                steps.append(("field", self.name()))
+            else:
+                return tuple(steps)
+
+    def name(self) -> str:
+        match = NAME.match(self.text, self.pos)
+        if not match:
+            self.fail("expected a field name")
+        self.pos = match.end()
+        return match.group()
+
+    def bracket(self) -> Step:
+        self.expect("[")
+        char = self.peek()
+        if char in ("*", "]"):
+            self.pos += 1 if char == "*" else 0
+            self.expect("]")
+            return ("wildcard", None)
+        if char in ("'", '"'):
+            end = self.text.find(char, self.pos + 1)
+            if end < 0:
+                self.fail("unterminated string")
+            name = self.text[self.pos + 1:end]
+            self.pos = end + 1
+            self.expect("]")
+            return ("field", name)
+        match = INDEX.match(self.text, self.pos)
+        if not match or match.group() == "]":
+            self.fail("expected an index, slice, '*' or quoted name")
+        self.pos = match.end()
+        start, stop, step = match.groups()
+        if stop is None and step is None:
+            return ("index", int(start))
+        numbers = [int(value) if value else None for value in (start, stop, step)]
+        if numbers[2] == 0:
+            self.fail("slice step cannot be zero")
+        return ("slice", tuple(numbers))
+
+    def field_set(self) -> Step:
+        self.expect("{")
+        fields = []
+        while True:
+            started = self.pos
+            steps = self.path()
+            if self.peek() == ":":
+                if len(steps) != 1 or steps[0][0] != "field":
+                    self.fail("an alias must be a plain name")
+                self.pos += 1
+                alias, steps = steps[0][1], self.path()
+            else:
+                names = [arg for kind, arg in steps if kind == "field"]
+                alias = names[-1] if names else self.text[started:self.pos].strip()
+            if not steps:
+                self.fail("expected a field")
+            fields.append((alias, steps))
+            if self.peek() == "}":
+                self.pos += 1
+                return ("select", tuple(fields))
+            self.expect(",")
+
+@lru_cache(maxsize=256)
+def compile_projection(expression: str) -> Tuple[Step, ...]:
+    parser = _Parser(expression)
+    steps = parser.path()
+    if parser.peek():
+        parser.fail("unexpected character")
+    return steps
+
+def apply_projection(value: Any, steps: Tuple[Step, ...]) -> Any:
+    for position, (kind, arg) in enumerate(steps):
+        if value is None:
+            return None
+        if isinstance(value, list) and kind in ("field", "select"):
+            return _each(value, steps[position:])
+        if kind == "field":
+            value = value.get(arg) if isinstance(value, dict) else None
+        elif kind == "index":
+            value = value[arg] if isinstance(value, list) and -len(value) <= arg < len(value) else None
+        elif kind == "slice":
+            return _each(value[slice(*arg)], steps[position + 1:]) if isinstance(value, list) else None
+        elif kind == "wildcard":
+            items = value if isinstance(value, list) else list(value.values()) if isinstance(value, dict) else None
+            return None if items is None else _each(items, steps[position + 1:])
+        else:
+            value = {alias: apply_projection(value, path) for alias, path in arg}
+    return value
+
+def _each(items: list, steps: Tuple[Step, ...]) -> list:
+    results = (apply_projection(item, steps) for item in items)
+    return [result for result in results if result is not None]
+
+def project_json(
+    data: Any,
+    select: Optional[str] = None,
+    limit: Optional[int] = None,
+    source_chars: Optional[int] = None
+) -> dict:
+    """Apply ``select`` and keep at most ``limit`` rows of a list result, with size metadata."""
+    result = apply_projection(data, compile_projection(select)) if select else data
+    total_rows = len(result) if isinstance(result, list) else None
+    if limit is not None and isinstance(result, list):
+        result = result[:limit]
+    result_chars = len(json.dumps(result, separators=(",", ":"), default=str))
+    return {
+        "select": select,
+        "result": result,
+        "rows": len(result) if isinstance(result, list) else None,
+        "total_rows": total_rows,
+        "json_chars": source_chars,
+        "result_chars": result_chars,
+        "reduction_ratio": round(source_chars / result_chars, 1) if source_chars and result_chars else None
+    }
@@ -0,0 +1,147 @@
+"""Cache of extracted page content with per-domain TTLs and HEAD revalidation."""
+import time
+import logging
+import aiohttp
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+from src.tools.cache_store import CacheStore
+from src.tools.host_scheduler import HostScheduler
+from src.tools.http_session import HttpSessionPool
+from src.tools.urls import normalize_url, host_of
+
+logger = logging.getLogger(__name__)
+
+class PageCache:
+    """Rendered-page cache keyed by normalized URL.
+
+    Fresh entries are served directly. Validators are taken from the document
+    response headers seen while rendering; expired entries that carry an ETag
+    or Last-Modified are revalidated with a conditional HEAD request, admitted
+    by ``scheduler`` when set, before the caller falls back to a full render.
+    """
+
+    def __init__(
+        self,
+        default_ttl: float = 3600.0,
+        domain_ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = 256,
+        disk_path: Optional[Union[str, Path]] = None,
+        revalidate: bool = True,
+        revalidate_timeout: float = 5.0,
+        session_pool: Optional[HttpSessionPool] = None,
+        scheduler: Optional[HostScheduler] = None
+    ):
+        self.default_ttl = default_ttl
+        self.domain_ttls = {domain.lower(): ttl for domain, ttl in (domain_ttls or {}).items()}
+        self.revalidate = revalidate
+        self.revalidate_timeout = revalidate_timeout
+        self.session_pool = session_pool
+        self.scheduler = scheduler
+        self._store = CacheStore(max_entries=max_entries, disk_path=disk_path)
+        self._stats = {"hits": 0, "revalidated": 0, "misses": 0, "expired": 0, "bytes_saved": 0}
+
+    def ttl_for(self, url: str) -> float:
+        host = host_of(url)
+        for domain in sorted(self.domain_ttls, key=len, reverse=True):
+            if host == domain or host.endswith("." + domain):
+                return self.domain_ttls[domain]
+        return self.default_ttl
+
+    async def get(self, url: str) -> Optional[Dict[str, Any]]:
+        try:
+            key = normalize_url(url)
+        except ValueError:
+            self._stats["misses"] += 1
+            return None
+        entry = self._store.get(key)
+        if entry is None:
+            self._stats["misses"] += 1
+            return None
+
+        status = "hit"
+        if time.time() >= entry["expires_at"]:
+            if not (self.revalidate and await self._still_valid(key, entry)):
+                self._stats["expired"] += 1
+                self._stats["misses"] += 1
+                return None
+            entry["expires_at"] = time.time() + self.ttl_for(key)
+            self._store.set(key, entry)
+            status = "revalidated"
+
+        self._stats["hits" if status == "hit" else "revalidated"] += 1
+        self._stats["bytes_saved"] += entry.get("html_bytes", 0)
+        return {**entry["result"], "cache": status}
+
+    async def put(
+        self,
+        url: str,
+        result: Dict[str, Any],
+        html_bytes: int = 0,
+        headers: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Store ``result``; ``headers`` are the rendered document's response headers."""
+        try:
+            key = normalize_url(url)
+        except ValueError:
+            return
+        ttl = self.ttl_for(key)
+        if ttl <= 0:
+            return
+        headers = {name.lower(): value for name, value in (headers or {}).items()}
+        now = time.time()
+        self._store.set(key, {
+            "result": result,
+            "stored_at": now,
+            "expires_at": now + ttl,
+            "html_bytes": html_bytes,
+            "etag": headers.get("etag"),
+            "last_modified": headers.get("last-modified")
+        })
+
+    async def _head(self, url: str, headers: Dict[str, str]) -> Optional[aiohttp.ClientResponse]:
+        if self.scheduler is not None:
+            return await self.scheduler.run(url, lambda: self._send_head(url, headers))
+        return await self._send_head(url, headers)
+
+    async def _send_head(self, url: str, headers: Dict[str, str]) -> Optional[aiohttp.ClientResponse]:
+        timeout = aiohttp.ClientTimeout(total=self.revalidate_timeout)
+        try:
+            if self.session_pool is not None:
+                session = await self.session_pool.session()
+                async with session.head(url, headers=headers, allow_redirects=True, timeout=timeout) as response:
+                    return response
+            async with aiohttp.ClientSession(timeout=timeout) as session:
+                async with session.head(url, headers=headers, allow_redirects=True) as response:
+                    return response
+        except Exception as e:
+            logger.warning(f"HEAD {url} failed: {str(e)}")
+            return None
+
+    async def _still_valid(self, url: str, entry: Dict[str, Any]) -> bool:
+        etag, last_modified = entry.get("etag"), entry.get("last_modified")
+        if not etag and not last_modified:
+            return False
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        response = await self._head(url, headers)
+        if response is None:
+            return False
+        if response.status == 304:
+            return True
+        if response.status >= 400:
+            return False
+        if etag:
+            return response.headers.get("ETag") == etag
+        return response.headers.get("Last-Modified") == last_modified
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self._stats["hits"] + self._stats["revalidated"] + self._stats["misses"]
+        served = self._stats["hits"] + self._stats["revalidated"]
+        return {
+            **self._stats,
+            "entries": len(self._store),
+            "hit_rate": round(served / lookups, 3) if lookups else 0.0
+        }
@@ -0,0 +1,243 @@
+"""Chrome page loading for the browser tool."""
+import json
+import time
+import logging
+from typing import Dict, Any, List, Iterable, Optional, Tuple
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from src.tools.extraction import Extraction
+from src.tools.wait_strategies import WaitStrategy, create_wait_strategy
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+RESOURCE_TYPE_EXTENSIONS: Dict[str, List[str]] = {
+    "image": ["png", "jpg", "jpeg", "gif", "webp", "svg", "ico", "avif", "bmp"],
+    "media": ["mp4", "webm", "mp3", "ogg", "wav", "m4a", "mov"],
+    "font": ["woff", "woff2", "ttf", "otf", "eot"],
+    "stylesheet": ["css"],
+}
+
+# Extensions are anchored to the end of the path (optionally followed by a query),
+# since Network.setBlockedURLs also applies to the document request itself and an
+# unanchored "*.gif*" would block hosts such as www.gifts.com.
+RESOURCE_TYPE_PATTERNS: Dict[str, List[str]] = {
+    resource_type: [pattern for extension in extensions for pattern in (f"*.{extension}", f"*.{extension}?*")]
+    for resource_type, extensions in RESOURCE_TYPE_EXTENSIONS.items()
+}
+
+DEFAULT_BLOCKED_RESOURCE_TYPES = ["image", "media", "font", "stylesheet"]
+
+AD_TRACKER_URL_PATTERNS = [
+    "*doubleclick.net*",
+    "*googlesyndication.com*",
+    "*googletagmanager.com*",
+    "*google-analytics.com*",
+    "*googleadservices.com*",
+    "*adservice.google.*",
+    "*connect.facebook.net*",
+    "*scorecardresearch.com*",
+    "*amazon-adsystem.com*",
+    "*adnxs.com*",
+    "*criteo.com*",
+    "*taboola.com*",
+    "*outbrain.com*",
+    "*hotjar.com*",
+    "*segment.io*",
+]
+
+TRANSFER_STATS_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+const resources = performance.getEntriesByType('resource');
+return {
+    bytes: (nav ? nav.transferSize : 0) + resources.reduce((sum, r) => sum + (r.transferSize || 0), 0),
+    resources: resources.length
+};
+"""
+
+def page_load_strategy(wait: WaitStrategy) -> str:
+    """Only the load strategy needs chromedriver to block until the load event;
+    every other strategy polls for readiness itself once the DOM is parsed."""
+    return "normal" if wait.name == "load" else "eager"
+
+def build_chrome_options(lean: bool = False, load_strategy: Optional[str] = None) -> Options:
+    chrome_options = Options()
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument(f"--user-agent={USER_AGENT}")
+    chrome_options.set_capability("goog:loggingPrefs", {"performance": "INFO"})
+
+    if load_strategy or lean:
+        chrome_options.page_load_strategy = load_strategy or "eager"
+    if lean:
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2}
+        )
+    return chrome_options
+
+def blocked_url_patterns(resource_types: Iterable[str], url_patterns: Iterable[str]) -> List[str]:
+    patterns: List[str] = []
+    for resource_type in resource_types:
+        patterns.extend(RESOURCE_TYPE_PATTERNS.get(resource_type, []))
+    patterns.extend(url_patterns)
+    return list(dict.fromkeys(patterns))
+
+def apply_request_blocking(driver, patterns: List[str]) -> None:
+    if not patterns:
+        return
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+
+def collect_transfer_stats(driver) -> Dict[str, Any]:
+    try:
+        stats = driver.execute_script(TRANSFER_STATS_SCRIPT) or {}
+        return {
+            "bytes_transferred": int(stats.get("bytes", 0)),
+            "resource_count": int(stats.get("resources", 0)),
+        }
+    except Exception:
+        return {"bytes_transferred": None, "resource_count": None}
+
+def document_response(response: Dict[str, Any]) -> Tuple[Optional[int], Dict[str, str]]:
+    """Status and lower-cased headers from a DevTools ``Network.Response`` object."""
+    headers = {name.lower(): str(value) for name, value in (response.get("headers") or {}).items()}
+    return response.get("status"), headers
+
+def read_document_response(driver) -> Tuple[Optional[int], Dict[str, str]]:
+    """Find the main document's response in chromedriver's performance log."""
+    try:
+        entries = driver.get_log("performance")
+    except Exception:
+        return None, {}
+    for entry in entries:
+        try:
+            message = json.loads(entry["message"])["message"]
+        except (KeyError, TypeError, ValueError):
+            continue
+        if message.get("method") == "Network.responseReceived" and message["params"].get("type") == "Document":
+            return document_response(message["params"]["response"])
+    return None, {}
+
+CAPPED_SOURCE_SCRIPT = """
+const html = document.documentElement.outerHTML;
+return {length: html.length, html: html.slice(0, arguments[0])};
+"""
+
+def read_page_source(driver, max_chars: Optional[int] = None) -> Tuple[str, int]:
+    """Return the page HTML, cut to ``max_chars`` inside the browser, and its full length."""
+    if not max_chars:
+        html = driver.page_source
+        return html, len(html)
+    snapshot = driver.execute_script(CAPPED_SOURCE_SCRIPT, max_chars)
+    return snapshot["html"], snapshot["length"]
+
+def wait_until_ready(driver, strategy: WaitStrategy, timeout: float, poll: float = 0.1) -> Dict[str, Any]:
+    started = time.perf_counter()
+    timed_out = False
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=poll).until(
+            lambda d: strategy.is_ready(d.execute_script("return " + strategy.script))
+        )
+    except TimeoutException:
+        timed_out = True
+    return {
+        "strategy": strategy.name,
+        "waited_ms": round((time.perf_counter() - started) * 1000, 1),
+        "timed_out": timed_out
+    }
+
+def render_page(
+    url: str,
+    lean: bool = False,
+    blocked_patterns: Iterable[str] = (),
+    wait: Optional[WaitStrategy] = None,
+    timeout: float = 10.0,
+    max_html_chars: Optional[int] = None
+) -> Dict[str, Any]:
+    """Load a URL in a fresh headless Chrome and return its page source and timing.
+
+    Navigation and readiness share one ``timeout``; if the page is not ready
+    by then the current DOM is returned anyway and the result is marked ``partial``.
+    """
+    started = time.perf_counter()
+    wait = wait or create_wait_strategy("domcontentloaded" if lean else "load")
+    driver = None
+    try:
+        driver = webdriver.Chrome(options=build_chrome_options(lean=lean, load_strategy=page_load_strategy(wait)))
+        driver.set_page_load_timeout(timeout)
+        apply_request_blocking(driver, list(blocked_patterns))
+        
+        deadline = time.perf_counter() + timeout
+        try:
+            driver.get(url)
+        except TimeoutException:
+            logger.warning(f"Navigation to {url} timed out, using partial content")
+        
+        wait_info = wait_until_ready(driver, wait, max(0.0, deadline - time.perf_counter()))
+        if wait_info["timed_out"]:
+            logger.warning(f"{url} not ready after {wait_info['waited_ms']}ms ({wait.name}), extracting partial content")
+        
+        html, html_chars = read_page_source(driver, max_html_chars)
+        status, headers = read_document_response(driver)
+        timing = {
+            "mode": "lean" if lean else "full",
+            "driver": "selenium",
+            "load_ms": round((time.perf_counter() - started) * 1000, 1),
+            **collect_transfer_stats(driver)
+        }
+        return {
+            "url": url,
+            "status": status,
+            "headers": headers,
+            "html": html,
+            "html_chars": html_chars,
+            "timing": timing,
+            "wait": wait_info,
+            "partial": wait_info["timed_out"]
+        }
+        
+    except WebDriverException as e:
+        logger.error(f"Browser error: {str(e)}")
+        return {"error": f"Browser error: {str(e)}"}
+        
+    finally:
+        if driver:
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.error(f"Error closing browser: {str(e)}")
+
+def page_result(
+    page: Dict[str, Any],
+    extraction: Extraction,
+    extract_started: float,
+    max_html_chars: Optional[int] = None
+) -> Dict[str, Any]:
+    """Combine a rendered page and its extracted text into a browser tool result."""
+    timing = page["timing"]
+    timing["extract_ms"] = round((time.perf_counter() - extract_started) * 1000, 1)
+    timing["total_ms"] = round(timing["load_ms"] + timing["extract_ms"], 1)
+
+    html_chars = page.pop("html_chars")
+    page.pop("headers", None)
+    truncated = extraction.truncated or (max_html_chars is not None and html_chars > max_html_chars)
+    content = extraction.text
+    if truncated:
+        content += (
+            f"\n[Content truncated to {len(extraction.text)} of ~{extraction.text_chars} characters; "
+            f"page HTML was {html_chars} characters]"
+        )
+    return {
+        **page,
+        "content": content,
+        "truncated": truncated,
+        "original_size": {"html_chars": html_chars, "text_chars": extraction.text_chars},
+        "timing": timing
+    }
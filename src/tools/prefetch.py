@@ -0,0 +1,135 @@
+"""Speculative background fetches of the URLs an agent is likely to open next."""
+import time
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set
+from src.tools.urls import normalize_url
+
+logger = logging.getLogger(__name__)
+
+Fetch = Callable[[str], Awaitable[Dict[str, Any]]]
+
+class Prefetcher:
+    """Fetches the top search results in the background so a later browse is instant.
+
+    ``fetch`` is expected to fill a cache and coalesce with identical in-flight
+    calls (``BrowserTool.aget_page_content`` does both), so a claimed URL is
+    either served from the cache or joins the running prefetch; only the former
+counts as a hit, since a partial or uncacheable page is rendered again. Work is bounded
+    by ``top_n`` URLs per batch, ``max_in_flight`` concurrent fetches and a
+    ``timeout`` per fetch; a new batch cancels unclaimed prefetches from the
+    previous one. Completed prefetches unclaimed after ``ttl`` count as wasted.
+    """
+
+    def __init__(
+        self,
+        fetch: Fetch,
+        top_n: int = 3,
+        max_in_flight: int = 2,
+        timeout: float = 30.0,
+        ttl: float = 600.0,
+        cancel_previous: bool = True
+    ):
+        self.fetch = fetch
+        self.top_n = top_n
+        self.max_in_flight = max_in_flight
+        self.timeout = timeout
+        self.ttl = ttl
+        self.cancel_previous = cancel_previous
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._running: Set[asyncio.Task] = set()
+        self._ready: Dict[str, float] = {}
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._stats = {"scheduled": 0, "completed": 0, "failed": 0, "cancelled": 0, "hits": 0, "joined": 0, "wasted": 0}
+
+    def schedule(self, urls: Iterable[str]) -> int:
+        """Start prefetching the first ``top_n`` http(s) URLs; returns how many were started."""
+        self._expire()
+        batch = []
+        for url in urls:
+            if url and url.lower().startswith(("http://", "https://")):
+                key = normalize_url(url)
+                if key not in batch:
+                    batch.append(key)
+            if len(batch) >= self.top_n:
+                break
+
+        if self.cancel_previous:
+            for key in [key for key in self._tasks if key not in batch]:
+                self._tasks.pop(key).cancel()
+
+        started = 0
+        for key in batch:
+            if key in self._tasks or key in self._ready:
+                continue
+            task = asyncio.create_task(self._prefetch(key))
+            self._tasks[key] = task
+            self._running.add(task)
+            task.add_done_callback(lambda done, key=key: self._finished(key, done))
+            started += 1
+        self._stats["scheduled"] += started
+        if started:
+            logger.info(f"Prefetching {started} URLs")
+        return started
+
+    async def _prefetch(self, url: str) -> None:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+        async with self._slots:
+            result = await asyncio.wait_for(self.fetch(url), self.timeout)
+        if "error" in result:
+            raise RuntimeError(result["error"])
+
+    def _finished(self, url: str, task: asyncio.Task) -> None:
+        self._running.discard(task)
+        unclaimed = self._tasks.get(url) is task
+        if unclaimed:
+            del self._tasks[url]
+        if task.cancelled():
+            self._stats["cancelled"] += 1
+        elif task.exception() is not None:
+            self._stats["failed"] += 1
+            logger.info(f"Prefetch of {url} failed: {task.exception()}")
+        else:
+            self._stats["completed"] += 1
+            if unclaimed:
+                self._ready[url] = time.monotonic()
+
+    def claim(self, url: str) -> Optional[str]:
+        """Record that a tool is about to fetch ``url``: ``ready`` if its prefetch completed,
+        ``joined`` if its prefetch is still running, otherwise None. A ``ready`` claim
+        is not a hit until ``settle`` confirms the cache served it."""
+        key = normalize_url(url)
+        if self._ready.pop(key, None) is not None:
+            return "ready"
+        if key in self._tasks:
+            self._tasks.pop(key)
+            self._stats["joined"] += 1
+            return "joined"
+        return None
+
+    def settle(self, served: bool) -> None:
+        """Count a ``ready`` claim as a hit if the cache served it, otherwise as wasted."""
+        self._stats["hits" if served else "wasted"] += 1
+
+    def _expire(self) -> None:
+        cutoff = time.monotonic() - self.ttl
+        for url in [url for url, ready_at in self._ready.items() if ready_at < cutoff]:
+            del self._ready[url]
+            self._stats["wasted"] += 1
+
+    async def close(self) -> None:
+        tasks = list(self._running)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        self._expire()
+        used = self._stats["hits"] + self._stats["joined"]
+        return {
+            **self._stats,
+            "in_flight": len(self._tasks),
+            "unclaimed": len(self._ready),
+            "hit_rate": round(used / self._stats["scheduled"], 3) if self._stats["scheduled"] else 0.0
+        }
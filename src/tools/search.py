@@ -1,43 +1,210 @@
+import json
+import asyncio
 import logging
-from typing import Optional, List, Dict, Any
-from pydantic import Field
+from typing import Optional, List, Dict, Any, AsyncIterator
+from pydantic import Field, PrivateAttr
 from duckduckgo_search import DDGS
 from langchain.tools import BaseTool
 from langchain_core.callbacks import CallbackManagerForToolRun, BaseCallbackHandler
+from src.tools.host_scheduler import HostScheduler
+from src.tools.prefetch import Prefetcher
+from src.tools.search_backends import BackendRouter, DuckDuckGoBackend, SearchBackend, merge_results
+from src.tools.search_cache import SearchCache, normalize_query
+from src.tools.single_flight import SingleFlight
+from src.tools.urls import normalize_url
 
 logger = logging.getLogger(__name__)
 
 class SearchTool(BaseTool):
     name: str = Field(default="search", description="The name of the tool")
-    description: str = Field(default="Search the web for information about a topic", description="The description of the tool")
+    description: str = Field(
+        default=(
+            "Search the web for information about a topic. Input is a query, or a JSON list of queries "
+            "searched concurrently with results merged and deduplicated by URL"
+        ),
+        description="The description of the tool"
+    )
     ddgs: Optional[DDGS] = Field(default_factory=DDGS)
     logger: logging.Logger = Field(default_factory=lambda: logging.getLogger(__name__))
     callbacks: Optional[List[BaseCallbackHandler]] = Field(default=None, description="Callbacks for the tool")
+    single_flight: Optional[SingleFlight] = Field(default_factory=SingleFlight, description="Coalesces identical concurrent searches")
+    scheduler: Optional[HostScheduler] = Field(default=None, description="Per-host rate limits and back-off shared with other tools")
+    max_workers: int = Field(default=4, description="Threads running blocking DuckDuckGo calls")
+    max_results: int = Field(default=5, description="Results requested per query")
+    region: str = Field(default="wt-wt", description="DuckDuckGo region code")
+    search_cache: Optional[SearchCache] = Field(default=None, description="Result cache keyed by normalized query, disabled when None")
+    prefetcher: Optional[Prefetcher] = Field(default=None, description="Starts loading the top results in the background when set")
+    search_deadline: float = Field(default=10.0, description="Seconds search_many waits before dropping unfinished queries")
+    backends: List[SearchBackend] = Field(default_factory=list, description="Backends queried in parallel; DuckDuckGo through ddgs when empty")
+    supplements: List[SearchBackend] = Field(
+        default_factory=list,
+        description="Backends whose new results are appended to every search, e.g. memory; they never end a search early and are not cached or prefetched"
+    )
+    latency_budget: float = Field(default=8.0, description="Seconds one search waits for its backends before merging what arrived")
+    sufficient_results: int = Field(default=3, description="Results from one backend that end a search early")
+    _router: BackendRouter = PrivateAttr()
+    _stats: Dict[str, int] = PrivateAttr(default_factory=lambda: {"batches": 0, "batch_queries": 0, "timed_out": 0, "supplemented": 0})
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.logger = logging.getLogger(__name__)
+        if not self.backends:
+            self.backends = [
+                DuckDuckGoBackend(self.ddgs, region=self.region, max_workers=self.max_workers, scheduler=self.scheduler)
+            ]
+        self._router = BackendRouter(self.backends, budget=self.latency_budget, sufficient=self.sufficient_results)
 
     def search_web(self, query: str) -> List[Dict[str, Any]]:
         try:
-            results = list(self.ddgs.text(query, max_results=5))
-            if not results:
-                self.logger.warning(f"No results found for query: {query}")
-                return []
-            return results
+            return self._text_search(query)
         except Exception as e:
             self.logger.error(f"Error during search: {str(e)}")
             return []
 
+    def _text_search(self, query: str) -> List[Dict[str, Any]]:
+        results = list(self.ddgs.text(query, region=self.region, max_results=self.max_results))
+        if not results:
+            self.logger.warning(f"No results found for query: {query}")
+        return results
+
+    async def asearch(self, query: str) -> List[Dict[str, Any]]:
+        """Search without blocking the event loop, from the cache or sharing identical in-flight queries."""
+        if self.search_cache is None:
+            results = await self._coalesced_search(query)
+        else:
+            results, status = await self.search_cache.fetch(
+                query, lambda: self._coalesced_search(query), self.max_results, self.region
+            )
+            self.logger.info(f"Search cache {status} for {query!r}")
+        if self.supplements:
+            results = await self._supplemented(query, results)
+        return results
+
+    async def _supplemented(self, query: str, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        seen = {normalize_url(url) for url in (result.get("href") or result.get("link") for result in results) if url}
+        found = await asyncio.gather(
+            *(backend.search(query, self.max_results) for backend in self.supplements), return_exceptions=True
+        )
+        extra = []
+        for backend, backend_results in zip(self.supplements, found):
+            if isinstance(backend_results, Exception):
+                self.logger.error(f"Search supplement {backend.name} failed: {str(backend_results)}")
+                continue
+            for result in backend_results:
+                url = result.get("href") or result.get("link")
+                if url and normalize_url(url) not in seen:
+                    seen.add(normalize_url(url))
+                    extra.append({**result, "backends": [backend.name]})
+        self._stats["supplemented"] += len(extra)
+        return results + extra
+
+    def _is_supplement(self, result: Dict[str, Any]) -> bool:
+        names = {backend.name for backend in self.supplements}
+        return bool(names) and bool(result.get("backends")) and set(result["backends"]) <= names
+
+    async def _coalesced_search(self, query: str) -> List[Dict[str, Any]]:
+        if self.single_flight is None:
+            return await self._routed_search(query)
+        return list(await self.single_flight.run(normalize_query(query), lambda: self._routed_search(query)))
+
+    async def _routed_search(self, query: str) -> List[Dict[str, Any]]:
+        results = await self._router.search(query, self.max_results)
+        if not results:
+            self.logger.warning(f"No results found for query: {query}")
+        return results
+
+    async def search_many(self, queries: List[str], deadline: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Run queries concurrently for at most ``deadline`` seconds and merge their results by URL.
+
+        Queries still running at the deadline are dropped from the merge.
+        """
+        queries = list(dict.fromkeys(query.strip() for query in queries if query and query.strip()))
+        if not queries:
+            return []
+        self._stats["batches"] += 1
+        self._stats["batch_queries"] += len(queries)
+        tasks = {query: asyncio.create_task(self.asearch(query)) for query in queries}
+        done, pending = await asyncio.wait(tasks.values(), timeout=deadline or self.search_deadline)
+        for task in pending:
+            task.cancel()
+        if pending:
+            self._stats["timed_out"] += len(pending)
+            self.logger.warning(f"{len(pending)} of {len(queries)} searches missed the deadline")
+        return merge_results({query: task.result() for query, task in tasks.items() if task in done})
+
+    async def search_stream(self, queries: List[str], deadline: Optional[float] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Like ``search_many``, but yield each query's results as soon as it finishes,
+        skipping URLs an earlier query already returned."""
+        queries = list(dict.fromkeys(query.strip() for query in queries if query and query.strip()))
+        if not queries:
+            return
+        self._stats["batches"] += 1
+        self._stats["batch_queries"] += len(queries)
+        loop = asyncio.get_running_loop()
+        deadline_at = loop.time() + (deadline or self.search_deadline)
+        tasks = {asyncio.create_task(self.asearch(query)): query for query in queries}
+        seen = set()
+        try:
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, timeout=max(0.0, deadline_at - loop.time()), return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    break
+                for task in done:
+                    for result in task.result():
+                        url = result.get("href") or result.get("link")
+                        if url and normalize_url(url) in seen:
+                            continue
+                        if url:
+                            seen.add(normalize_url(url))
+                        yield {**result, "queries": [tasks[task]]}
+            if pending:
+                self._stats["timed_out"] += len(pending)
+                self.logger.warning(f"{len(pending)} of {len(queries)} searches missed the deadline")
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _query_list(self, query: str) -> Optional[List[str]]:
+        if not query.strip().startswith("["):
+            return None
+        try:
+            queries = json.loads(query)
+        except json.JSONDecodeError:
+            return None
+        return [str(item) for item in queries] if isinstance(queries, list) else None
+
+    async def aclose(self) -> None:
+        if self.search_cache is not None:
+            await self.search_cache.close()
+        await self._router.close()
+        for backend in self.supplements:
+            await backend.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self._stats,
+            "backends": self._router.get_stats(),
+            "search_cache": self.search_cache.get_stats() if self.search_cache else None,
+            "single_flight": self.single_flight.get_stats() if self.single_flight else None
+        }
+
     async def _arun(
         self,
         query: str,
         run_manager: Optional[CallbackManagerForToolRun] = None,
         **kwargs: Any
     ) -> List[Dict[str, Any]]:
-        """Run the search asynchronously."""
+        """Run the search asynchronously; a JSON list of queries is searched concurrently."""
         try:
-            results = self.search_web(query)
+            queries = self._query_list(query)
+            results = await (self.search_many(queries) if queries is not None else self.asearch(query))
+            if self.prefetcher is not None:
+                self.prefetcher.schedule(
+                    result.get("href") or result.get("link") for result in results if not self._is_supplement(result)
+                )
             if run_manager:
                 try:
                     output = "\n".join(f"{r['title']}: {r['body']}" for r in results)
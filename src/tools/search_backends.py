@@ -0,0 +1,286 @@
+"""Search backends behind the search tool and a router that fans queries out across them."""
+import time
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
+from duckduckgo_search import DDGS
+from duckduckgo_search.exceptions import RatelimitException
+from src.memory.vector_memory import VectorMemory
+from src.tools.cancellation import finish_on_cancel
+from src.tools.host_scheduler import HostScheduler
+from src.tools.urls import normalize_url
+
+logger = logging.getLogger(__name__)
+
+SEARCH_HOST = "duckduckgo.com"
+WEB_INPUT_PREFIXES = ("http://", "https://")
+
+T = TypeVar("T")
+Results = List[Dict[str, Any]]
+
+def merge_results(result_sets: Dict[str, Results], label: str = "queries") -> Results:
+    """Interleave result lists by rank, keeping the first result per normalized URL and
+    recording under ``label`` every result set (query or backend) that returned it."""
+    merged: Dict[str, Dict[str, Any]] = {}
+    for rank in range(max((len(results) for results in result_sets.values()), default=0)):
+        for source, results in result_sets.items():
+            if rank >= len(results):
+                continue
+            result = results[rank]
+            url = result.get("href") or result.get("link") or ""
+            key = normalize_url(url) if url else f"{source}#{rank}"
+            if key in merged:
+                merged[key][label].append(source)
+            else:
+                merged[key] = {**result, label: [source]}
+    return list(merged.values())
+
+class SearchBackend(ABC):
+    """Answers a query with ``{title, href, body}`` results; failures are raised."""
+
+    name: str = ""
+
+    @abstractmethod
+    async def search(self, query: str, max_results: int) -> Results:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+class DuckDuckGoBackend(SearchBackend):
+    """DuckDuckGo text search on its own thread pool, admitted by the host scheduler when set."""
+
+    name = "duckduckgo"
+
+    def __init__(
+        self,
+        ddgs: Optional[DDGS] = None,
+        region: str = "wt-wt",
+        max_workers: int = 4,
+        scheduler: Optional[HostScheduler] = None
+    ):
+        self.ddgs = ddgs or DDGS()
+        self.region = region
+        self.max_workers = max_workers
+        self.scheduler = scheduler
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    async def search(self, query: str, max_results: int) -> Results:
+        if self.scheduler is None:
+            return await finish_on_cancel(self._in_executor(self._text, query, max_results))
+        async with self.scheduler.slot(SEARCH_HOST) as slot:
+            try:
+                return await finish_on_cancel(self._in_executor(self._text, query, max_results))
+            except RatelimitException:
+                slot.report(429)
+                raise
+
+    def _text(self, query: str, max_results: int) -> Results:
+        return list(self.ddgs.text(query, region=self.region, max_results=max_results) or [])
+
+    def _in_executor(self, function: Callable[..., T], *args: Any) -> "asyncio.Future[T]":
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="search")
+        return asyncio.get_running_loop().run_in_executor(self._executor, function, *args)
+
+    async def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+class MemoryIndexBackend(SearchBackend):
+    """Pages the agent has already browsed, fetched or crawled, ranked by TF-IDF similarity."""
+
+    name = "memory"
+
+    def __init__(self, memory: VectorMemory, min_score: float = 0.2, body_chars: int = 300):
+        self.memory = memory
+        self.min_score = min_score
+        self.body_chars = body_chars
+
+    async def search(self, query: str, max_results: int) -> Results:
+        results: Results = []
+        for entry in self.memory.search_tool_outputs(query, k=max_results * 3, min_score=self.min_score):
+            if not entry["input"].startswith(WEB_INPUT_PREFIXES):
+                continue
+            title, _, text = entry["output"].partition("\n")
+            results.append({
+                "title": title[:200],
+                "href": entry["input"],
+                "body": (text or title)[:self.body_chars],
+                "score": round(entry["score"], 3)
+            })
+            if len(results) == max_results:
+                break
+        return results
+
+class StubBackend(SearchBackend):
+    """Canned results after an optional delay, or a raised ``error``; for tests and offline runs."""
+
+    def __init__(
+        self,
+        results: Union[Results, Dict[str, Results], None] = None,
+        delay: float = 0.0,
+        error: Optional[Exception] = None,
+        name: str = "stub"
+    ):
+        self.results = results or []
+        self.delay = delay
+        self.error = error
+        self.name = name
+        self.calls = 0
+
+    async def search(self, query: str, max_results: int) -> Results:
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        results = self.results.get(query, []) if isinstance(self.results, dict) else self.results
+        return [dict(result) for result in results[:max_results]]
+
+class _BackendHealth:
+    def __init__(self):
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.calls = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.cancelled = 0
+        self.wins = 0
+
+    def observe(self, latency: float, failed: bool, alpha: float) -> None:
+        self.latency = latency if self.latency is None else alpha * latency + (1 - alpha) * self.latency
+        self.error_rate = alpha * float(failed) + (1 - alpha) * self.error_rate
+
+    def cost(self) -> float:
+        return (self.latency or 0.0) * (1 + 4 * self.error_rate)
+
+class BackendRouter:
+    """Queries backends in parallel and returns within ``budget`` seconds.
+
+    The first backend to return ``sufficient`` results (or ``max_results`` when
+    fewer are asked for) wins and the others are cancelled. Otherwise,
+    whatever arrived by the budget is merged by rank and URL. Each backend's
+    latency and error rate are tracked as EWMAs: backends are ordered by
+    latency weighted by errors, ``fan_out`` limits how many of the cheapest
+    are queried, and a backend whose error rate passes ``max_error_rate`` is
+    left out except for every ``probe_every``-th search.
+    """
+
+    def __init__(
+        self,
+        backends: List[SearchBackend],
+        budget: float = 8.0,
+        sufficient: int = 3,
+        fan_out: Optional[int] = None,
+        max_error_rate: float = 0.5,
+        probe_every: int = 10,
+        alpha: float = 0.3
+    ):
+        if not backends:
+            raise ValueError("BackendRouter needs at least one backend")
+        self.backends = backends
+        self.budget = budget
+        self.sufficient = sufficient
+        self.fan_out = fan_out
+        self.max_error_rate = max_error_rate
+        self.probe_every = probe_every
+        self.alpha = alpha
+        self._health = {backend.name: _BackendHealth() for backend in backends}
+        self._stats = {"searches": 0, "sufficient": 0, "merged": 0, "over_budget": 0, "failed": 0}
+
+    def route(self) -> List[SearchBackend]:
+        """Backends to query for the next search, cheapest first."""
+        ranked = sorted(self.backends, key=lambda backend: self._health[backend.name].cost())
+        probing = self.probe_every > 0 and self._stats["searches"] % self.probe_every == 0
+        healthy = [
+            backend for backend in ranked
+            if probing or self._health[backend.name].error_rate <= self.max_error_rate
+        ]
+        return (healthy or ranked)[:self.fan_out]
+
+    async def search(self, query: str, max_results: int = 5, budget: Optional[float] = None) -> Results:
+        self._stats["searches"] += 1
+        backends = self.route()
+        needed = min(self.sufficient, max_results)
+        started = time.perf_counter()
+        deadline = started + (budget or self.budget)
+        tasks = {asyncio.create_task(backend.search(query, max_results)): backend for backend in backends}
+        arrived: Dict[str, Results] = {}
+        try:
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, timeout=max(0.0, deadline - time.perf_counter()), return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    break
+                elapsed = time.perf_counter() - started
+                finished = [tasks[task] for task in sorted(done, key=lambda task: backends.index(tasks[task]))]
+                for task in done:
+                    results = self._observe(tasks[task], task, elapsed)
+                    if results is not None:
+                        arrived[tasks[task].name] = results
+                winner = next((backend for backend in finished if len(arrived.get(backend.name) or []) >= needed), None)
+                if winner is not None:
+                    self._stats["sufficient"] += 1
+                    self._health[winner.name].wins += 1
+                    for other in pending:
+                        self._health[tasks[other].name].cancelled += 1
+                    results = arrived[winner.name]
+                    if len(tasks) > 1:
+                        results = [{**result, "backends": [winner.name]} for result in results]
+                    return results[:max_results]
+
+            for task in pending:
+                self._health[tasks[task].name].timeouts += 1
+                self._health[tasks[task].name].observe(time.perf_counter() - started, True, self.alpha)
+            if pending:
+                self._stats["over_budget"] += 1
+                logger.warning(f"Search budget spent waiting for {', '.join(tasks[task].name for task in pending)}")
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        if not any(arrived.values()):
+            self._stats["failed"] += 1
+            return []
+        if len(tasks) == 1:
+            return next(iter(arrived.values()))[:max_results]
+        self._stats["merged"] += 1
+        return merge_results({name: results for name, results in arrived.items() if results}, label="backends")[:max_results]
+
+    def _observe(self, backend: SearchBackend, task: asyncio.Task, elapsed: float) -> Optional[Results]:
+        health = self._health[backend.name]
+        health.calls += 1
+        error = task.exception()
+        health.observe(elapsed, error is not None, self.alpha)
+        if error is not None:
+            health.errors += 1
+            logger.error(f"Search backend {backend.name} failed: {str(error)}")
+            return None
+        return task.result()
+
+    async def close(self) -> None:
+        for backend in self.backends:
+            await backend.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self._stats,
+            "backends": {
+                name: {
+                    "calls": health.calls,
+                    "errors": health.errors,
+                    "timeouts": health.timeouts,
+                    "cancelled": health.cancelled,
+                    "wins": health.wins,
+                    "latency_ms": round(health.latency * 1000, 1) if health.latency is not None else None,
+                    "error_rate": round(health.error_rate, 3)
+                }
+                for name, health in self._health.items()
+            }
+        }
@@ -0,0 +1,105 @@
+"""Cache of search results keyed by normalized query, with stale-while-revalidate refreshes."""
+import re
+import json
+import time
+import asyncio
+import logging
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
+from src.tools.cache_store import CacheStore
+
+logger = logging.getLogger(__name__)
+
+TRAILING_PUNCTUATION = re.compile(r"[?!.,;:]+(?=\s|$)")
+
+Results = List[Dict[str, Any]]
+
+def normalize_query(query: str) -> str:
+    """Lowercase, drop sentence punctuation and collapse whitespace; operators such as
+    ``site:`` and quoted phrases are kept."""
+    return " ".join(TRAILING_PUNCTUATION.sub("", query.lower()).split())
+
+class SearchCache:
+    """Memory LRU with an optional disk tier for search results.
+
+    Entries younger than ``ttl`` are served as hits. Until ``stale_ttl`` they
+    are still served, marked stale, while one background search per query
+    refreshes them. Empty result lists are not stored, since failed or
+    throttled searches also come back empty.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 3600.0,
+        stale_ttl: float = 24 * 3600.0,
+        max_entries: int = 512,
+        disk_path: Optional[Union[str, Path]] = None
+    ):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._store = CacheStore(max_entries=max_entries, disk_path=disk_path)
+        self._refreshing: Dict[str, asyncio.Task] = {}
+        self._stats = {"hits": 0, "stale": 0, "misses": 0, "refreshes": 0, "refresh_errors": 0}
+
+    def key(self, query: str, max_results: int, region: str) -> str:
+        return json.dumps([normalize_query(query), max_results, region])
+
+    async def fetch(
+        self,
+        query: str,
+        search: Callable[[], Awaitable[Results]],
+        max_results: int = 5,
+        region: str = "wt-wt"
+    ) -> Tuple[Results, str]:
+        """Return results and how they were served: hit, stale or miss."""
+        key = self.key(query, max_results, region)
+        entry = self._store.get(key)
+        age = time.time() - entry["stored_at"] if entry else None
+
+        if age is not None and age < self.ttl:
+            self._stats["hits"] += 1
+            return list(entry["results"]), "hit"
+        if age is not None and age < self.stale_ttl:
+            self._stats["stale"] += 1
+            self._refresh(key, search)
+            return list(entry["results"]), "stale"
+
+        self._stats["misses"] += 1
+        results = await search()
+        self.put(key, results)
+        return results, "miss"
+
+    def put(self, key: str, results: Results) -> None:
+        if results:
+            self._store.set(key, {"results": results, "stored_at": time.time()})
+
+    def _refresh(self, key: str, search: Callable[[], Awaitable[Results]]) -> None:
+        if key in self._refreshing:
+            return
+        task = asyncio.create_task(self._run_refresh(key, search))
+        self._refreshing[key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+
+    async def _run_refresh(self, key: str, search: Callable[[], Awaitable[Results]]) -> None:
+        self._stats["refreshes"] += 1
+        try:
+            self.put(key, await search())
+        except Exception as e:
+            self._stats["refresh_errors"] += 1
+            logger.warning(f"Background search refresh failed for {key}: {str(e)}")
+
+    async def close(self) -> None:
+        tasks: Set[asyncio.Task] = set(self._refreshing.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        served = self._stats["hits"] + self._stats["stale"]
+        lookups = served + self._stats["misses"]
+        return {
+            **self._stats,
+            "entries": len(self._store),
+            "refreshing": len(self._refreshing),
+            "hit_rate": round(served / lookups, 3) if lookups else 0.0
+        }
@@ -0,0 +1,58 @@
+"""Request coalescing: concurrent calls with the same key share one in-flight task."""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+class _Flight:
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+class SingleFlight:
+    """Runs at most one call per key at a time and hands its result to every caller.
+
+    Each caller awaits the shared task through ``asyncio.shield``, so a caller
+    that is cancelled leaves the others unaffected. The shared task itself is
+    cancelled only once every caller waiting on it has gone. Callers receive
+    the same result object and should copy it before mutating it.
+    """
+
+    def __init__(self):
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._stats = {"calls": 0, "executed": 0, "coalesced": 0, "abandoned": 0}
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        self._stats["calls"] += 1
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(factory()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+            self._stats["executed"] += 1
+        else:
+            self._stats["coalesced"] += 1
+            logger.info(f"Joining in-flight call for {key}")
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                self._stats["abandoned"] += 1
+                flight.task.cancel()
+                self._forget(key, flight)
+
+    def _forget(self, key: Hashable, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def in_flight(self) -> int:
+        return len(self._flights)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self._stats, "in_flight": self.in_flight()}
@@ -0,0 +1,27 @@
+"""URL normalization shared by caches, request coalescing and the crawler."""
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+TRACKING_PARAMS = frozenset(["fbclid", "gclid", "msclkid", "mc_cid", "mc_eid", "ref_src"])
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+def normalize_url(url: str) -> str:
+    """Canonical form of a URL: scheme and host lowercased, default port,
+    fragment and tracking parameters dropped, query parameters sorted."""
+    url = url.strip()
+    if not url.lower().startswith(('http://', 'https://')):
+        url = 'https://' + url.lstrip('/')
+
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.startswith("utm_") and key not in TRACKING_PARAMS
+    )
+    return urlunsplit((scheme, host, parts.path or "/", urlencode(query), ""))
+
+def host_of(url: str) -> str:
+    return (urlsplit(normalize_url(url)).hostname or "").lower()
@@ -0,0 +1,91 @@
+"""Page readiness strategies polled by the browser drivers."""
+import json
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Type
+
+class WaitStrategy(ABC):
+    """A readiness check built from a JavaScript probe and a predicate over its value.
+
+    Drivers evaluate ``script`` in the page on every poll and pass the value to
+    ``is_ready``. Instances keep state between polls, so create one per page load.
+    """
+
+    name: str = ""
+    script: str = ""
+
+    @abstractmethod
+    def is_ready(self, value: Any, now: Optional[float] = None) -> bool:
+        pass
+
+class LoadStrategy(WaitStrategy):
+    name = "load"
+    script = "document.readyState"
+
+    def is_ready(self, value: Any, now: Optional[float] = None) -> bool:
+        return value == "complete"
+
+class DomContentLoadedStrategy(WaitStrategy):
+    name = "domcontentloaded"
+    script = "document.readyState"
+
+    def is_ready(self, value: Any, now: Optional[float] = None) -> bool:
+        return value in ("interactive", "complete")
+
+class StableValueStrategy(WaitStrategy):
+    """Ready once the probed value has stayed the same for ``quiet_ms``."""
+
+    def __init__(self, quiet_ms: float = 500):
+        self.quiet_ms = quiet_ms
+        self._last_value: Any = None
+        self._changed_at: Optional[float] = None
+
+    def accepts(self, value: Any) -> bool:
+        return True
+
+    def is_ready(self, value: Any, now: Optional[float] = None) -> bool:
+        now = time.monotonic() if now is None else now
+        if self._changed_at is None or value != self._last_value:
+            self._last_value = value
+            self._changed_at = now
+            return False
+        return self.accepts(value) and (now - self._changed_at) * 1000 >= self.quiet_ms
+
+class NetworkIdleStrategy(StableValueStrategy):
+    name = "network_idle"
+    script = "[document.readyState, performance.getEntriesByType('resource').length]"
+
+    def accepts(self, value: Any) -> bool:
+        return bool(value) and value[0] != "loading"
+
+class TextStabilityStrategy(StableValueStrategy):
+    name = "text_stability"
+    script = "document.body ? document.body.innerText.length : 0"
+
+    def accepts(self, value: Any) -> bool:
+        return bool(value)
+
+class SelectorStrategy(WaitStrategy):
+    name = "selector"
+
+    def __init__(self, selector: str):
+        self.selector = selector
+        self.script = f"document.querySelector({json.dumps(selector)}) !== null"
+
+    def is_ready(self, value: Any, now: Optional[float] = None) -> bool:
+        return value is True
+
+WAIT_STRATEGIES: Dict[str, Type[WaitStrategy]] = {
+    strategy.name: strategy
+    for strategy in (LoadStrategy, DomContentLoadedStrategy, NetworkIdleStrategy, TextStabilityStrategy, SelectorStrategy)
+}
+
+def create_wait_strategy(name: str, **options: Any) -> WaitStrategy:
+    try:
+        strategy = WAIT_STRATEGIES[name]
+    except KeyError:
+        raise ValueError(f"Unknown wait strategy '{name}', expected one of {sorted(WAIT_STRATEGIES)}")
+    try:
+        return strategy(**options)
+    except TypeError:
+        raise ValueError(f"Invalid options {sorted(options)} for wait strategy '{name}'")
@@ -38,4 +38,40 @@ class TestBrowserHandler:
         assert "Error" in formatted
         
         formatted = handler.format_result({})
-        assert "No content retrieved" in formatted 
\ No newline at end of file
+        assert "No content retrieved" in formatted 
+
+    @pytest.mark.asyncio
+    async def test_handle_multiple_urls(self, mock_agent):
+        handler = BrowserHandler(mock_agent)
+        pages = [
+            {"url": "https://b.com", "content": "B content"},
+            {"url": "https://a.com", "error": "Page load timeout"}
+        ]
+
+        async def browse_many(urls):
+            assert urls == ["https://a.com", "https://b.com"]
+            for page in pages:
+                yield page
+
+        mock_agent.browse_many = browse_many
+
+        result = await handler.handle("browser https://a.com https://b.com")
+        assert result == pages
+        mock_agent.get_page_content.assert_not_called()
+
+        formatted = handler.format_result(result)
+        assert "Content from https://b.com" in formatted
+        assert "Error from https://a.com: Page load timeout" in formatted
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_pages_as_they_complete(self, mock_agent):
+        async def browse_many(urls):
+            yield {"url": "https://b.com", "content": "B content"}
+            yield {"url": "https://a.com", "error": "Page load timeout"}
+
+        mock_agent.browse_many = browse_many
+        handler = BrowserHandler(mock_agent)
+        chunks = [chunk async for chunk in handler.stream("browser https://a.com https://b.com")]
+        assert len(chunks) == 2
+        assert "Content from https://b.com" in chunks[0]
+        assert chunks[1] == "\nError from https://a.com: Page load timeout"
@@ -0,0 +1,38 @@
+import json
+import pytest
+from unittest.mock import Mock, AsyncMock
+from src.cli.handlers.crawl import CrawlHandler
+
+class TestCrawlHandler:
+    @pytest.fixture
+    def mock_agent(self):
+        agent = Mock()
+        agent.crawl = AsyncMock(return_value={"pages": [], "stats": {}})
+        return agent
+
+    def test_can_handle(self):
+        handler = CrawlHandler(Mock())
+        assert handler.can_handle("crawl docs.python.org")
+        assert handler.can_handle("CRAWL: docs.python.org")
+        assert not handler.can_handle("crawler docs.python.org")
+
+    @pytest.mark.asyncio
+    async def test_handle_passes_url_and_page_limit(self, mock_agent):
+        handler = CrawlHandler(mock_agent)
+        await handler.handle("crawl https://docs.python.org/3/ 20")
+        mock_agent.crawl.assert_called_once_with(json.dumps({"url": "https://docs.python.org/3/", "max_pages": 20}))
+        assert "error" in await handler.handle("crawl docs.python.org many")
+        assert "error" in await handler.handle("crawl:")
+
+    def test_format_result(self, mock_agent):
+        handler = CrawlHandler(mock_agent)
+        formatted = handler.format_result({
+            "pages": [
+                {"url": "https://a.test/", "depth": 0, "title": "Home", "text_chars": 120},
+                {"url": "https://a.test/x", "depth": 1, "error": "HTTP 404"},
+            ],
+            "stats": {"seed": "https://a.test/", "pages": 1, "errors": 1, "elapsed_s": 0.5, "pages_per_s": 2.0, "sitemap_urls": 0},
+        })
+        assert "[0] https://a.test/ - Home (120 chars)" in formatted
+        assert "error: HTTP 404" in formatted
+        assert "2.0 pages/s" in formatted
@@ -45,4 +45,31 @@ class TestHttpHandler:
         formatted = handler.format_result(detailed_result)
         assert "Status Code: 200" in formatted
         assert "Content Type: application/json" in formatted
-        assert "test" in formatted 
\ No newline at end of file
+        assert "test" in formatted 
+    
+    @pytest.mark.asyncio
+    async def test_handle_passes_specs_and_full_urls_through(self, mock_agent):
+        handler = HttpHandler(mock_agent)
+        await handler.handle('http [{"url": "a.test"}, {"url": "b.test"}]')
+        mock_agent.make_http_request.assert_called_with('[{"url": "a.test"}, {"url": "b.test"}]')
+        await handler.handle("http https://example.com/path")
+        mock_agent.make_http_request.assert_called_with("https://example.com/path")
+
+    def test_format_batch_result(self, mock_agent):
+        handler = HttpHandler(mock_agent)
+        formatted = handler.format_result([
+            {"url": "https://a.test", "method": "GET", "status_code": 200, "content_type": "text/plain", "data": "hello"},
+            {"url": "https://b.test", "error": "timeout"},
+        ])
+        assert "GET https://a.test" in formatted
+        assert "hello" in formatted
+        assert "Error from https://b.test: timeout" in formatted
+
+    def test_format_projection_result(self, mock_agent):
+        handler = HttpHandler(mock_agent)
+        formatted = handler.format_result({
+            "url": "https://api.test/items", "method": "GET", "status_code": 200, "content_type": "application/json",
+            "data": {"select": "items[*].id", "result": [1, 2], "rows": 2, "total_rows": 500,
+                     "json_chars": 40000, "result_chars": 5, "reduction_ratio": 8000.0}
+        })
+        assert "Projection items[*].id: 2 of 500 rows, 5 of 40000 characters" in formatted
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 from src.cli.main import CLI
@@ -26,4 +27,29 @@ async def test_process_command_help(cli):
 async def test_process_command_chat(cli, mock_agent):
     result = await cli.process_command("hello")
     mock_agent.process_message.assert_called_once_with("hello")
-    assert result == "test response"
\ No newline at end of file
+    assert result == "test response"
+
+@pytest.mark.asyncio
+async def test_stream_command_times_first_chunk_separately(cli):
+    async def browse_many(urls):
+        for url in urls:
+            await asyncio.sleep(0.05)
+            yield {"url": url, "content": f"page {url}"}
+
+    cli.agent.browse_many = browse_many
+    cli.handlers["browser"].agent = cli.agent
+    chunks = []
+    async for chunk in cli.stream_command("browser a.test b.test c.test"):
+        chunks.append(chunk)
+        if len(chunks) == 1:
+            assert cli.last_timing is None
+    assert [chunk.split("\n")[1] for chunk in chunks] == ["Content from a.test:", "Content from b.test:", "Content from c.test:"]
+    timing = cli.last_timing
+    assert timing["chunks"] == 3
+    assert 40 <= timing["first_result_ms"] < timing["total_ms"]
+    assert timing["total_ms"] >= 140
+
+@pytest.mark.asyncio
+async def test_stream_command_falls_back_to_a_single_chunk(cli, mock_agent):
+    assert [chunk async for chunk in cli.stream_command("hello")] == ["test response"]
+    assert cli.last_timing["chunks"] == 1
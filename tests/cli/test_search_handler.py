@@ -43,4 +43,22 @@ class TestSearchHandler:
         
         error_results = [{"error": "Search failed"}]
         formatted = handler.format_results(error_results)
-        assert formatted == "Error: Search failed" 
\ No newline at end of file
+        assert formatted == "Error: Search failed" 
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_results_per_query(self, mock_agent):
+        async def search_stream(queries):
+            for query in queries:
+                yield {"title": query, "href": f"https://{query}.test"}
+
+        mock_agent.search_stream = search_stream
+        handler = SearchHandler(mock_agent)
+        chunks = [chunk async for chunk in handler.stream('search ["a", "b"]')]
+        assert chunks == ["Title: a\nLink: https://a.test\n", "Title: b\nLink: https://b.test\n"]
+        mock_agent.search.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stream_single_query_prints_all_results_at_once(self, mock_agent):
+        mock_agent.search.return_value = [{"title": "Test", "href": "http://test.com"}]
+        handler = SearchHandler(mock_agent)
+        assert [chunk async for chunk in handler.stream("search: python")] == ["Title: Test\nLink: http://test.com\n"]
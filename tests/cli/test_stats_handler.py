@@ -0,0 +1,28 @@
+import pytest
+from unittest.mock import Mock
+from src.cli.handlers.stats import StatsHandler
+
+class TestStatsHandler:
+    @pytest.fixture
+    def mock_agent(self):
+        agent = Mock()
+        agent.get_stats.return_value = {"browser": {"page_cache": {"hits": 2, "hit_rate": 0.5}}}
+        return agent
+
+    def test_can_handle(self):
+        handler = StatsHandler(Mock())
+        assert handler.can_handle("stats")
+        assert handler.can_handle("STATS")
+        assert not handler.can_handle("stats please")
+
+    @pytest.mark.asyncio
+    async def test_handle(self, mock_agent):
+        handler = StatsHandler(mock_agent)
+        result = await handler.handle("stats")
+        assert result["browser"]["page_cache"]["hits"] == 2
+
+    def test_format_result(self, mock_agent):
+        handler = StatsHandler(mock_agent)
+        formatted = handler.format_result(mock_agent.get_stats())
+        assert "Tool statistics" in formatted
+        assert '"hit_rate": 0.5' in formatted
@@ -119,4 +119,17 @@ async def test_openai_logging(agent, caplog):
     assert "Total: 100" in caplog.text
     assert "Completion: 50" in caplog.text
     assert "Prompt: 50" in caplog.text
-    assert "Finish Reason: stop" in caplog.text 
\ No newline at end of file
+    assert "Finish Reason: stop" in caplog.text 
+
+def test_get_stats_reports_browser_cache(agent):
+    stats = agent.get_stats()
+    assert stats["browser"]["page_cache"]["hits"] == 0
+    assert "inline" in stats["browser"]["extraction_pool"]
+
+def test_search_tool_uses_its_own_duckduckgo_settings_with_memory_as_a_supplement(agent):
+    search_tool = next(tool for tool in agent.tools if tool.name == "search")
+    web = search_tool.backends[0]
+    assert (web.ddgs, web.region, web.max_workers, web.scheduler) == (
+        search_tool.ddgs, search_tool.region, search_tool.max_workers, agent.scheduler
+    )
+    assert [backend.name for backend in search_tool.supplements] == ["memory"]
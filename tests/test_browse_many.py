@@ -0,0 +1,81 @@
+import time
+import threading
+import pytest
+from unittest.mock import patch, AsyncMock
+from src.tools.browser import BrowserTool
+
+class RenderTracker:
+    def __init__(self, delays):
+        self.delays = delays
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, url):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delays.get(url, 0.01))
+        with self.lock:
+            self.active -= 1
+        if "broken" in url:
+            return {"error": "Browser error: net::ERR_NAME_NOT_RESOLVED"}
+        html = f"<main>Page {url}</main>"
+        return {"url": url, "html": html, "html_chars": len(html), "timing": {"mode": "full", "load_ms": 1.0}}
+
+@pytest.fixture
+def browser_tool():
+    return BrowserTool(max_concurrency=2, extraction_pool=None)
+
+@pytest.mark.asyncio
+async def test_browse_many_respects_concurrency_limit(browser_tool):
+    tracker = RenderTracker({})
+    urls = [f"https://site{i}.com" for i in range(6)]
+
+    with patch.object(BrowserTool, "_render_page", tracker):
+        results = [result async for result in browser_tool.browse_many(urls)]
+
+    assert len(results) == 6
+    assert tracker.peak == 2
+    assert {r["url"] for r in results} == {f"{url}" for url in urls}
+
+@pytest.mark.asyncio
+async def test_browse_many_streams_in_completion_order(browser_tool):
+    tracker = RenderTracker({"https://slow.com": 0.2, "https://fast.com": 0.01})
+
+    with patch.object(BrowserTool, "_render_page", tracker):
+        results = [r["url"] async for r in browser_tool.browse_many(["https://slow.com", "https://fast.com"])]
+
+    assert results == ["https://fast.com", "https://slow.com"]
+
+@pytest.mark.asyncio
+async def test_browse_many_reports_partial_failures(browser_tool):
+    tracker = RenderTracker({})
+    run_manager = AsyncMock()
+
+    with patch.object(BrowserTool, "_render_page", tracker):
+        results = {
+            r["url"]: r async for r in browser_tool.browse_many(
+                ["https://ok.com", "broken.example", "https://ok.com"], run_manager=run_manager
+            )
+        }
+
+    assert len(results) == 2
+    assert results["https://ok.com"]["content"] == "Page https://ok.com"
+    assert "ERR_NAME_NOT_RESOLVED" in results["broken.example"]["error"]
+    assert run_manager.on_tool_end.await_count == 2
+
+@pytest.mark.asyncio
+async def test_browse_many_cancels_pending_on_early_exit(browser_tool):
+    tracker = RenderTracker({"https://slow.com": 0.3})
+
+    with patch.object(BrowserTool, "_render_page", tracker):
+        stream = browser_tool.browse_many(["https://fast.com", "https://slow.com"])
+        first = await stream.__anext__()
+        await stream.aclose()
+        later = [r["url"] async for r in browser_tool.browse_many(["https://next1.com", "https://next2.com"])]
+
+    assert first["url"] == "https://fast.com"
+    assert sorted(later) == ["https://next1.com", "https://next2.com"]
+    # The abandoned slow render cannot be interrupted, so it keeps its slot until its thread finishes.
+    assert tracker.peak == 2
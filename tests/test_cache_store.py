@@ -0,0 +1,25 @@
+from src.tools.cache_store import CacheStore
+
+def test_memory_lru_eviction():
+    store = CacheStore(max_entries=2)
+    store.set("a", {"v": 1})
+    store.set("b", {"v": 2})
+    store.get("a")
+    store.set("c", {"v": 3})
+    assert store.get("b") is None
+    assert store.get("a") == {"v": 1}
+    assert len(store) == 2
+
+def test_disk_tier_survives_new_instance(tmp_path):
+    CacheStore(disk_path=tmp_path).set("key", {"content": "persisted"})
+    store = CacheStore(disk_path=tmp_path)
+    assert store.get("key") == {"content": "persisted"}
+    store.delete("key")
+    assert CacheStore(disk_path=tmp_path).get("key") is None
+
+def test_unreadable_disk_entry_is_a_miss(tmp_path):
+    store = CacheStore(disk_path=tmp_path)
+    store.set("key", {"content": "x"})
+    store._memory.clear()
+    store._file_for("key").write_text("{not json")
+    assert store.get("key") is None
@@ -0,0 +1,196 @@
+import json
+import time
+import asyncio
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from src.tools.browser import BrowserTool
+from src.tools.cdp import CdpBrowser, CdpError
+from src.tools.cdp_page_load import fetch_patterns, render_page_cdp
+
+PAGE_HTML = '<html><body><main>Rendered over CDP</main></body></html>'
+
+class FakeChrome:
+    """Answers the DevTools commands used by the CDP page loader."""
+
+    def __init__(self, navigation_error=None, fire_load=True, navigation_delay=0):
+        self.navigation_error = navigation_error
+        self.fire_load = fire_load
+        self.navigation_delay = navigation_delay
+        self.commands = []
+        self.failed_requests = []
+        self.targets = 0
+
+    async def handle(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        async for message in ws:
+            data = json.loads(message.data)
+            self.commands.append(data['method'])
+            if data['method'] == 'Page.navigate' and self.navigation_delay:
+                await asyncio.sleep(self.navigation_delay)
+            result, events = self.answer(data)
+            await ws.send_str(json.dumps({'id': data['id'], **result}))
+            for method, params in events:
+                await ws.send_str(json.dumps({'method': method, 'params': params, 'sessionId': data.get('sessionId')}))
+        return ws
+
+    def answer(self, data):
+        method, params = data['method'], data['params']
+        if method == 'Target.createTarget':
+            self.targets += 1
+            return {'result': {'targetId': f'T{self.targets}'}}, []
+        if method == 'Target.attachToTarget':
+            return {'result': {'sessionId': f"S-{params['targetId']}"}}, []
+        if method == 'Page.navigate':
+            if self.navigation_error:
+                return {'result': {'frameId': 'F', 'errorText': self.navigation_error}}, []
+            events = []
+            if 'Fetch.enable' in self.commands:
+                events.append(('Fetch.requestPaused', {'requestId': 'R1', 'request': {'url': 'https://x.test/a.png'}}))
+            events.append(('Network.responseReceived', {
+                'type': 'Document', 'response': {'status': 200, 'headers': {'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'}}
+            }))
+            events.append(('Page.domContentEventFired', {'timestamp': 1}))
+            if self.fire_load:
+                events.append(('Page.loadEventFired', {'timestamp': 2}))
+            return {'result': {'frameId': 'F'}}, events
+        if method == 'Fetch.failRequest':
+            self.failed_requests.append(params['requestId'])
+        if method == 'Runtime.evaluate':
+            return {'result': {'result': {'type': 'object', 'value': self.evaluate(params['expression'])}}}, []
+        if method == 'Browser.getVersion':
+            return {'error': {'code': -32601, 'message': 'not supported'}}, []
+        return {'result': {}}, []
+
+    def evaluate(self, expression):
+        if 'outerHTML' in expression:
+            limit = expression.rsplit('(', 1)[1].rstrip(')')
+            html = PAGE_HTML if limit == 'Infinity' else PAGE_HTML[:int(limit)]
+            return {'length': len(PAGE_HTML), 'html': html}
+        if 'transferSize' in expression:
+            return {'bytes': 512, 'resources': 2}
+        return 'complete'
+
+async def start_fake_chrome(fake):
+    app = web.Application()
+    app.router.add_get('/devtools/browser/fake', fake.handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, '127.0.0.1', 0).start()
+    return runner, f'ws://127.0.0.1:{runner.addresses[0][1]}/devtools/browser/fake'
+
+@pytest_asyncio.fixture
+async def fake_chrome():
+    fake = FakeChrome()
+    runner, endpoint = await start_fake_chrome(fake)
+    fake.endpoint = endpoint
+    yield fake
+    await runner.cleanup()
+
+def test_fetch_patterns_map_resource_types():
+    patterns = fetch_patterns(['image', 'unknown'], ['*ads.test*', '*ads.test*'])
+    assert patterns == [{'resourceType': 'Image'}, {'urlPattern': '*ads.test*'}]
+
+@pytest.mark.asyncio
+async def test_render_page_cdp_loads_page_in_new_tab(fake_chrome):
+    browser = await CdpBrowser.connect(fake_chrome.endpoint)
+    try:
+        page = await render_page_cdp(browser, 'https://x.test', max_html_chars=20)
+    finally:
+        await browser.close()
+
+    assert page['html'] == PAGE_HTML[:20]
+    assert page['html_chars'] == len(PAGE_HTML)
+    assert page['timing']['driver'] == 'cdp'
+    assert page['timing']['bytes_transferred'] == 512
+    assert page['status'] == 200
+    assert page['headers'] == {'last-modified': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+    assert page['wait'] == {'strategy': 'load', 'waited_ms': page['wait']['waited_ms'], 'timed_out': False}
+    assert 'Fetch.enable' not in fake_chrome.commands
+    assert fake_chrome.commands[-1] == 'Target.closeTarget'
+
+@pytest.mark.asyncio
+async def test_render_page_cdp_blocks_intercepted_requests(fake_chrome):
+    browser = await CdpBrowser.connect(fake_chrome.endpoint)
+    try:
+        page = await render_page_cdp(browser, 'https://x.test', lean=True, resource_types=['image'])
+    finally:
+        await browser.close()
+
+    assert page['timing']['blocked_requests'] == 1
+    assert fake_chrome.failed_requests == ['R1']
+    assert page['wait']['strategy'] == 'domcontentloaded'
+
+@pytest.mark.asyncio
+async def test_render_page_cdp_times_out_with_partial_content():
+    fake = FakeChrome(fire_load=False)
+    runner, endpoint = await start_fake_chrome(fake)
+    browser = await CdpBrowser.connect(endpoint)
+    try:
+        page = await render_page_cdp(browser, 'https://x.test', timeout=0.2)
+    finally:
+        await browser.close()
+        await runner.cleanup()
+
+    assert page['partial'] is True
+    assert page['wait']['timed_out'] is True
+    assert page['html'] == PAGE_HTML
+
+@pytest.mark.asyncio
+async def test_render_page_cdp_navigation_and_readiness_share_one_deadline():
+    fake = FakeChrome(fire_load=False, navigation_delay=0.2)
+    runner, endpoint = await start_fake_chrome(fake)
+    browser = await CdpBrowser.connect(endpoint)
+    try:
+        started = time.perf_counter()
+        page = await render_page_cdp(browser, 'https://x.test', timeout=0.3)
+        elapsed = time.perf_counter() - started
+    finally:
+        await browser.close()
+        await runner.cleanup()
+
+    assert page['partial'] is True
+    assert page['wait']['waited_ms'] < 200
+    assert elapsed < 0.45
+
+@pytest.mark.asyncio
+async def test_render_page_cdp_reports_navigation_errors():
+    fake = FakeChrome(navigation_error='net::ERR_NAME_NOT_RESOLVED')
+    runner, endpoint = await start_fake_chrome(fake)
+    browser = await CdpBrowser.connect(endpoint)
+    try:
+        page = await render_page_cdp(browser, 'https://missing.test')
+    finally:
+        await browser.close()
+        await runner.cleanup()
+
+    assert page == {'error': 'Browser error: net::ERR_NAME_NOT_RESOLVED loading https://missing.test'}
+
+@pytest.mark.asyncio
+async def test_cdp_command_errors_raise(fake_chrome):
+    browser = await CdpBrowser.connect(fake_chrome.endpoint)
+    try:
+        with pytest.raises(CdpError, match='not supported'):
+            await browser.send('Browser.getVersion')
+    finally:
+        await browser.close()
+    with pytest.raises(CdpError, match='closed'):
+        await browser.send('Browser.getVersion')
+
+@pytest.mark.asyncio
+async def test_browser_tool_cdp_mode_shares_one_browser(fake_chrome):
+    tool = BrowserTool(driver_mode='cdp', cdp_endpoint=fake_chrome.endpoint, extraction_pool=None)
+    try:
+        results = [result async for result in tool.browse_many(['https://a.test', 'https://b.test'])]
+    finally:
+        await tool.aclose()
+
+    assert sorted(result['content'] for result in results) == ['Rendered over CDP'] * 2
+    assert fake_chrome.targets == 2
+
+@pytest.mark.asyncio
+async def test_browser_tool_cdp_mode_reports_connection_errors():
+    tool = BrowserTool(driver_mode='cdp', cdp_endpoint='ws://127.0.0.1:9/devtools/browser/none')
+    result = await tool.aget_page_content('https://a.test')
+    assert result['error'].startswith('Browser error: Cannot connect')
@@ -0,0 +1,124 @@
+import pytest
+from unittest.mock import patch
+from aiohttp import web
+from benchmarks.fixture_server import FixtureServer, SITE_PAGES
+from src.memory.vector_memory import VectorMemory
+from src.tools.crawl import CrawlTool
+from src.tools.crawler import SiteCrawler, parse_sitemap, sitemaps_from_robots
+from src.tools.http import HttpTool
+from src.tools.http_spec import RequestSpec
+
+def test_parse_sitemap_and_index():
+    urlset = '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"><url><loc> https://a.test/x </loc></url></urlset>'
+    index = '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"><sitemap><loc>https://a.test/s1.xml</loc></sitemap></sitemapindex>'
+    assert parse_sitemap(urlset) == (['https://a.test/x'], [])
+    assert parse_sitemap(index) == ([], ['https://a.test/s1.xml'])
+    assert parse_sitemap('not xml') == ([], [])
+    assert sitemaps_from_robots('User-agent: *\nSitemap: https://a.test/s.xml\nDisallow: /') == ['https://a.test/s.xml']
+
+@pytest.mark.asyncio
+async def test_crawl_stays_on_site_dedupes_and_uses_the_sitemap():
+    http = HttpTool()
+    async with FixtureServer() as server:
+        crawler = SiteCrawler(http, max_pages=100, max_depth=2)
+        pages = [page async for page in crawler.crawl(server.url('/site/0'))]
+        await http.aclose()
+    urls = {page['url'] for page in pages}
+    expected = {server.url(f'/site/{n}') for n in range(7)} | {server.url(f'/site/{SITE_PAGES - 1}')}
+    assert urls == expected
+    assert len(pages) == len(urls)
+    assert all('error' not in page and page['title'].startswith('Site page') for page in pages)
+    assert crawler.stats['sitemap_urls'] == 2
+    assert crawler.stats['out_of_scope'] > 0
+    assert crawler.stats['duplicates'] > 0
+    assert crawler.stats['pages_per_s'] > 0
+
+@pytest.mark.asyncio
+async def test_crawl_respects_page_limit_and_stores_pages_in_memory():
+    memory = VectorMemory()
+    http = HttpTool()
+    async with FixtureServer() as server:
+        crawler = SiteCrawler(http, memory=memory, max_pages=5, max_depth=5, use_sitemap=False)
+        pages = [page async for page in crawler.crawl(server.url('/site/0'))]
+        await http.aclose()
+    assert len(pages) == 5
+    stored = [output for output in memory._tool_outputs if output['tool'] == 'crawl']
+    assert len(stored) == 5
+    assert 'Documentation for topic' in stored[0]['output']
+
+@pytest.mark.asyncio
+async def test_crawl_tool_accepts_json_options():
+    http = HttpTool()
+    async with FixtureServer() as server:
+        tool = CrawlTool(http_tool=http, max_pages=10)
+        result = await tool.crawl(f'{{"url": "{server.url("/site/0")}", "max_pages": 3, "max_depth": 1}}')
+        await http.aclose()
+    assert len(result['pages']) == 3
+    assert {page['depth'] for page in result['pages']} <= {0, 1}
+    assert tool.get_stats()['last_crawl']['pages'] == 3
+    assert 'error' in await tool.crawl('{"max_pages": 3}')
+
+@pytest.mark.asyncio
+async def test_crawl_tool_validates_page_and_depth_limits():
+    tool = CrawlTool(max_pages=10, max_depth=2)
+    for options in ('"max_pages": 0', '"max_pages": "many"', '"max_depth": -1', '"max_depth": 1.5', '"max_pages": true'):
+        result = await tool.crawl(f'{{"url": "a.test", {options}}}')
+        assert result['error'].startswith('Invalid crawl request'), options
+
+    with patch.object(SiteCrawler, 'run', autospec=True, return_value={'pages': [], 'stats': {}}) as run:
+        await tool.crawl('{"url": "a.test", "max_pages": "4", "max_depth": "1"}')
+        await tool.crawl('{"url": "a.test", "max_pages": 50, "max_depth": 0}')
+    crawlers = [call.args[0] for call in run.call_args_list]
+    assert [(c.max_pages, c.max_depth) for c in crawlers] == [(4, 1), (10, 0)]
+
+class FakeHttp:
+    def __init__(self, pages):
+        self.pages = pages
+
+    async def request(self, spec):
+        if spec.url not in self.pages:
+            return {'status_code': 404, 'content_type': 'text/html', 'data': '', 'meta': {'bytes_read': 0}}
+        html = self.pages[spec.url]
+        return {'status_code': 200, 'content_type': 'text/html', 'data': html, 'meta': {'bytes_read': len(html)}}
+
+@pytest.mark.asyncio
+async def test_malformed_links_are_skipped_without_ending_the_crawl():
+    links = '<a href="http://localhost:PORT/">port</a><a href="https://[::1/">ipv6</a><a href="/next">next</a>'
+    crawler = SiteCrawler(FakeHttp({
+        'https://a.test/': f'<title>Home</title><main>{links}</main>',
+        'https://a.test/next': '<title>Next</title><main>Second page</main>',
+    }), max_depth=2, use_sitemap=False)
+    pages = [page async for page in crawler.crawl('https://a.test/')]
+    assert [page['title'] for page in pages] == ['Home', 'Next']
+    assert crawler.stats['out_of_scope'] == 1
+
+@pytest.mark.asyncio
+async def test_links_resolve_against_the_final_url_after_a_redirect():
+    async def moved(request):
+        raise web.HTTPFound('/guide/')
+
+    async def guide(request):
+        return web.Response(text='<title>Guide</title><main><a href="intro">Intro</a></main>', content_type='text/html')
+
+    async def intro(request):
+        return web.Response(text='<title>Intro</title><main>Start here</main>', content_type='text/html')
+
+    app = web.Application()
+    app.router.add_get('/guide', moved)
+    app.router.add_get('/guide/', guide)
+    app.router.add_get('/guide/intro', intro)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, '127.0.0.1', 0).start()
+    origin = f'http://127.0.0.1:{runner.addresses[0][1]}'
+    http = HttpTool()
+    try:
+        crawler = SiteCrawler(http, max_depth=1, use_sitemap=False)
+        pages = [page async for page in crawler.crawl(f'{origin}/guide')]
+        reduced = await http.request(RequestSpec(url=f'{origin}/guide'))
+    finally:
+        await http.aclose()
+        await runner.cleanup()
+    assert [(page['url'], page['title']) for page in pages] == [(f'{origin}/guide', 'Guide'), (f'{origin}/guide/intro', 'Intro')]
+    assert reduced['final_url'] == f'{origin}/guide/'
+    assert reduced['data']['links'] == [{'text': 'Intro', 'href': f'{origin}/guide/intro'}]
@@ -0,0 +1,68 @@
+import pytest
+from pathlib import Path
+from src.tools.extraction import extract_document, extract_text, summarize_html
+
+CORPUS = sorted((Path(__file__).parent / "fixtures" / "pages").glob("*.html"))
+
+@pytest.mark.parametrize("page", CORPUS, ids=lambda p: p.stem)
+def test_extract_text_matches_corpus(page):
+    expected = page.with_suffix(".txt").read_text(encoding="utf-8")
+    assert extract_text(page.read_text(encoding="utf-8")) == expected
+
+def test_extract_text_empty_input():
+    assert extract_text("") == ""
+
+def test_extract_text_keeps_unicode():
+    assert extract_text("<main>Café &euro;5</main>") == "Café €5"
+
+def test_extract_text_with_xml_declaration():
+    html = '<?xml version="1.0" encoding="utf-8"?><html><body><article>XHTML text</article></body></html>'
+    assert extract_text(html) == "XHTML text"
+
+def test_extract_text_picks_largest_content_div():
+    html = """
+    <div class="content">short</div>
+    <div class="article-body">the longest block of text</div>
+    <div class="CONTENT">medium text</div>
+    """
+    assert extract_text(html) == "the longest block of text"
+
+def test_extract_text_fallback_drops_noise_containers():
+    html = """
+    <div class="page">Visible text<div class="left-sidebar">Sidebar</div> continues</div>
+    <section class="nav-links">Links</section>
+    """
+    assert extract_text(html) == "Visible text continues"
+
+def test_extract_document_stops_at_budget():
+    html = "<main>" + "".join(f"<p>word{i} </p>\n" for i in range(5000)) + "</main>"
+    extraction = extract_document(html, max_chars=50)
+    assert extraction.truncated is True
+    assert len(extraction.text) <= 50
+    assert extract_text(html).startswith(extraction.text)
+    assert extraction.text_chars > 40000
+
+def test_extract_document_within_budget_is_not_truncated():
+    extraction = extract_document("<main>short   text</main>", max_chars=10)
+    assert extraction == ("short text", False, 12)
+
+def test_summarize_html_collects_title_and_unique_links():
+    html = (
+        '<html><head><title> Docs  Home </title></head><body>'
+        '<nav><a href="/guide">Guide</a><a href="#top">Top</a><a href="JavaScript:void(0)">x</a></nav>'
+        '<main><p>Read the <a href="/guide">guide</a> or <a href="https://other.test/">other</a>.</p></main>'
+        '</body></html>'
+    )
+    summary = summarize_html(html, base_url='https://docs.test/index.html')
+    assert summary.title == 'Docs Home'
+    assert summary.links == [
+        {'text': 'Guide', 'href': 'https://docs.test/guide'},
+        {'text': 'other', 'href': 'https://other.test/'},
+    ]
+    assert summary.extraction.text == 'Read the guide or other.'
+    assert summarize_html(html, max_links=1).links == [{'text': 'Guide', 'href': '/guide'}]
+
+def test_summarize_html_resolves_links_against_base_href():
+    html = '<html><head><base href="/docs/v2/"></head><body><a href="intro">Intro</a><a href="/top">Top</a></body></html>'
+    summary = summarize_html(html, base_url='https://docs.test/index.html')
+    assert [link['href'] for link in summary.links] == ['https://docs.test/docs/v2/intro', 'https://docs.test/top']
@@ -0,0 +1,84 @@
+import pytest
+from unittest.mock import MagicMock, patch
+from concurrent.futures.process import BrokenProcessPool
+from src.tools.browser import BrowserTool
+from src.tools.extraction import Extraction
+from src.tools.extraction_pool import ExtractionPool
+
+LARGE_PAGE = "<html><body><main>" + "<p>paragraph of text</p>\n" * 200 + "</main></body></html>"
+
+@pytest.fixture
+def pool():
+    pool = ExtractionPool(max_workers=1, inline_threshold=1024)
+    yield pool
+    pool.shutdown()
+
+@pytest.mark.asyncio
+async def test_small_pages_extracted_inline(pool):
+    extraction = await pool.extract("<main>Small page</main>")
+    assert extraction.text == "Small page"
+    assert pool.get_stats()["inline"] == 1
+    assert pool._executor is None
+
+@pytest.mark.asyncio
+async def test_large_pages_offloaded_to_process(pool):
+    extraction = await pool.extract(LARGE_PAGE, max_chars=100)
+    assert extraction.text.startswith("paragraph of text paragraph")
+    assert extraction.truncated is True
+    assert len(extraction.text) <= 100
+    stats = pool.get_stats()
+    assert stats["process"] == 1
+    assert stats["pending"] == 0
+
+@pytest.mark.asyncio
+async def test_saturated_pool_falls_back_to_thread(pool):
+    pool._pending = pool.max_pending
+    extraction = await pool.extract(LARGE_PAGE)
+    assert extraction.text.startswith("paragraph of text")
+    assert pool.get_stats()["thread_fallback"] == 1
+    assert pool._executor is None
+
+@pytest.mark.asyncio
+async def test_broken_pool_falls_back_and_resets(pool):
+    broken = MagicMock()
+    broken.submit.side_effect = BrokenProcessPool("worker died")
+    pool._executor = broken
+
+    extraction = await pool.extract(LARGE_PAGE)
+
+    assert extraction.text.startswith("paragraph of text")
+    stats = pool.get_stats()
+    assert stats["pool_errors"] == 1
+    assert stats["thread_fallback"] == 1
+    broken.shutdown.assert_called_once()
+    assert pool._executor is None
+
+@pytest.mark.asyncio
+async def test_browser_tool_uses_extraction_pool():
+    extraction_pool = MagicMock(spec=ExtractionPool)
+
+    async def extract(html, max_chars=None):
+        return Extraction("pooled text", False, 11)
+
+    extraction_pool.extract.side_effect = extract
+    tool = BrowserTool(extraction_pool=extraction_pool)
+    driver = MagicMock()
+    driver.page_source = LARGE_PAGE
+    driver.execute_script.side_effect = lambda script, *args: (
+        "complete" if "readyState" in script else {"length": len(LARGE_PAGE), "html": LARGE_PAGE[:args[0]]}
+    )
+
+    with patch('src.tools.page_load.webdriver.Chrome', return_value=driver):
+        result = await tool.aget_page_content('http://test.com')
+
+    extraction_pool.extract.assert_called_once_with(LARGE_PAGE, tool.max_text_chars)
+    assert result["content"] == "pooled text"
+    assert "extract_ms" in result["timing"]
+
+@pytest.mark.asyncio
+async def test_browser_aclose_shuts_down_the_extraction_pool(pool):
+    tool = BrowserTool(extraction_pool=pool)
+    await pool.extract(LARGE_PAGE)
+    assert pool._executor is not None
+    await tool.aclose()
+    assert pool._executor is None
@@ -0,0 +1,33 @@
+import pytest
+import aiohttp
+from benchmarks.fixture_server import FixtureServer
+from src.tools.http import HttpTool
+
+@pytest.mark.asyncio
+async def test_fixture_server_serves_saved_pages():
+    async with FixtureServer() as server:
+        tool = HttpTool()
+        result = await tool.make_request(server.url('/pages/blog_article.html'))
+        await tool.aclose()
+    assert result['title'] == 'Understanding Python Generators'
+
+@pytest.mark.asyncio
+async def test_fixture_server_redirect_chain_resolves():
+    async with FixtureServer() as server:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(server.url('/redirect?hops=3')) as response:
+                assert response.status == 200
+                assert len(response.history) == 4
+                assert response.url.path == '/pages/blog_article.html'
+
+@pytest.mark.asyncio
+async def test_fixture_server_generated_routes():
+    async with FixtureServer() as server:
+        tool = HttpTool(max_body_bytes=4 * 1024 * 1024)
+        data = await tool.make_request(server.url('/json?items=3'))
+        huge = await tool.make_request(server.url('/huge?mb=1'))
+        missing = await tool.make_request(server.url('/pages/..%2Frequirements.txt'))
+        await tool.aclose()
+    assert data['count'] == 3
+    assert huge['html_chars'] > 1024 * 1024
+    assert '404' in missing
@@ -0,0 +1,112 @@
+import time
+import asyncio
+import pytest
+from aioresponses import aioresponses
+from unittest.mock import patch
+from src.tools.browser import BrowserTool
+from src.tools.host_scheduler import HostScheduler
+from src.tools.http import HttpTool
+from src.tools.http_retry import RetryPolicy
+
+@pytest.mark.asyncio
+async def test_in_flight_is_capped_per_host_but_not_across_hosts():
+    scheduler = HostScheduler(rate=1000, burst=100, max_in_flight=2)
+    active = {'a.com': 0, 'b.com': 0}
+    peak = {'a.com': 0, 'b.com': 0}
+
+    async def call(host):
+        active[host] += 1
+        peak[host] = max(peak[host], active[host])
+        await asyncio.sleep(0.02)
+        active[host] -= 1
+
+    await asyncio.gather(*(scheduler.run(f'https://{host}/{i}', lambda host=host: call(host)) for i in range(6) for host in active))
+    assert peak == {'a.com': 2, 'b.com': 2}
+    assert scheduler.get_stats()['in_flight'] == 0
+
+@pytest.mark.asyncio
+async def test_token_bucket_spaces_requests_after_the_burst():
+    scheduler = HostScheduler(rate=20, burst=1)
+    started = time.monotonic()
+    for i in range(4):
+        async with scheduler.slot('https://a.com/'):
+            pass
+    assert time.monotonic() - started >= 0.14
+    stats = scheduler.get_stats()
+    assert stats['granted'] == 4
+    assert stats['queue_wait_ms']['max'] >= 40
+
+@pytest.mark.asyncio
+async def test_waiting_hosts_are_served_round_robin():
+    scheduler = HostScheduler(rate=1000, burst=100, max_total=1)
+    order = []
+
+    async def call(name):
+        order.append(name)
+        await asyncio.sleep(0.005)
+
+    tasks = [asyncio.create_task(scheduler.run(f'https://a.com/{i}', lambda i=i: call(f'a{i}'))) for i in range(4)]
+    await asyncio.sleep(0)
+    tasks.append(asyncio.create_task(scheduler.run('https://b.com/', lambda: call('b'))))
+    await asyncio.gather(*tasks)
+    assert order.index('b') <= 2
+
+@pytest.mark.asyncio
+async def test_throttling_pauses_and_slows_host_then_recovers():
+    scheduler = HostScheduler(rate=4, increase=1)
+    scheduler.feedback('a.com', 429, {'Retry-After': '0.1'})
+    host = scheduler.get_stats()['hosts']['a.com']
+    assert host['rate'] == 2 and host['throttled'] == 1
+
+    started = time.monotonic()
+    async with scheduler.slot('https://a.com/'):
+        pass
+    assert time.monotonic() - started >= 0.09
+
+    scheduler.feedback('a.com', 200)
+    scheduler.feedback('a.com', 200)
+    assert scheduler.get_stats()['hosts']['a.com']['rate'] == 4
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_a_slot():
+    scheduler = HostScheduler(rate=1000, burst=100, max_in_flight=1)
+    release = asyncio.Event()
+    holder = asyncio.create_task(scheduler.run('https://a.com/1', release.wait))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(scheduler.run('https://a.com/2', lambda: asyncio.sleep(0)))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    release.set()
+    await holder
+    async with scheduler.slot('https://a.com/3'):
+        assert scheduler.get_stats()['hosts']['a.com']['in_flight'] == 1
+    assert scheduler.get_stats()['in_flight'] == 0
+
+@pytest.mark.asyncio
+async def test_http_tool_reports_each_attempt_to_the_scheduler():
+    scheduler = HostScheduler()
+    tool = HttpTool(scheduler=scheduler, retry_policy=RetryPolicy(backoff_base=0.01))
+    with aioresponses() as m:
+        m.get('https://api.example.com/x', status=429, headers={'Retry-After': '0'})
+        m.get('https://api.example.com/x', payload={'ok': True})
+        result = await tool.make_request('https://api.example.com/x')
+    await tool.aclose()
+    assert result == {'ok': True}
+    host = scheduler.get_stats()['hosts']['api.example.com']
+    assert host['granted'] == 2 and host['throttled'] == 1
+
+@pytest.mark.asyncio
+async def test_browser_tool_reports_the_navigation_status_to_the_scheduler():
+    scheduler = HostScheduler(rate=4)
+    tool = BrowserTool(scheduler=scheduler, extraction_pool=None, single_flight=None)
+
+    def render(self, url):
+        return {
+            'url': url, 'status': 429, 'headers': {'retry-after': '0'},
+            'html': '<main>Slow down</main>', 'html_chars': 22, 'timing': {'mode': 'full', 'load_ms': 1.0}
+        }
+
+    with patch.object(BrowserTool, '_render_page', render):
+        await tool.aget_page_content('https://a.com/')
+    host = scheduler.get_stats()['hosts']['a.com']
+    assert host['throttled'] == 1 and host['rate'] == 2
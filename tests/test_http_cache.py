@@ -0,0 +1,132 @@
+import time
+import pytest
+import aiohttp
+from email.utils import formatdate
+from aioresponses import aioresponses
+from yarl import URL
+from src.tools.http import HttpTool
+from src.tools.http_cache import HttpCache, parse_cache_control
+from src.tools.http_stream import HttpResponse
+
+API = 'https://api.example.com/items'
+
+def entry(headers, status=200, age=0):
+    return {'status': status, 'headers': headers, 'body': '', 'stored_at': time.time() - age, 'vary': {}}
+
+def sent_headers(mocked, url, index):
+    return mocked.requests[('GET', URL(url))][index].kwargs['headers']
+
+def test_parse_cache_control():
+    assert parse_cache_control('public, Max-Age=60, no-cache="set-cookie"') == {
+        'public': None, 'max-age': '60', 'no-cache': 'set-cookie'
+    }
+
+def test_freshness_from_max_age_expires_and_heuristic():
+    cache = HttpCache()
+    now = time.time()
+    assert cache.is_fresh(entry({'cache-control': 'max-age=60'}, age=30))
+    assert not cache.is_fresh(entry({'cache-control': 'max-age=60', 'age': '40'}, age=30))
+    assert cache.is_fresh(entry({'date': formatdate(now), 'expires': formatdate(now + 120)}))
+    assert not cache.is_fresh(entry({'cache-control': 'max-age=60, no-cache'}))
+    last_modified = {'date': formatdate(now), 'last-modified': formatdate(now - 10 * 86400)}
+    assert cache.freshness_lifetime(entry(last_modified)) == pytest.approx(86400, abs=1)
+    assert HttpCache(default_ttl=30).freshness_lifetime(entry({})) == 30
+
+def test_store_respects_no_store_and_vary_star():
+    cache = HttpCache()
+    assert not cache.store('k', {}, 200, {'Cache-Control': 'no-store, max-age=60'}, 'x')
+    assert not cache.store('k', {}, 200, {'Cache-Control': 'max-age=60', 'Vary': '*'}, 'x')
+    assert not cache.store('k', {}, 500, {'ETag': '"a"'}, 'x')
+    assert not cache.store('k', {}, 200, {}, 'x')
+    assert cache.store('k', {}, 200, {'ETag': '"a"'}, 'x')
+
+@pytest.mark.asyncio
+async def test_fresh_response_is_served_from_cache():
+    tool = HttpTool(http_cache=HttpCache())
+    with aioresponses() as m:
+        m.get(API, payload={'n': 1}, headers={'Cache-Control': 'max-age=60'})
+        assert await tool.make_request(API) == {'n': 1}
+        assert await tool.make_request(API) == {'n': 1}
+        assert len(m.requests[('GET', URL(API))]) == 1
+    await tool.aclose()
+    assert tool.get_stats()['http_cache']['hits'] == 1
+
+@pytest.mark.asyncio
+async def test_stale_response_is_revalidated_with_etag():
+    tool = HttpTool(http_cache=HttpCache())
+    with aioresponses() as m:
+        m.get(API, body='v1', headers={'Content-Type': 'text/plain', 'ETag': '"v1"', 'Cache-Control': 'no-cache'})
+        m.get(API, status=304, headers={'ETag': '"v1"'})
+        assert await tool.make_request(API) == 'v1'
+        assert await tool.make_request(API) == 'v1'
+        assert sent_headers(m, API, 1)['If-None-Match'] == '"v1"'
+    await tool.aclose()
+    stats = tool.get_stats()['http_cache']
+    assert stats['revalidated'] == 1
+    assert stats['misses'] == 1
+
+@pytest.mark.asyncio
+async def test_vary_keeps_separate_variants():
+    cache = HttpCache()
+
+    def fetcher(body):
+        async def fetch(headers):
+            return HttpResponse(200, {'Cache-Control': 'max-age=60', 'Vary': 'Accept-Language'}, body)
+        return fetch
+
+    await cache.fetch(API, fetcher('hello'), {'Accept-Language': 'en'})
+    await cache.fetch(API, fetcher('hallo'), {'Accept-Language': 'de'})
+    response, status = await cache.fetch(API, fetcher('unused'), {'Accept-Language': 'en'})
+    assert (response.body, status) == ('hello', 'hit')
+
+@pytest.mark.asyncio
+async def test_offline_mode_serves_stale_entries(tmp_path):
+    online = HttpTool(http_cache=HttpCache(disk_path=tmp_path))
+    with aioresponses() as m:
+        m.get(API, payload={'n': 1}, headers={'Cache-Control': 'max-age=0', 'ETag': '"a"'})
+        await online.make_request(API)
+
+    await online.aclose()
+    offline = HttpTool(http_cache=HttpCache(disk_path=tmp_path, offline=True))
+    with aioresponses():
+        assert await offline.make_request(API) == {'n': 1}
+        missing = await offline.make_request('https://api.example.com/other')
+    await offline.aclose()
+    assert 'offline' in missing['error']
+    assert offline.get_stats()['http_cache']['stale'] == 1
+
+@pytest.mark.asyncio
+async def test_network_error_falls_back_to_stale_entry():
+    tool = HttpTool(http_cache=HttpCache())
+    with aioresponses() as m:
+        m.get(API, body='cached', headers={'Content-Type': 'text/plain', 'ETag': '"a"', 'Cache-Control': 'max-age=0'})
+        m.get(API, exception=aiohttp.ClientConnectionError())
+        await tool.make_request(API)
+        assert await tool.make_request(API) == 'cached'
+    await tool.aclose()
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('cache_control', ['max-age=0, must-revalidate', 'no-cache'])
+async def test_network_error_is_raised_when_the_entry_must_be_revalidated(cache_control):
+    tool = HttpTool(http_cache=HttpCache())
+    with aioresponses() as m:
+        m.get(API, body='cached', headers={'Content-Type': 'text/plain', 'ETag': '"a"', 'Cache-Control': cache_control})
+        m.get(API, exception=aiohttp.ClientConnectionError())
+        await tool.make_request(API)
+        result = await tool.make_request(API)
+    await tool.aclose()
+    assert 'error' in result
+    assert tool.get_stats()['http_cache']['stale'] == 0
+
+@pytest.mark.asyncio
+async def test_cache_key_keeps_query_parameters_and_their_order():
+    tool = HttpTool(http_cache=HttpCache(default_ttl=60))
+    with aioresponses() as m:
+        m.get(f'{API}?b=1&a=2', body='first', headers={'Content-Type': 'text/plain'})
+        m.get(f'{API}?a=2&b=1', body='second', headers={'Content-Type': 'text/plain'})
+        m.get(f'{API}?utm_source=x', body='tracked', headers={'Content-Type': 'text/plain'})
+        m.get(API, body='plain', headers={'Content-Type': 'text/plain'})
+        bodies = [await tool.make_request(url) for url in (f'{API}?b=1&a=2', f'{API}?a=2&b=1', f'{API}?utm_source=x', API)]
+        assert await tool.make_request(f'{API}?b=1&a=2#top') == 'first'
+    await tool.aclose()
+    assert bodies == ['first', 'second', 'tracked', 'plain']
@@ -0,0 +1,126 @@
+import asyncio
+import pytest
+import aiohttp
+from aioresponses import aioresponses
+from src.tools.http import HttpTool
+from src.tools.http_retry import RetryPolicy, retry_after_seconds
+from src.tools.http_stream import HttpResponse
+
+def scripted(*outcomes):
+    calls = []
+
+    async def call():
+        outcome = outcomes[min(len(calls), len(outcomes) - 1)]
+        calls.append(outcome)
+        if isinstance(outcome, Exception):
+            raise outcome
+        if isinstance(outcome, float):
+            await asyncio.sleep(outcome)
+            return HttpResponse(200, {}, f'slept {outcome}')
+        return outcome
+
+    return call, calls
+
+def test_retry_after_seconds_parses_delay_and_date():
+    assert retry_after_seconds({'Retry-After': '3'}) == 3.0
+    assert retry_after_seconds({'retry-after': 'Wed, 21 Oct 2015 07:28:10 GMT'}, now=1445412480.0) == 10.0
+    assert retry_after_seconds({}) is None
+    assert retry_after_seconds({'Retry-After': 'soon'}) is None
+
+@pytest.mark.asyncio
+async def test_transient_failures_are_retried():
+    policy = RetryPolicy(backoff_base=0.001)
+    call, calls = scripted(aiohttp.ClientConnectionError('reset'), HttpResponse(503, {}, ''), HttpResponse(200, {}, 'ok'))
+    response = await policy.run('GET', call)
+    assert response.body == 'ok'
+    assert len(calls) == 3
+    assert policy.get_stats()['retries'] == 2
+
+@pytest.mark.asyncio
+async def test_last_response_is_returned_when_retries_run_out():
+    policy = RetryPolicy(attempts=2, backoff_base=0.001)
+    call, calls = scripted(HttpResponse(502, {}, 'bad gateway'))
+    response = await policy.run('GET', call)
+    assert response.status == 502
+    assert len(calls) == 2
+    assert policy.get_stats()['gave_up'] == 1
+
+@pytest.mark.asyncio
+async def test_retry_after_is_honoured_or_gives_up_when_too_long():
+    policy = RetryPolicy(max_retry_after=1)
+    call, calls = scripted(HttpResponse(429, {'Retry-After': '0'}, ''), HttpResponse(200, {}, 'ok'))
+    assert (await policy.run('GET', call)).status == 200
+
+    call, calls = scripted(HttpResponse(429, {'Retry-After': '120'}, ''))
+    assert (await policy.run('GET', call)).status == 429
+    assert len(calls) == 1
+
+@pytest.mark.asyncio
+async def test_non_idempotent_methods_are_not_retried():
+    policy = RetryPolicy(backoff_base=0.001)
+    call, calls = scripted(HttpResponse(503, {}, ''))
+    assert (await policy.run('POST', call)).status == 503
+    assert len(calls) == 1
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('error', [
+    aiohttp.InvalidURL('http://[::1'),
+    aiohttp.TooManyRedirects(None, ()),
+    ValueError('bad header'),
+])
+async def test_permanent_errors_are_not_retried(error):
+    policy = RetryPolicy(backoff_base=0.001)
+    call, calls = scripted(error)
+    with pytest.raises(type(error)):
+        await policy.run('GET', call)
+    assert len(calls) == 1
+    assert policy.get_stats()['retries'] == 0
+
+@pytest.mark.asyncio
+async def test_dropped_connections_and_truncated_bodies_are_retried():
+    policy = RetryPolicy(backoff_base=0.001)
+    call, calls = scripted(aiohttp.ServerDisconnectedError(), aiohttp.ClientPayloadError('truncated'), HttpResponse(200, {}, 'ok'))
+    assert (await policy.run('GET', call)).body == 'ok'
+    assert len(calls) == 3
+
+@pytest.mark.asyncio
+async def test_attempt_timeout_raises_client_timeout():
+    policy = RetryPolicy(attempts=1, attempt_timeout=0.01)
+    call, _ = scripted(1.0)
+    with pytest.raises(aiohttp.ServerTimeoutError):
+        await policy.run('GET', call)
+    assert policy.get_stats()['timeouts'] == 1
+
+@pytest.mark.asyncio
+async def test_request_timeout_replaces_the_attempt_timeout():
+    policy = RetryPolicy(attempts=1, attempt_timeout=0.01)
+    call, _ = scripted(0.05)
+    assert (await policy.run('GET', call, timeout=0.5)).body == 'slept 0.05'
+    with pytest.raises(aiohttp.ServerTimeoutError, match='0.02s'):
+        await RetryPolicy(attempts=1, attempt_timeout=5).run('GET', call, timeout=0.02)
+
+@pytest.mark.asyncio
+async def test_hedged_request_wins_over_slow_primary():
+    policy = RetryPolicy(hedge=True, hedge_min_samples=3)
+    for _ in range(3):
+        fast, _ = scripted(0.001)
+        await policy.run('GET', fast)
+
+    call, calls = scripted(1.0, 0.001)
+    response = await policy.run('GET', call)
+    assert response.body == 'slept 0.001'
+    stats = policy.get_stats()
+    assert stats['hedged'] == 1
+    assert stats['hedge_wins'] == 1
+    assert stats['hedge_delay_ms'] is not None
+
+@pytest.mark.asyncio
+async def test_http_tool_retries_server_errors():
+    tool = HttpTool(retry_policy=RetryPolicy(backoff_base=0.001))
+    url = 'https://flaky.example.com'
+    with aioresponses() as m:
+        m.get(url, status=503, body='busy')
+        m.get(url, status=200, payload={'ok': True})
+        assert await tool.make_request(url) == {'ok': True}
+    await tool.aclose()
+    assert tool.get_stats()['retries']['retries'] == 1
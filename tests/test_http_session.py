@@ -0,0 +1,49 @@
+import asyncio
+import pytest
+from benchmarks.fixture_server import FixtureServer
+from src.tools.http import HttpTool
+from src.tools.http_session import HttpSessionPool
+
+@pytest.mark.asyncio
+async def test_http_tool_reuses_pooled_connections():
+    tool = HttpTool()
+    async with FixtureServer() as server:
+        for _ in range(3):
+            data = await tool.make_request(server.url('/json?items=2'))
+            assert data['count'] == 2
+        stats = tool.get_stats()['session']
+        await tool.aclose()
+
+    assert stats['requests'] == 3
+    assert stats['connections_opened'] == 1
+    assert stats['connections_reused'] == 2
+    assert stats['reuse_rate'] == round(2 / 3, 3)
+    assert tool.get_stats()['session']['open'] is False
+
+@pytest.mark.asyncio
+async def test_session_pool_returns_same_session_until_closed():
+    pool = HttpSessionPool(limit_per_host=2)
+    first = await pool.session()
+    assert await pool.session() is first
+    assert first.connector.limit_per_host == 2
+
+    await pool.close()
+    assert first.closed
+    second = await pool.session()
+    assert second is not first
+    await pool.close()
+
+@pytest.mark.asyncio
+async def test_session_pool_context_manager_closes_session():
+    async with HttpSessionPool() as pool:
+        session = await pool.session()
+    assert session.closed
+
+def test_session_from_a_previous_event_loop_is_closed_when_replaced():
+    pool = HttpSessionPool()
+    first = asyncio.run(pool.session())
+    second = asyncio.run(pool.session())
+    assert first.closed
+    assert second is not first
+    asyncio.run(pool.close())
+    assert second.closed
@@ -0,0 +1,94 @@
+import json
+import pytest
+from aioresponses import aioresponses
+from pydantic import ValidationError
+from yarl import URL
+from src.tools.http import HttpTool
+from src.tools.http_spec import RequestSpec, parse_request_input
+
+API = 'https://api.example.com/items'
+
+def test_request_spec_defaults_and_validation():
+    spec = RequestSpec(url='api.example.com/items', method='post', json={'a': 1})
+    assert spec.url == API
+    assert spec.method == 'POST'
+    assert spec.json_body == {'a': 1}
+    with pytest.raises(ValidationError):
+        RequestSpec(url=API, method='BREW')
+    with pytest.raises(ValidationError):
+        RequestSpec(url=API, json={'a': 1}, form={'b': '2'})
+    with pytest.raises(ValidationError):
+        RequestSpec(url=API, body='unknown field')
+
+def test_full_url_merges_query():
+    spec = RequestSpec(url=API + '?page=1', query={'limit': 10, 'active': True})
+    assert URL(spec.full_url()).query == {'page': '1', 'limit': '10', 'active': 'true'}
+
+def test_parse_request_input_accepts_urls_objects_and_lists():
+    assert parse_request_input('example.com').url == 'https://example.com'
+    assert parse_request_input('{"url": "example.com", "method": "DELETE"}').method == 'DELETE'
+    batch = parse_request_input(json.dumps(['a.test', {'url': 'b.test', 'method': 'HEAD'}]))
+    assert [spec.url for spec in batch] == ['https://a.test', 'https://b.test']
+    with pytest.raises(ValueError):
+        parse_request_input('[42]')
+
+@pytest.mark.asyncio
+async def test_request_sends_method_headers_and_json_body():
+    tool = HttpTool()
+    with aioresponses() as m:
+        m.post(API + '?dry_run=true', status=201, payload={'id': 7})
+        result = await tool.request(RequestSpec(
+            url=API, method='POST', headers={'X-Token': 'abc'}, query={'dry_run': True}, json={'name': 'x'}, timeout=5
+        ))
+        sent = m.requests[('POST', URL(API + '?dry_run=true'))][0].kwargs
+    await tool.aclose()
+    assert result['status_code'] == 201
+    assert result['method'] == 'POST'
+    assert result['data'] == {'id': 7}
+    assert sent['json'] == {'name': 'x'}
+    assert sent['headers'] == {'X-Token': 'abc'}
+    assert sent['timeout'].total == 5
+
+@pytest.mark.asyncio
+async def test_post_is_not_retried():
+    tool = HttpTool()
+    with aioresponses() as m:
+        m.post(API, status=503, body='busy', headers={'Content-Type': 'text/plain'})
+        result = await tool.request(RequestSpec(url=API, method='POST', form={'a': '1'}))
+        assert len(m.requests[('POST', URL(API))]) == 1
+    await tool.aclose()
+    assert result['status_code'] == 503
+
+@pytest.mark.asyncio
+async def test_batch_returns_per_item_results_in_order():
+    tool = HttpTool(max_parallel=2)
+    batch = json.dumps([
+        {'url': 'https://a.example.com'},
+        {'url': 'https://b.example.com', 'method': 'PUT', 'json': {'v': 2}},
+        {'url': 'https://c.example.com'},
+    ])
+    with aioresponses() as m:
+        m.get('https://a.example.com', payload={'n': 'a'})
+        m.put('https://b.example.com', payload={'n': 'b'})
+        m.get('https://c.example.com', status=404, body='missing', headers={'Content-Type': 'text/plain'})
+        results = await tool._arun(batch)
+    await tool.aclose()
+    assert [r['data'] for r in results] == [{'n': 'a'}, {'n': 'b'}, 'missing']
+    assert [r['status_code'] for r in results] == [200, 200, 404]
+
+@pytest.mark.asyncio
+async def test_invalid_spec_returns_error():
+    result = await HttpTool()._arun('{"url": "a.test", "method": "BREW"}')
+    assert result['error'].startswith('Invalid request spec')
+
+@pytest.mark.asyncio
+async def test_invalid_batch_item_gets_an_error_and_the_rest_still_run():
+    tool = HttpTool()
+    batch = json.dumps([{'url': 'https://a.example.com'}, {'url': 'https://b.example.com', 'method': 'FETCH'}, 42])
+    with aioresponses() as m:
+        m.get('https://a.example.com', payload={'n': 'a'})
+        results = await tool.run_input(batch)
+    await tool.aclose()
+    assert results[0]['data'] == {'n': 'a'}
+    assert results[1]['error'].startswith('Invalid request spec')
+    assert results[2]['error'].startswith('Invalid request spec')
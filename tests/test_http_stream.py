@@ -0,0 +1,62 @@
+import pytest
+from aioresponses import aioresponses
+from benchmarks.fixture_server import FixtureServer
+from src.tools.http import HttpTool
+from src.tools.http_stream import is_binary
+
+URL = 'https://stream.example.com/data'
+
+def test_is_binary():
+    assert is_binary('image/png')
+    assert is_binary('application/pdf; qs=0.5')
+    assert not is_binary('application/json; charset=utf-8')
+    assert not is_binary(None)
+
+@pytest.mark.asyncio
+async def test_fetch_reports_read_metadata():
+    tool = HttpTool()
+    with aioresponses() as m:
+        m.get(URL, payload={'ok': True})
+        result = await tool.fetch(URL)
+    await tool.aclose()
+    assert result['status_code'] == 200
+    assert result['data'] == {'ok': True}
+    assert result['meta']['bytes_read'] == len('{"ok": true}')
+    assert result['meta']['truncated'] is False
+    assert result['meta']['elapsed_ms'] >= 0
+
+@pytest.mark.asyncio
+async def test_body_over_cap_is_truncated_on_a_character_boundary():
+    tool = HttpTool(max_body_bytes=5, chunk_size=2)
+    with aioresponses() as m:
+        m.get(URL, body='abéécdef'.encode('utf-8'), headers={'Content-Type': 'text/plain; charset=utf-8'})
+        result = await tool.fetch(URL)
+    await tool.aclose()
+    assert result['meta'] == {**result['meta'], 'bytes_read': 5, 'truncated': True}
+    assert result['data'] == 'abé\n[Response truncated at 5 bytes]'
+
+@pytest.mark.asyncio
+async def test_declared_charset_is_decoded():
+    tool = HttpTool()
+    with aioresponses() as m:
+        m.get(URL, body='café'.encode('latin-1'), headers={'Content-Type': 'text/plain; charset=latin-1'})
+        assert await tool.make_request(URL) == 'café'
+    await tool.aclose()
+
+@pytest.mark.asyncio
+async def test_binary_content_is_not_downloaded():
+    tool = HttpTool()
+    with aioresponses() as m:
+        m.get(URL, body=b'\x89PNG' * 100, headers={'Content-Type': 'image/png'})
+        result = await tool.make_request(URL)
+    await tool.aclose()
+    assert 'binary content (image/png' in result['error']
+
+@pytest.mark.asyncio
+async def test_large_body_stops_reading_at_cap():
+    tool = HttpTool(max_body_bytes=64 * 1024)
+    async with FixtureServer() as server:
+        result = await tool.fetch(server.url('/huge?mb=5'))
+        await tool.aclose()
+    assert result['meta']['bytes_read'] == 64 * 1024
+    assert result['meta']['truncated'] is True
@@ -0,0 +1,57 @@
+import asyncio
+import pytest
+import aiohttp
+from src.tools.http import HttpTool
+from src.tools.http_spec import RequestSpec
+from src.tools.http_transport import AiohttpTransport, HttpxTransport
+
+pytest.importorskip('h2')
+from benchmarks.h2_server import H2Server
+
+def test_default_transport_uses_the_session_pool():
+    tool = HttpTool()
+    assert isinstance(tool.transport, AiohttpTransport)
+    assert tool.transport.session_pool is tool.session_pool
+    assert tool.get_stats()['transport']['name'] == 'aiohttp'
+
+@pytest.mark.asyncio
+async def test_httpx_transport_multiplexes_over_one_http2_connection():
+    async with H2Server(delay_ms=20) as server:
+        tool = HttpTool(transport=HttpxTransport(http1=False), max_parallel=20)
+        try:
+            results = await tool.request_many([RequestSpec(url=server.url(f'/item/{i}')) for i in range(20)])
+        finally:
+            await tool.aclose()
+    assert [result['data'] for result in results] == [{'path': f'/item/{i}', 'protocol': 'HTTP/2'} for i in range(20)]
+    assert server.connections == {'HTTP/2': 1, 'HTTP/1.1': 0}
+    assert tool.get_stats()['transport']['http_versions'] == {'HTTP/2': 20}
+
+@pytest.mark.asyncio
+async def test_httpx_transport_falls_back_to_http1_for_cleartext_urls():
+    async with H2Server() as server:
+        tool = HttpTool(transport=HttpxTransport())
+        try:
+            result = await tool.fetch(server.url('/plain'))
+        finally:
+            await tool.aclose()
+    assert result['data']['protocol'] == 'HTTP/1.1'
+
+@pytest.mark.asyncio
+async def test_httpx_connection_errors_surface_like_aiohttp_ones():
+    transport = HttpxTransport(http2=False)
+    try:
+        with pytest.raises(aiohttp.ClientConnectionError):
+            await transport.request('GET', 'http://127.0.0.1:9/', {}, 1000, 1000)
+    finally:
+        await transport.close()
+    assert transport.get_stats()['errors'] == 1
+
+def test_httpx_client_from_a_previous_event_loop_is_closed_when_replaced():
+    transport = HttpxTransport()
+    first = asyncio.run(transport.client())
+    second = asyncio.run(transport.client())
+    try:
+        assert first is not second
+        assert first.is_closed and not second.is_closed
+    finally:
+        asyncio.run(transport.close())
@@ -1,11 +1,14 @@
 import pytest
+import pytest_asyncio
 import aiohttp
 from aioresponses import aioresponses
 from src.tools.http import HttpTool
 
-@pytest.fixture
-def http_tool():
-    return HttpTool()
+@pytest_asyncio.fixture
+async def http_tool():
+    tool = HttpTool()
+    yield tool
+    await tool.aclose()
 
 @pytest.mark.asyncio
 async def test_request_json_response(http_tool):
@@ -25,7 +28,18 @@ async def test_request_html_response(http_tool):
     with aioresponses() as m:
         m.get(test_url, status=200, body=test_html, headers={'Content-Type': 'text/html'})
         response = await http_tool._arun(test_url)
-        assert response == test_html
+        assert response["text"] == "Test content"
+        assert response["reduction_ratio"] == round(len(test_html) / len("Test content"), 1)
+
+@pytest.mark.asyncio
+async def test_request_raw_html_response(http_tool):
+    test_url = "https://test.example.com"
+    test_html = "<html><body>Test content</body></html>"
+    
+    with aioresponses() as m:
+        m.get(test_url, status=200, body=test_html, headers={'Content-Type': 'text/html'})
+        response = await http_tool._arun('{"url": "%s", "raw": true}' % test_url)
+        assert response["data"] == test_html
 
 @pytest.mark.asyncio
 async def test_request_text_response(http_tool):
@@ -0,0 +1,63 @@
+import json
+import pytest
+from aioresponses import aioresponses
+from src.tools.http import HttpTool
+from src.tools.http_spec import RequestSpec
+from src.tools.json_projection import ProjectionError, apply_projection, compile_projection, project_json
+
+DOC = {
+    'count': 3,
+    'odd key': True,
+    'items': [{'id': i, 'name': f'item-{i}', 'owner': {'login': f'user-{i}'}} for i in range(3)],
+}
+
+def project(expression):
+    return apply_projection(DOC, compile_projection(expression))
+
+def test_paths_indexes_and_slices():
+    assert project('$') == DOC
+    assert project('count') == 3
+    assert project('$.items[-1].owner.login') == 'user-2'
+    assert project('items[0:2].id') == [0, 1]
+    assert project('items[::2].id') == [0, 2]
+    assert project('["odd key"]') is True
+    assert project('items[7].id') is None
+
+def test_fields_on_lists_project_each_element():
+    assert project('items.name') == project('items[*].name') == ['item-0', 'item-1', 'item-2']
+    assert project('items[*].missing') == []
+
+def test_field_sets_with_aliases():
+    assert project('items[:1].{id, who: owner.login}') == [{'id': 0, 'who': 'user-0'}]
+    assert project('{count, first: items[0].name}') == {'count': 3, 'first': 'item-0'}
+
+@pytest.mark.parametrize('expression', ['items[', 'items[x]', 'a b', '{a.b: c}', 'items[::0]', '{}'])
+def test_invalid_expressions(expression):
+    with pytest.raises(ProjectionError):
+        compile_projection(expression)
+
+def test_project_json_limits_rows_and_reports_sizes():
+    projection = project_json(DOC, 'items[*].id', limit=2, source_chars=len(json.dumps(DOC)))
+    assert projection['result'] == [0, 1]
+    assert (projection['rows'], projection['total_rows']) == (2, 3)
+    assert projection['result_chars'] == len('[0,1]')
+    assert projection['reduction_ratio'] > 10
+
+@pytest.mark.asyncio
+async def test_http_tool_projects_json_from_a_spec():
+    tool = HttpTool()
+    records = {'items': [{'id': i, 'name': f'n{i}', 'blob': 'x' * 200} for i in range(1000)]}
+    with aioresponses() as m:
+        m.get('https://api.example.com/items', payload=records)
+        result = await tool.run_input('{"url": "api.example.com/items", "select": "items[*].{id, name}", "limit": 3}')
+    await tool.aclose()
+    assert result['data']['result'] == [{'id': 0, 'name': 'n0'}, {'id': 1, 'name': 'n1'}, {'id': 2, 'name': 'n2'}]
+    assert result['data']['total_rows'] == 1000
+    assert result['data']['json_chars'] > 200_000
+
+@pytest.mark.asyncio
+async def test_invalid_select_is_rejected_before_sending():
+    result = await HttpTool().run_input('{"url": "api.example.com", "select": "items["}')
+    assert 'Invalid request spec' in result['error']
+    with pytest.raises(ValueError):
+        RequestSpec(url='api.example.com', limit=0)
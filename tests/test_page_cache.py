@@ -0,0 +1,95 @@
+import time
+import pytest
+from aioresponses import aioresponses
+from src.tools.host_scheduler import HostScheduler
+from src.tools.page_cache import PageCache
+
+URL = "https://example.com/article"
+RESULT = {"url": URL, "content": "Cached text", "timing": {"mode": "full"}}
+
+@pytest.fixture
+def cache():
+    return PageCache(default_ttl=60, domain_ttls={"news.example.com": 5, "nocache.org": 0})
+
+def test_ttl_for_matches_domain_suffix(cache):
+    assert cache.ttl_for("https://news.example.com/a") == 5
+    assert cache.ttl_for("https://live.news.example.com/a") == 5
+    assert cache.ttl_for("https://example.com/a") == 60
+
+@pytest.mark.asyncio
+async def test_fresh_entry_is_a_hit(cache):
+    with aioresponses() as m:
+        await cache.put(URL + "#top", RESULT, html_bytes=5000, headers={"ETag": '"v1"'})
+    assert not m.requests
+
+    result = await cache.get("https://EXAMPLE.com/article?utm_source=feed")
+
+    assert result["content"] == "Cached text"
+    assert result["cache"] == "hit"
+    stats = cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["bytes_saved"] == 5000
+    assert stats["hit_rate"] == 1.0
+
+@pytest.mark.asyncio
+async def test_expired_entry_revalidated_with_304(cache):
+    await cache.put(URL, RESULT, html_bytes=100, headers={"ETag": '"v1"'})
+    cache._store.get(URL)["expires_at"] = time.time() - 1
+
+    with aioresponses() as m:
+        m.head(URL, status=304)
+        result = await cache.get(URL)
+
+    assert result["cache"] == "revalidated"
+    assert cache.get_stats()["revalidated"] == 1
+    assert cache._store.get(URL)["expires_at"] > time.time()
+
+@pytest.mark.asyncio
+async def test_expired_entry_with_changed_etag_is_a_miss(cache):
+    await cache.put(URL, RESULT, headers={"etag": '"v1"'})
+    cache._store.get(URL)["expires_at"] = time.time() - 1
+
+    with aioresponses() as m:
+        m.head(URL, status=200, headers={"ETag": '"v2"'})
+        assert await cache.get(URL) is None
+
+    stats = cache.get_stats()
+    assert stats["expired"] == 1
+    assert stats["misses"] == 1
+
+@pytest.mark.asyncio
+async def test_zero_ttl_domains_are_not_cached(cache):
+    await cache.put("https://nocache.org/", RESULT)
+    assert await cache.get("https://nocache.org/") is None
+
+@pytest.mark.asyncio
+async def test_without_revalidation_no_head_requests():
+    cache = PageCache(revalidate=False)
+    with aioresponses():
+        await cache.put(URL, RESULT)
+    assert (await cache.get(URL))["content"] == "Cached text"
+
+@pytest.mark.asyncio
+async def test_entries_without_validators_expire_without_a_head_request(cache):
+    await cache.put(URL, RESULT)
+    cache._store.get(URL)["expires_at"] = time.time() - 1
+    with aioresponses() as m:
+        assert await cache.get(URL) is None
+    assert not m.requests
+
+@pytest.mark.asyncio
+async def test_revalidation_goes_through_the_host_scheduler():
+    scheduler = HostScheduler()
+    cache = PageCache(scheduler=scheduler)
+    await cache.put(URL, RESULT, headers={"Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"})
+    cache._store.get(URL)["expires_at"] = time.time() - 1
+    with aioresponses() as m:
+        m.head(URL, status=304)
+        assert (await cache.get(URL))["cache"] == "revalidated"
+    assert scheduler.get_stats()["hosts"]["example.com"]["granted"] == 1
+
+@pytest.mark.asyncio
+async def test_malformed_urls_are_cache_misses(cache):
+    await cache.put("http://example.com:port/", RESULT)
+    assert await cache.get("http://example.com:port/") is None
+    assert cache.get_stats()["misses"] == 1
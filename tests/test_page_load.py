@@ -0,0 +1,129 @@
+import re
+import json
+import pytest
+from unittest.mock import MagicMock, patch
+from src.tools.browser import BrowserTool
+from src.tools.page_cache import PageCache
+from src.tools.page_load import (
+    AD_TRACKER_URL_PATTERNS,
+    blocked_url_patterns,
+    build_chrome_options,
+    collect_transfer_stats,
+    page_load_strategy,
+)
+from src.tools.wait_strategies import create_wait_strategy
+
+def make_driver(ready_state='complete'):
+    driver = MagicMock()
+    driver.page_source = '<html><body><main>Lean content</main></body></html>'
+
+    def execute_script(script, *args):
+        if 'readyState' in script:
+            return ready_state
+        if 'outerHTML' in script:
+            return {'length': len(driver.page_source), 'html': driver.page_source[:args[0]]}
+        return {'bytes': 2048, 'resources': 3}
+
+    driver.execute_script.side_effect = execute_script
+    return driver
+
+def test_build_chrome_options_full():
+    options = build_chrome_options()
+    assert options.page_load_strategy == 'normal'
+    assert '--blink-settings=imagesEnabled=false' not in options.arguments
+
+def test_page_load_strategy_follows_the_wait_strategy():
+    assert page_load_strategy(create_wait_strategy('load')) == 'normal'
+    for name in ('domcontentloaded', 'network_idle', 'text_stability'):
+        assert build_chrome_options(load_strategy=page_load_strategy(create_wait_strategy(name))).page_load_strategy == 'eager'
+
+def test_build_chrome_options_lean():
+    options = build_chrome_options(lean=True)
+    assert options.page_load_strategy == 'eager'
+    assert '--blink-settings=imagesEnabled=false' in options.arguments
+    assert options.experimental_options['prefs']['profile.managed_default_content_settings.images'] == 2
+
+def test_blocked_url_patterns_expands_resource_types():
+    patterns = blocked_url_patterns(['font', 'unknown'], ['*ads.example.com*', '*.woff*'])
+    assert '*.woff2' in patterns and '*.woff2?*' in patterns
+    assert '*ads.example.com*' in patterns
+    assert patterns.count('*.woff*') == 1
+
+def blocks(url, pattern):
+    """Network.setBlockedURLs semantics: only '*' is a wildcard."""
+    return re.fullmatch('.*'.join(map(re.escape, pattern.split('*'))), url) is not None
+
+def test_resource_patterns_do_not_block_pages_whose_host_or_path_contains_an_extension():
+    patterns = blocked_url_patterns(['image', 'media', 'font', 'stylesheet'], [])
+    pages = ['https://www.gifts.com/', 'https://movies.com/new', 'https://oggi.it/', 'https://icons8.com/icons', 'https://cssdesignawards.com/?a=1']
+    assert not [page for page in pages if any(blocks(page, pattern) for pattern in patterns)]
+    assert blocks('https://cdn.test/logo.gif', '*.gif')
+    assert blocks('https://cdn.test/site.css?v=3', '*.css?*')
+
+def test_collect_transfer_stats_handles_script_errors():
+    driver = MagicMock()
+    driver.execute_script.side_effect = Exception('no performance API')
+    assert collect_transfer_stats(driver) == {'bytes_transferred': None, 'resource_count': None}
+
+def test_get_page_content_lean_mode_blocks_and_reports_timing():
+    tool = BrowserTool(lean_mode=True)
+    driver = make_driver(ready_state='interactive')
+
+    with patch('src.tools.page_load.webdriver.Chrome', return_value=driver) as chrome:
+        result = tool.get_page_content('http://test.com')
+
+    assert chrome.call_args.kwargs['options'].page_load_strategy == 'eager'
+    driver.execute_cdp_cmd.assert_any_call('Network.enable', {})
+    blocked = driver.execute_cdp_cmd.call_args_list[-1].args[1]['urls']
+    assert '*.png' in blocked and '*.png?*' in blocked
+    assert AD_TRACKER_URL_PATTERNS[0] in blocked
+    assert result['content'] == 'Lean content'
+    assert result['timing']['mode'] == 'lean'
+    assert result['timing']['bytes_transferred'] == 2048
+    assert result['timing']['total_ms'] >= result['timing']['load_ms']
+    driver.quit.assert_called_once()
+
+def test_get_page_content_full_mode_does_not_block():
+    tool = BrowserTool()
+    driver = make_driver()
+
+    with patch('src.tools.page_load.webdriver.Chrome', return_value=driver):
+        result = tool.get_page_content('http://test.com')
+
+    driver.execute_cdp_cmd.assert_not_called()
+    assert result['timing']['mode'] == 'full'
+
+def test_html_and_text_budgets_truncate_result():
+    tool = BrowserTool(max_html_chars=60, max_text_chars=10)
+    driver = make_driver()
+    driver.page_source = '<html><body><main>' + 'many words here ' * 50 + '</main></body></html>'
+
+    with patch('src.tools.page_load.webdriver.Chrome', return_value=driver):
+        result = tool.get_page_content('http://huge.test')
+
+    source_call = next(c for c in driver.execute_script.call_args_list if 'outerHTML' in c.args[0])
+    assert source_call.args[1] == 60
+    assert result['truncated'] is True
+    assert result['original_size']['html_chars'] == len(driver.page_source)
+    assert result['content'].startswith('many words')
+    assert '[Content truncated' in result['content']
+
+@pytest.mark.asyncio
+async def test_document_status_and_validators_come_from_the_render():
+    tool = BrowserTool(extraction_pool=None, page_cache=PageCache())
+    driver = make_driver()
+    response = {'url': 'http://test.com/', 'status': 200, 'headers': {'ETag': '"v1"', 'Content-Type': 'text/html'}}
+    driver.get_log.return_value = [
+        {'message': 'not json'},
+        {'message': json.dumps({'message': {'method': 'Network.responseReceived', 'params': {'type': 'Script', 'response': {'status': 404}}}})},
+        {'message': json.dumps({'message': {'method': 'Network.responseReceived', 'params': {'type': 'Document', 'response': response}}})},
+    ]
+
+    with patch('src.tools.page_load.webdriver.Chrome', return_value=driver), patch('aiohttp.ClientSession.head') as head:
+        result = await tool.aget_page_content('http://test.com/')
+
+    driver.get_log.assert_called_once_with('performance')
+    head.assert_not_called()
+    assert result['status'] == 200
+    assert 'headers' not in result
+    assert tool.page_cache._store.get('http://test.com/')['etag'] == '"v1"'
@@ -0,0 +1,127 @@
+import time
+import asyncio
+import pytest
+from unittest.mock import patch
+from src.tools.browser import BrowserTool
+from src.tools.page_cache import PageCache
+from src.tools.prefetch import Prefetcher
+from src.tools.search import SearchTool
+
+RESULTS = [{'title': f'Result {i}', 'href': f'https://site{i}.test/page', 'body': ''} for i in range(5)]
+
+class FakeFetch:
+    def __init__(self, delay=0.01, fail=()):
+        self.delay = delay
+        self.fail = fail
+        self.urls = []
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, url):
+        self.urls.append(url)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        if url in self.fail:
+            return {'error': 'Browser error'}
+        return {'url': url, 'content': 'ok'}
+
+@pytest.mark.asyncio
+async def test_schedule_fetches_top_n_unique_urls_within_the_concurrency_budget():
+    fetch = FakeFetch()
+    prefetcher = Prefetcher(fetch, top_n=3, max_in_flight=2)
+    urls = ['https://a.test/', 'https://A.test', 'mailto:x@y.z', 'https://b.test', 'https://c.test', 'https://d.test']
+    assert prefetcher.schedule(urls) == 3
+    assert prefetcher.schedule(urls) == 0
+    await asyncio.sleep(0.05)
+    assert sorted(fetch.urls) == ['https://a.test/', 'https://b.test/', 'https://c.test/']
+    assert fetch.peak == 2
+    assert prefetcher.get_stats()['completed'] == 3
+
+@pytest.mark.asyncio
+async def test_claims_count_hits_and_joins_once():
+    prefetcher = Prefetcher(FakeFetch(delay=0.05, fail=('https://c.test/',)))
+    prefetcher.schedule(['https://a.test', 'https://b.test', 'https://c.test'])
+    assert prefetcher.claim('https://b.test/') == 'joined'
+    await asyncio.sleep(0.2)
+    assert prefetcher.claim('https://a.test') == 'ready'
+    assert prefetcher.get_stats()['hits'] == 0
+    prefetcher.settle(served=True)
+    assert prefetcher.claim('https://a.test') is None
+    assert prefetcher.claim('https://b.test') is None
+    assert prefetcher.claim('https://c.test') is None
+    stats = prefetcher.get_stats()
+    assert (stats['hits'], stats['joined'], stats['failed']) == (1, 1, 1)
+    assert stats['hit_rate'] == round(2 / 3, 3)
+
+@pytest.mark.asyncio
+async def test_new_batch_cancels_unclaimed_prefetches_and_close_cancels_the_rest():
+    prefetcher = Prefetcher(FakeFetch(delay=1), top_n=2)
+    prefetcher.schedule(['https://a.test', 'https://b.test'])
+    prefetcher.schedule(['https://b.test', 'https://c.test'])
+    await asyncio.sleep(0.01)
+    assert prefetcher.get_stats()['cancelled'] == 1
+    await prefetcher.close()
+    stats = prefetcher.get_stats()
+    assert (stats['cancelled'], stats['in_flight'], stats['completed']) == (3, 0, 0)
+
+@pytest.mark.asyncio
+async def test_unclaimed_prefetches_expire_as_wasted():
+    prefetcher = Prefetcher(FakeFetch(delay=0), ttl=0)
+    prefetcher.schedule(['https://a.test'])
+    await asyncio.sleep(0.01)
+    assert prefetcher.get_stats()['wasted'] == 1
+    assert prefetcher.claim('https://a.test') is None
+
+@pytest.mark.asyncio
+async def test_search_results_are_prefetched_into_the_browser_page_cache():
+    renders = []
+
+    def render(url):
+        renders.append(url)
+        time.sleep(0.05)
+        html = f'<main>Page {url}</main>'
+        return {'url': url, 'html': html, 'html_chars': len(html), 'timing': {'mode': 'full', 'load_ms': 50.0}}
+
+    browser = BrowserTool(extraction_pool=None, page_cache=PageCache(revalidate=False))
+    browser.prefetcher = Prefetcher(browser.aget_page_content, top_n=2)
+    search = SearchTool(prefetcher=browser.prefetcher)
+    with patch.object(search.ddgs, 'text', return_value=RESULTS), patch.object(BrowserTool, '_render_page', side_effect=render):
+        await search._arun('python')
+        joined = await browser._arun('site1.test/page')
+        await asyncio.sleep(0.1)
+        started = time.perf_counter()
+        cached = await browser._arun('https://site0.test/page')
+        elapsed = time.perf_counter() - started
+
+    assert 'Page https://site1.test/page' in joined['content']
+    assert cached['cache'] == 'hit'
+    assert elapsed < 0.05
+    assert sorted(renders) == ['https://site0.test/page', 'https://site1.test/page']
+    stats = browser.prefetcher.get_stats()
+    assert (stats['hits'], stats['joined'], stats['hit_rate']) == (1, 1, 1.0)
+    await search.aclose()
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('page_cache, partial', [(None, False), (PageCache(revalidate=False), True)])
+async def test_prefetches_the_page_cache_cannot_serve_are_not_hits(page_cache, partial):
+    renders = []
+
+    def render(url):
+        renders.append(url)
+        html = f'<main>Page {url}</main>'
+        return {'url': url, 'html': html, 'html_chars': len(html), 'partial': partial, 'timing': {'mode': 'full', 'load_ms': 1.0}}
+
+    browser = BrowserTool(extraction_pool=None, page_cache=page_cache)
+    browser.prefetcher = Prefetcher(browser.aget_page_content, top_n=1)
+    with patch.object(BrowserTool, '_render_page', side_effect=render):
+        browser.prefetcher.schedule(['https://site0.test/page'])
+        await asyncio.sleep(0.1)
+        await browser._arun('https://site0.test/page')
+
+    assert renders == ['https://site0.test/page'] * 2
+    stats = browser.prefetcher.get_stats()
+    assert (stats['hits'], stats['wasted'], stats['hit_rate']) == (0, 1, 0.0)
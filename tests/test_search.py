@@ -0,0 +1,93 @@
+import json
+import time
+import asyncio
+import threading
+import pytest
+from unittest.mock import patch
+from src.tools.search import SearchTool, merge_results
+
+RESULTS = {
+    'python release': [{'title': 'Python 3.13', 'href': 'https://python.org/downloads/', 'body': 'a'},
+                       {'title': 'News', 'href': 'https://news.test/py', 'body': 'b'}],
+    'python version': [{'title': 'Downloads', 'href': 'https://Python.org/downloads/#latest', 'body': 'c'},
+                       {'title': 'Wiki', 'href': 'https://wiki.test/Python', 'body': 'd'}],
+}
+
+def test_merge_results_interleaves_ranks_and_dedupes_by_url():
+    merged = merge_results(RESULTS)
+    assert [result['title'] for result in merged] == ['Python 3.13', 'News', 'Wiki']
+    assert merged[0]['queries'] == ['python release', 'python version']
+
+@pytest.mark.asyncio
+async def test_search_runs_on_the_tool_executor_without_blocking_the_loop():
+    tool = SearchTool()
+    threads = []
+
+    def slow_text(query, **kwargs):
+        threads.append(threading.current_thread().name)
+        time.sleep(0.1)
+        return RESULTS[query]
+
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticking = asyncio.create_task(ticker())
+    with patch.object(tool.ddgs, 'text', side_effect=slow_text):
+        await tool.asearch('python release')
+    ticking.cancel()
+    await tool.aclose()
+    assert threads[0].startswith('search')
+    assert ticks >= 5
+
+@pytest.mark.asyncio
+async def test_search_many_merges_and_drops_queries_past_the_deadline():
+    tool = SearchTool()
+
+    def text(query, **kwargs):
+        if query == 'slow':
+            time.sleep(0.3)
+        return RESULTS.get(query, [])
+
+    with patch.object(tool.ddgs, 'text', side_effect=text):
+        started = time.perf_counter()
+        merged = await tool.search_many(['python release', 'python version', 'slow', 'python release'], deadline=0.15)
+        elapsed = time.perf_counter() - started
+    await tool.aclose()
+    assert elapsed < 0.3
+    assert len(merged) == 3
+    assert tool.get_stats()['timed_out'] == 1
+    assert tool.get_stats()['batch_queries'] == 3
+
+@pytest.mark.asyncio
+async def test_arun_accepts_a_json_list_of_queries():
+    tool = SearchTool()
+    with patch.object(tool.ddgs, 'text', side_effect=lambda query, **kwargs: RESULTS[query]):
+        merged = await tool._arun(json.dumps(list(RESULTS)))
+        single = await tool._arun('python release')
+    await tool.aclose()
+    assert len(merged) == 3
+    assert single == RESULTS['python release']
+
+@pytest.mark.asyncio
+async def test_search_stream_yields_each_query_as_it_finishes():
+    tool = SearchTool()
+
+    def text(query, **kwargs):
+        time.sleep(0.15 if query == 'python version' else 0.01)
+        return RESULTS[query]
+
+    with patch.object(tool.ddgs, 'text', side_effect=text):
+        started = time.perf_counter()
+        arrivals = []
+        async for result in tool.search_stream(list(RESULTS)):
+            arrivals.append((result['title'], result['queries'], time.perf_counter() - started))
+    await tool.aclose()
+    assert [(title, queries) for title, queries, _ in arrivals] == [
+        ('Python 3.13', ['python release']), ('News', ['python release']), ('Wiki', ['python version'])
+    ]
+    assert arrivals[0][2] < 0.1 <= arrivals[-1][2]
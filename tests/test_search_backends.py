@@ -0,0 +1,125 @@
+import time
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+from duckduckgo_search.exceptions import RatelimitException
+from src.memory.vector_memory import VectorMemory
+from src.tools.host_scheduler import HostScheduler
+from src.tools.prefetch import Prefetcher
+from src.tools.search import SearchTool
+from src.tools.search_backends import BackendRouter, DuckDuckGoBackend, MemoryIndexBackend, StubBackend
+from src.tools.search_cache import SearchCache
+
+def results(prefix, count):
+    return [{'title': f'{prefix} {i}', 'href': f'https://{prefix}.test/{i}', 'body': ''} for i in range(count)]
+
+@pytest.mark.asyncio
+async def test_first_sufficient_backend_wins_and_slower_ones_are_cancelled():
+    fast = StubBackend(results('fast', 5), delay=0.01, name='fast')
+    slow = StubBackend(results('slow', 5), delay=1, name='slow')
+    router = BackendRouter([slow, fast], budget=2)
+    started = time.perf_counter()
+    found = await router.search('q', max_results=5)
+    assert time.perf_counter() - started < 0.5
+    assert [result['title'] for result in found] == [f'fast {i}' for i in range(5)]
+    assert found[0]['backends'] == ['fast']
+    stats = router.get_stats()
+    assert stats['sufficient'] == 1
+    assert (stats['backends']['fast']['wins'], stats['backends']['slow']['cancelled']) == (1, 1)
+
+@pytest.mark.asyncio
+async def test_insufficient_results_are_merged_when_the_budget_runs_out():
+    few = StubBackend(results('few', 1) + results('shared', 1), name='few')
+    other = StubBackend(results('shared', 1) + results('other', 1), delay=0.02, name='other')
+    hung = StubBackend(results('hung', 5), delay=5, name='hung')
+    router = BackendRouter([few, other, hung], budget=0.1)
+    found = await router.search('q', max_results=5)
+    assert [result['href'] for result in found] == ['https://few.test/0', 'https://shared.test/0', 'https://other.test/0']
+    assert found[1]['backends'] == ['other', 'few']
+    stats = router.get_stats()
+    assert (stats['merged'], stats['over_budget'], stats['backends']['hung']['timeouts']) == (1, 1, 1)
+
+@pytest.mark.asyncio
+async def test_failing_backends_are_routed_around_and_probed():
+    broken = StubBackend(error=RuntimeError('down'), name='broken')
+    backup = StubBackend(results('backup', 3), delay=0.01, name='backup')
+    router = BackendRouter([broken, backup], probe_every=5)
+    for _ in range(4):
+        assert len(await router.search('q')) == 3
+    assert broken.calls == 2
+    assert router.get_stats()['backends']['broken']['error_rate'] > 0.5
+    await router.search('q')
+    assert broken.calls == 3
+    assert router.get_stats()['backends']['backup']['wins'] == 5
+
+@pytest.mark.asyncio
+async def test_fan_out_queries_only_the_cheapest_backends():
+    quick = StubBackend(results('quick', 3), name='quick')
+    sluggish = StubBackend(results('sluggish', 3), delay=0.05, name='sluggish')
+    router = BackendRouter([sluggish, quick], fan_out=1, probe_every=0)
+    router._health['sluggish'].observe(0.05, False, 1.0)
+    router._health['quick'].observe(0.001, False, 1.0)
+    await router.search('q')
+    assert (quick.calls, sluggish.calls) == (1, 0)
+
+@pytest.mark.asyncio
+async def test_memory_backend_returns_stored_pages():
+    memory = VectorMemory()
+    memory.add_tool_memory('crawl', 'https://docs.python.org/asyncio', 'asyncio docs\nasyncio is a library for concurrent code')
+    memory.add_tool_memory('search', 'asyncio tutorial', 'unrelated search output about asyncio')
+    memory.add_tool_memory('browser', 'https://cooking.test', 'Recipes\npasta and sauces')
+    found = await MemoryIndexBackend(memory).search('asyncio concurrent code', 5)
+    assert [(result['title'], result['href']) for result in found] == [('asyncio docs', 'https://docs.python.org/asyncio')]
+    assert found[0]['body'].startswith('asyncio is a library')
+
+@pytest.mark.asyncio
+async def test_duckduckgo_backend_reports_rate_limits_to_the_scheduler():
+    scheduler = HostScheduler()
+    backend = DuckDuckGoBackend(scheduler=scheduler)
+    with patch.object(backend.ddgs, 'text', side_effect=RatelimitException('202 Ratelimit')):
+        with pytest.raises(RatelimitException):
+            await backend.search('q', 5)
+    await backend.close()
+    assert scheduler.get_stats()['throttled'] == 1
+
+@pytest.mark.asyncio
+async def test_search_tool_fans_out_across_configured_backends():
+    tool = SearchTool(backends=[StubBackend(error=RuntimeError('down'), name='web'), StubBackend(results('local', 3), name='local')])
+    found = await tool.asearch('q')
+    await tool.aclose()
+    assert [result['href'] for result in found] == [f'https://local.test/{i}' for i in range(3)]
+    assert tool.get_stats()['backends']['backends']['web']['errors'] == 1
+
+@pytest.mark.asyncio
+async def test_duckduckgo_backend_keeps_its_scheduler_slot_until_a_cancelled_search_thread_ends():
+    scheduler = HostScheduler()
+    backend = DuckDuckGoBackend(scheduler=scheduler)
+    with patch.object(backend.ddgs, 'text', side_effect=lambda *args, **kwargs: time.sleep(0.2) or []):
+        task = asyncio.create_task(backend.search('q', 5))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        await asyncio.sleep(0.05)
+        assert scheduler.get_stats()['in_flight'] == 1
+        await asyncio.sleep(0.2)
+    assert task.cancelled()
+    assert scheduler.get_stats()['in_flight'] == 0
+    await backend.close()
+
+@pytest.mark.asyncio
+async def test_memory_supplements_web_results_without_being_cached_or_prefetched():
+    memory = VectorMemory()
+    memory.add_tool_memory('browser', 'https://web.test/0', 'web 0\nasyncio event loop guide')
+    memory.add_tool_memory('crawl', 'https://docs.test/asyncio', 'asyncio docs\nasyncio event loop reference')
+    web = StubBackend(results('web', 3), delay=0.02, name='web')
+    prefetcher = Prefetcher(AsyncMock(return_value={'content': 'ok'}), top_n=5)
+    tool = SearchTool(backends=[web], supplements=[MemoryIndexBackend(memory)], search_cache=SearchCache(), prefetcher=prefetcher)
+    found = await tool._arun('asyncio event loop')
+    again = await tool.asearch('asyncio event loop')
+    await prefetcher.close()
+    await tool.aclose()
+    assert [result['href'] for result in found] == [f'https://web.test/{i}' for i in range(3)] + ['https://docs.test/asyncio']
+    assert found[-1]['backends'] == ['memory']
+    assert again == found
+    assert web.calls == 1
+    assert prefetcher.get_stats()['scheduled'] == 3
+    assert tool.get_stats()['search_cache']['entries'] == 1
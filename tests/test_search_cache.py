@@ -0,0 +1,63 @@
+import asyncio
+import pytest
+from unittest.mock import patch
+from src.tools.search import SearchTool
+from src.tools.search_cache import SearchCache, normalize_query
+
+RESULTS = [{'title': 'Python 3.13', 'href': 'https://python.org/downloads/', 'body': 'latest'}]
+
+class FakeSearch:
+    def __init__(self, results=RESULTS):
+        self.results = results
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        return list(self.results)
+
+def test_normalize_query():
+    assert normalize_query('Latest  Python version?') == normalize_query('latest python version') == 'latest python version'
+    assert normalize_query('site:python.org "asyncio.run"!') == 'site:python.org "asyncio.run"'
+
+@pytest.mark.asyncio
+async def test_hits_are_keyed_on_normalized_query_and_options():
+    cache = SearchCache()
+    search = FakeSearch()
+    assert await cache.fetch('Latest Python version?', search) == (RESULTS, 'miss')
+    assert await cache.fetch('latest python version', search) == (RESULTS, 'hit')
+    assert (await cache.fetch('latest python version', search, max_results=10))[1] == 'miss'
+    assert (await cache.fetch('latest python version', search, region='de-de'))[1] == 'miss'
+    assert search.calls == 3
+    assert cache.get_stats()['hit_rate'] == 0.25
+
+@pytest.mark.asyncio
+async def test_stale_results_are_served_while_one_refresh_runs():
+    cache = SearchCache(ttl=0, stale_ttl=60)
+    await cache.fetch('q', FakeSearch())
+    fresh = FakeSearch([{'title': 'new', 'href': 'https://new.test'}])
+    first = await cache.fetch('q', fresh)
+    second = await cache.fetch('q', fresh)
+    assert first == second == (RESULTS, 'stale')
+    await asyncio.sleep(0)
+    assert fresh.calls == 1
+    assert cache.get_stats()['refreshes'] == 1
+    assert cache._store.get(cache.key('q', 5, 'wt-wt'))['results'][0]['title'] == 'new'
+
+@pytest.mark.asyncio
+async def test_empty_results_are_not_cached_and_entries_persist_to_disk(tmp_path):
+    cache = SearchCache(disk_path=tmp_path)
+    await cache.fetch('nothing', FakeSearch([]))
+    await cache.fetch('python', FakeSearch())
+    assert cache.get_stats()['entries'] == 1
+    reloaded = SearchCache(disk_path=tmp_path)
+    assert await reloaded.fetch('Python', FakeSearch()) == (RESULTS, 'hit')
+
+@pytest.mark.asyncio
+async def test_search_tool_serves_repeated_queries_from_cache():
+    tool = SearchTool(search_cache=SearchCache())
+    with patch.object(tool.ddgs, 'text', return_value=RESULTS) as text:
+        await tool.asearch('Latest Python version?')
+        assert await tool.asearch('latest python version') == RESULTS
+    await tool.aclose()
+    assert text.call_count == 1
+    assert tool.get_stats()['search_cache']['hits'] == 1
@@ -0,0 +1,125 @@
+import asyncio
+import pytest
+from unittest.mock import patch
+from aioresponses import aioresponses
+from src.tools.browser import BrowserTool
+from src.tools.http import HttpTool
+from src.tools.search import SearchTool
+from src.tools.single_flight import SingleFlight
+
+class SlowCall:
+    def __init__(self, result='done', delay=0.05):
+        self.result = result
+        self.delay = delay
+        self.started = 0
+        self.cancelled = False
+
+    async def __call__(self):
+        self.started += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution():
+    flights = SingleFlight()
+    call = SlowCall()
+    results = await asyncio.gather(*(flights.run('k', call) for _ in range(5)))
+    assert results == ['done'] * 5
+    assert call.started == 1
+    assert flights.get_stats() == {'calls': 5, 'executed': 1, 'coalesced': 4, 'abandoned': 0, 'in_flight': 0}
+
+@pytest.mark.asyncio
+async def test_sequential_calls_execute_again():
+    flights = SingleFlight()
+    call = SlowCall(delay=0)
+    await flights.run('k', call)
+    await flights.run('k', call)
+    assert call.started == 2
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_waiter():
+    flights = SingleFlight()
+    call = SlowCall(result=ValueError('boom'))
+    results = await asyncio.gather(flights.run('k', call), flights.run('k', call), return_exceptions=True)
+    assert [str(r) for r in results] == ['boom', 'boom']
+
+@pytest.mark.asyncio
+async def test_cancelling_one_waiter_keeps_the_shared_call_running():
+    flights = SingleFlight()
+    call = SlowCall()
+    first = asyncio.create_task(flights.run('k', call))
+    second = asyncio.create_task(flights.run('k', call))
+    await asyncio.sleep(0)
+    first.cancel()
+    assert await second == 'done'
+    assert not call.cancelled
+
+@pytest.mark.asyncio
+async def test_shared_call_is_cancelled_when_all_waiters_leave():
+    flights = SingleFlight()
+    call = SlowCall(delay=1)
+    waiters = [asyncio.create_task(flights.run('k', call)) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    for waiter in waiters:
+        waiter.cancel()
+    await asyncio.gather(*waiters, return_exceptions=True)
+    await asyncio.sleep(0)
+    assert call.cancelled
+    assert flights.get_stats()['abandoned'] == 1
+    assert flights.in_flight() == 0
+
+@pytest.mark.asyncio
+async def test_http_tool_coalesces_identical_requests():
+    tool = HttpTool()
+    url = 'https://api.example.com/items?b=2&a=1'
+    with aioresponses() as m:
+        m.get(url, payload={'ok': True})
+        results = await asyncio.gather(tool.fetch(url), tool.fetch(url))
+    await tool.aclose()
+    assert [result['data'] for result in results] == [{'ok': True}, {'ok': True}]
+    assert results[0] is not results[1]
+    assert results[0]['meta'] is not results[1]['meta']
+    assert tool.get_stats()['single_flight']['coalesced'] == 1
+
+@pytest.mark.asyncio
+async def test_http_tool_does_not_coalesce_requests_for_different_target_uris():
+    tool = HttpTool()
+    with aioresponses() as m:
+        m.get('https://api.example.com/items?b=2&a=1', payload={'order': 'ba'})
+        m.get('https://api.example.com/items?a=1&b=2', payload={'order': 'ab'})
+        results = await asyncio.gather(
+            tool.make_request('https://api.example.com/items?b=2&a=1'),
+            tool.make_request('https://api.example.com/items?a=1&b=2')
+        )
+    await tool.aclose()
+    assert results == [{'order': 'ba'}, {'order': 'ab'}]
+    assert tool.get_stats()['single_flight']['coalesced'] == 0
+
+@pytest.mark.asyncio
+async def test_browser_tool_coalesces_loads_of_the_same_page():
+    tool = BrowserTool(extraction_pool=None)
+    calls = []
+
+    def render(self, url):
+        calls.append(url)
+        return {'url': url, 'html': '<main>Once</main>', 'html_chars': 17, 'timing': {'mode': 'full', 'load_ms': 1.0}}
+
+    with patch.object(BrowserTool, '_render_page', render):
+        first, second = await asyncio.gather(tool.aget_page_content('https://a.test'), tool.aget_page_content('a.test'))
+    assert first['content'] == second['content'] == 'Once'
+    assert first is not second
+    assert len(calls) == 1
+
+@pytest.mark.asyncio
+async def test_search_tool_coalesces_normalized_queries():
+    tool = SearchTool()
+    with patch.object(tool.ddgs, 'text', return_value=[{'title': 't', 'body': 'b', 'href': 'h'}]) as text:
+        results = await asyncio.gather(tool.asearch('Python  asyncio'), tool.asearch('python asyncio'))
+    assert results[0] == results[1]
+    assert text.call_count == 1
@@ -0,0 +1,15 @@
+from src.tools.urls import normalize_url, host_of
+
+def test_normalize_url_canonicalizes():
+    url = "HTTPS://Example.COM:443/path?b=2&a=1&utm_source=x&fbclid=y#section"
+    assert normalize_url(url) == "https://example.com/path?a=1&b=2"
+
+def test_normalize_url_adds_scheme_and_path():
+    assert normalize_url("example.com") == "https://example.com/"
+    assert normalize_url("//example.com") == "https://example.com/"
+
+def test_normalize_url_keeps_non_default_port():
+    assert normalize_url("http://localhost:8080/a") == "http://localhost:8080/a"
+
+def test_host_of():
+    assert host_of("https://Docs.Python.org/3/") == "docs.python.org"
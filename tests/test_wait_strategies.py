@@ -0,0 +1,95 @@
+import time
+import pytest
+from unittest.mock import MagicMock, patch
+from src.tools.browser import BrowserTool
+from src.tools.page_load import wait_until_ready
+from src.tools.wait_strategies import (
+    NetworkIdleStrategy,
+    TextStabilityStrategy,
+    create_wait_strategy,
+)
+
+def test_load_and_domcontentloaded():
+    assert create_wait_strategy("load").is_ready("complete")
+    assert not create_wait_strategy("load").is_ready("interactive")
+    assert create_wait_strategy("domcontentloaded").is_ready("interactive")
+
+def test_text_stability_requires_quiet_period():
+    strategy = TextStabilityStrategy(quiet_ms=500)
+    assert not strategy.is_ready(100, now=0.0)
+    assert not strategy.is_ready(250, now=0.3)
+    assert not strategy.is_ready(250, now=0.6)
+    assert strategy.is_ready(250, now=0.8)
+
+def test_text_stability_ignores_empty_body():
+    strategy = TextStabilityStrategy(quiet_ms=0)
+    strategy.is_ready(0, now=0.0)
+    assert not strategy.is_ready(0, now=1.0)
+
+def test_network_idle_waits_for_parsed_document():
+    strategy = NetworkIdleStrategy(quiet_ms=100)
+    strategy.is_ready(["loading", 3], now=0.0)
+    assert not strategy.is_ready(["loading", 3], now=0.5)
+    strategy.is_ready(["interactive", 5], now=0.6)
+    assert strategy.is_ready(["interactive", 5], now=0.8)
+
+def test_selector_strategy_quotes_selector():
+    strategy = create_wait_strategy("selector", selector='div[data-id="x"]')
+    assert strategy.script == 'document.querySelector("div[data-id=\\"x\\"]") !== null'
+    assert strategy.is_ready(True)
+    assert not strategy.is_ready(False)
+
+def test_unknown_strategy():
+    with pytest.raises(ValueError, match="Unknown wait strategy"):
+        create_wait_strategy("forever")
+
+def test_wait_until_ready_records_strategy():
+    driver = MagicMock()
+    driver.execute_script.return_value = "complete"
+    info = wait_until_ready(driver, create_wait_strategy("load"), timeout=1)
+    assert info["strategy"] == "load"
+    assert info["timed_out"] is False
+    driver.execute_script.assert_called_with("return document.readyState")
+
+def test_timeout_returns_partial_content():
+    tool = BrowserTool(wait_strategy="selector", wait_options={"selector": "#never"}, wait_timeout=0.2)
+    driver = MagicMock()
+    driver.page_source = "<html><body><main>Already rendered text</main></body></html>"
+    driver.execute_script.side_effect = lambda script, *args: (
+        False if "querySelector" in script else {"length": len(driver.page_source), "html": driver.page_source}
+    )
+
+    with patch("src.tools.page_load.webdriver.Chrome", return_value=driver):
+        result = tool.get_page_content("http://slow.test")
+
+    assert result["content"] == "Already rendered text"
+    assert result["partial"] is True
+    assert result["wait"]["strategy"] == "selector"
+    assert result["wait"]["timed_out"] is True
+    assert result["wait"]["waited_ms"] >= 200
+    driver.set_page_load_timeout.assert_called_once_with(0.2)
+
+def test_navigation_and_readiness_share_one_deadline():
+    tool = BrowserTool(wait_strategy="selector", wait_options={"selector": "#never"}, wait_timeout=0.3)
+    driver = MagicMock()
+    driver.page_source = "<html><body><main>Slow page</main></body></html>"
+    driver.get.side_effect = lambda url: time.sleep(0.2)
+    driver.execute_script.side_effect = lambda script, *args: (
+        False if "querySelector" in script else {"length": len(driver.page_source), "html": driver.page_source}
+    )
+
+    with patch("src.tools.page_load.webdriver.Chrome", return_value=driver) as chrome:
+        started = time.perf_counter()
+        result = tool.get_page_content("http://slow.test")
+        elapsed = time.perf_counter() - started
+
+    assert result["partial"] is True
+    assert result["wait"]["waited_ms"] < 200
+    assert elapsed < 0.45
+    assert chrome.call_args.kwargs["options"].page_load_strategy == "eager"
+
+def test_wait_options_apply_only_to_the_chosen_strategy():
+    assert BrowserTool(wait_options={"selector": "#app"})._wait().name == "load"
+    assert BrowserTool(lean_mode=True, wait_options={"quiet_ms": 50})._wait().name == "domcontentloaded"
+    with pytest.raises(ValueError, match="Invalid options"):
+        BrowserTool(wait_strategy="selector", wait_options={"quiet_ms": 50})